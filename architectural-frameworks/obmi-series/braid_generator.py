@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+OBMI Braid Generator - Scalable Braid Populations
+=================================================
+
+Generates memory braid populations of any size from configurable identity
+templates and parameter distributions, for load-testing the relay system.
+The defaults reproduce initialize_memory_braids: the five identities with
+their base coherence and frequency, +/-0.1 coherence and +/-0.2 frequency
+jitter and tension drawn from [0.1, 0.4].
+
+Generation is chunked and array-based: iter_chunks() lazily yields
+BraidPopulation chunks (memory bounded by chunk_size) and generate()
+fills one preallocated population chunk by chunk, so a 10M-braid
+population never materializes per-braid Python objects. Random streams
+are keyed by fixed RNG_BLOCK-braid blocks rather than by chunk, so output
+is deterministic for a given seed whatever the chunk_size.
+
+Author: ValorGrid Solutions
+Date: October 2026
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+
+from relay_sim_py import BraidPopulation
+
+
+@dataclass(frozen=True)
+class IdentityTemplate:
+    """Base parameters for braids of one identity."""
+    name: str
+    coherence: float        # Base coherence before jitter
+    harmonic_freq: float    # Base harmonic frequency before jitter
+    weight: float = 1.0     # Relative share under weighted assignment
+
+
+@dataclass(frozen=True)
+class BraidDistribution:
+    """Jitter and tension distributions applied to the templates."""
+    coherence_jitter: float = 0.1       # Uniform half-width, or normal sigma
+    frequency_jitter: float = 0.2
+    jitter: str = "uniform"             # "uniform" or "normal"
+    tension_low: float = 0.1
+    tension_high: float = 0.4
+    clip_coherence: bool = True         # Keep coherence within [0,1]
+
+
+# Braids drawn from one random stream; chunking never changes the output
+RNG_BLOCK = 65536
+
+DEFAULT_TEMPLATES = (
+    IdentityTemplate("Identity", 0.85, 1.2),
+    IdentityTemplate("Reasoning", 0.78, 1.8),
+    IdentityTemplate("Memory", 0.82, 2.1),
+    IdentityTemplate("Response", 0.75, 1.5),
+    IdentityTemplate("Anchor", 0.88, 0.9)
+)
+
+
+class BraidGenerator:
+    """
+    Chunked generator of BraidPopulation instances.
+
+    assignment "round_robin" cycles through the templates in order (as
+    initialize_memory_braids does); "weighted" samples each braid's
+    identity with probability proportional to template weight.
+    """
+
+    def __init__(self, templates: Sequence[IdentityTemplate] = DEFAULT_TEMPLATES,
+                 distribution: BraidDistribution = BraidDistribution(),
+                 seed: Optional[int] = None, chunk_size: int = 1_000_000,
+                 assignment: str = "round_robin"):
+        if not templates:
+            raise ValueError("At least one identity template is required")
+        if distribution.jitter not in ("uniform", "normal"):
+            raise ValueError(f"Unknown jitter distribution: {distribution.jitter}")
+        if assignment not in ("round_robin", "weighted"):
+            raise ValueError(f"Unknown identity assignment: {assignment}")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self.templates = tuple(templates)
+        self.distribution = distribution
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.chunk_size = chunk_size
+        self.assignment = assignment
+
+        self.identities = [template.name for template in self.templates]
+        self._base_coherence = np.array([t.coherence for t in self.templates])
+        self._base_frequency = np.array([t.harmonic_freq for t in self.templates])
+        weights = np.array([t.weight for t in self.templates], dtype=np.float64)
+        self._probabilities = weights / weights.sum()
+
+    def _jitter(self, rng: np.random.Generator, scale: float, size: int) -> np.ndarray:
+        if self.distribution.jitter == "normal":
+            return rng.normal(0.0, scale, size)
+        return rng.uniform(-scale, scale, size)
+
+    def _fill(self, rng: np.random.Generator, first: int, identity_index: np.ndarray,
+              coherence: np.ndarray, harmonic_freq: np.ndarray,
+              tension_level: np.ndarray) -> None:
+        """Fill one chunk of output arrays for braids first..first+len."""
+        size = identity_index.size
+        dist = self.distribution
+        if self.assignment == "round_robin":
+            np.remainder(np.arange(first, first + size), len(self.templates), out=identity_index)
+        else:
+            identity_index[:] = rng.choice(len(self.templates), size, p=self._probabilities)
+
+        np.add(self._base_coherence[identity_index],
+               self._jitter(rng, dist.coherence_jitter, size), out=coherence)
+        if dist.clip_coherence:
+            np.clip(coherence, 0.0, 1.0, out=coherence)
+        np.add(self._base_frequency[identity_index],
+               self._jitter(rng, dist.frequency_jitter, size), out=harmonic_freq)
+        tension_level[:] = rng.uniform(dist.tension_low, dist.tension_high, size)
+
+    def _block_rngs(self, count: int) -> Iterator[tuple]:
+        blocks = -(-count // RNG_BLOCK)
+        for index in range(blocks):
+            # Keyed by block index, so repeated calls reproduce the same braids
+            child = np.random.SeedSequence(self.seed_sequence.entropy, spawn_key=(index,))
+            first = index * RNG_BLOCK
+            yield first, min(RNG_BLOCK, count - first), np.random.default_rng(child)
+
+    def _empty(self, size: int, last_sync: float) -> BraidPopulation:
+        return BraidPopulation(self.identities, np.zeros(size, dtype=np.int32),
+                               0.0, 0.0, 0.0, last_sync)
+
+    def _fill_into(self, population: BraidPopulation, offset: int,
+                   rng: np.random.Generator, first: int, size: int) -> None:
+        """Fill braids first..first+size into population[offset:offset+size]."""
+        part = slice(offset, offset + size)
+        self._fill(rng, first, population.identity_index[part], population.coherence[part],
+                   population.harmonic_freq[part], population.tension_level[part])
+
+    def iter_chunks(self, count: int, last_sync: float = 0.0) -> Iterator[BraidPopulation]:
+        """Lazily yield `count` braids as BraidPopulation chunks of chunk_size."""
+        block, used = None, 0
+        blocks = self._block_rngs(count)
+        for first in range(0, count, self.chunk_size):
+            chunk = self._empty(min(self.chunk_size, count - first), last_sync)
+            filled = 0
+            while filled < len(chunk):
+                if block is None or used == len(block):
+                    block_first, block_size, rng = next(blocks)
+                    block, used = self._empty(block_size, last_sync), 0
+                    self._fill_into(block, 0, rng, block_first, block_size)
+                take = min(len(chunk) - filled, len(block) - used)
+                for name in ('identity_index', 'coherence', 'harmonic_freq', 'tension_level'):
+                    getattr(chunk, name)[filled:filled + take] = \
+                        getattr(block, name)[used:used + take]
+                filled += take
+                used += take
+            yield chunk
+
+    def generate(self, count: int, last_sync: float = 0.0) -> BraidPopulation:
+        """Build one population of `count` braids, filled block by block."""
+        population = self._empty(count, last_sync)
+        for first, size, rng in self._block_rngs(count):
+            self._fill_into(population, first, rng, first, size)
+        return population
+
+
+def main():
+    """Generate (or stream) a large population and report throughput."""
+    parser = argparse.ArgumentParser(description="OBMI scalable braid generator")
+    parser.add_argument("--count", type=int, default=10_000_000)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stream", action="store_true",
+                        help="Iterate chunks instead of building one population")
+    args = parser.parse_args()
+
+    generator = BraidGenerator(seed=args.seed, chunk_size=args.chunk_size)
+    print("OBMI Braid Generator")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    if args.stream:
+        total, coherence_sum = 0, 0.0
+        for chunk in generator.iter_chunks(args.count):
+            total += len(chunk)
+            coherence_sum += float(chunk.coherence.sum())
+        mean_coherence, nbytes = coherence_sum / max(total, 1), None
+    else:
+        population = generator.generate(args.count)
+        mean_coherence, nbytes = float(population.coherence.mean()), population.nbytes
+    elapsed = time.perf_counter() - start
+
+    print(f"Braids: {args.count:,} in {elapsed:.2f}s ({args.count / elapsed:,.0f} braids/sec)")
+    print(f"Mean coherence: {mean_coherence:.4f}")
+    if nbytes is not None:
+        print(f"Population arrays: {nbytes / 1e6:.0f} MB ({nbytes / max(args.count, 1):.0f} B/braid)")
+
+
+if __name__ == "__main__":
+    main()
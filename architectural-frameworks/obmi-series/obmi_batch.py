@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+OBMI Streaming Batch Mode
+=========================
+
+Non-interactive evaluation of OBMI parameter records for data pipelines.
+Records are read from a file or stdin (NDJSON or CSV), evaluated in
+vectorized chunks with the obmi_kernels array kernels and written to
+stdout as a stream, so arbitrarily large inputs run in constant memory.
+
+Modes and their input fields:
+
+- drift:      r, F, theta, retention_rate
+- relay:      pre_retention
+- stock_flow: stock, flow_rate, feedback_strength
+- handoff:    coherence, tension_level, timestamp
+
+Each output record echoes the input fields followed by the results.
+Throughput is reported on stderr so it never mixes with the data stream.
+
+    cat params.ndjson | python obmi_core_py.py --batch drift
+    python relay_sim_py.py --batch handoff --input braids.csv --output-format csv
+
+Author: ValorGrid Solutions
+Date: October 2026
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+import numpy as np
+
+import obmi_kernels
+from obmi_core_py import OBMIHarmonicCore
+from relay_sim_py import RelayRecoverySystem
+
+
+def _evaluate_drift(columns: Dict[str, np.ndarray], core: OBMIHarmonicCore,
+                    relay: RelayRecoverySystem) -> Dict[str, np.ndarray]:
+    drift = core.calculate_harmonic_drift_batch(columns['r'], columns['F'], columns['theta'])
+    codes, masks = core.detect_phase1_drift_batch(drift, columns['retention_rate'])
+    return {'harmonic_drift': drift,
+            'alert_level': np.array(obmi_kernels.PHASE1_ALERT_LEVELS)[codes],
+            'risk_mask': masks}
+
+
+def _evaluate_relay(columns: Dict[str, np.ndarray], core: OBMIHarmonicCore,
+                    relay: RelayRecoverySystem) -> Dict[str, np.ndarray]:
+    result = core.relay_recovery_batch(columns['pre_retention'])
+    return {name: result[name] for name in result.dtype.names[1:]}
+
+
+def _evaluate_stock_flow(columns: Dict[str, np.ndarray], core: OBMIHarmonicCore,
+                         relay: RelayRecoverySystem) -> Dict[str, np.ndarray]:
+    result = core.systems_thinking_batch(
+        columns['stock'], columns['flow_rate'], columns['feedback_strength'])
+    return {('new_stock' if name == 'stock' else
+             'adjusted_flow' if name == 'flow_rate' else name): result[name]
+            for name in result.dtype.names if name != 'feedback_strength'}
+
+
+def _evaluate_handoff(columns: Dict[str, np.ndarray], core: OBMIHarmonicCore,
+                      relay: RelayRecoverySystem) -> Dict[str, np.ndarray]:
+    result = relay.relay_handoff_batch(
+        columns['coherence'], columns['tension_level'], columns['timestamp'])
+    return {name: result[name] for name in result.dtype.names[1:]}
+
+
+# mode -> (input fields, evaluator)
+MODES: Dict[str, Tuple[Tuple[str, ...], Callable]] = {
+    'drift': (('r', 'F', 'theta', 'retention_rate'), _evaluate_drift),
+    'relay': (('pre_retention',), _evaluate_relay),
+    'stock_flow': (('stock', 'flow_rate', 'feedback_strength'), _evaluate_stock_flow),
+    'handoff': (('coherence', 'tension_level', 'timestamp'), _evaluate_handoff)
+}
+
+
+def iter_record_chunks(stream: TextIO, fields: Tuple[str, ...], chunk_size: int = 65536,
+                       fmt: str = 'ndjson') -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Read parameter records in chunks.
+
+    Yields:
+        dict: field -> float64 array of at most chunk_size rows
+    """
+    def to_columns(rows) -> Dict[str, np.ndarray]:
+        matrix = np.array(rows, dtype=np.float64).reshape(len(rows), len(fields))
+        return {name: matrix[:, i] for i, name in enumerate(fields)}
+
+    if fmt == 'csv':
+        reader = csv.reader(stream)
+        header = next(reader, None)
+        if header is None:
+            return
+        missing = [name for name in fields if name not in header]
+        if missing:
+            raise ValueError(f"CSV input is missing fields: {', '.join(missing)}")
+        positions = [header.index(name) for name in fields]
+        rows = []
+        for record in reader:
+            if record:
+                rows.append([record[p] for p in positions])
+            if len(rows) == chunk_size:
+                yield to_columns(rows)
+                rows = []
+        if rows:
+            yield to_columns(rows)
+
+    elif fmt == 'ndjson':
+        lines = []
+        numbers = []
+        for number, line in enumerate(itertools.chain(stream, [None]), 1):
+            if line is not None and line.strip():
+                lines.append(line)
+                numbers.append(number)
+            if lines and (len(lines) == chunk_size or line is None):
+                # One json.loads call per chunk instead of one per record;
+                # a line that is not exactly one object changes the count
+                try:
+                    records = json.loads("[" + ",".join(lines) + "]")
+                    if len(records) != len(lines) or not all(
+                            isinstance(record, dict) for record in records):
+                        raise TypeError
+                    columns = to_columns([[record[name] for name in fields]
+                                          for record in records])
+                except (ValueError, KeyError, TypeError):
+                    raise _ndjson_error(lines, numbers, fields) from None
+                lines = []
+                numbers = []
+                yield columns
+    else:
+        raise ValueError(f"Unknown record format: {fmt}")
+
+
+def _ndjson_error(lines: List[str], numbers: List[int], fields: Tuple[str, ...]) -> ValueError:
+    """Re-parse a rejected chunk line by line and describe the first bad line."""
+    for number, line in zip(numbers, lines):
+        try:
+            record = json.loads(line)
+        except ValueError as error:
+            return ValueError(f"Line {number}: invalid JSON record ({error.msg})")
+        if not isinstance(record, dict):
+            return ValueError(f"Line {number}: expected a JSON object, "
+                              f"got {type(record).__name__}")
+        missing = [name for name in fields if name not in record]
+        if missing:
+            return ValueError(f"Line {number}: record is missing field(s) {', '.join(missing)}")
+        for name in fields:
+            try:
+                float(record[name])
+            except (TypeError, ValueError):
+                return ValueError(f"Line {number}: field {name} is not a number")
+    return ValueError(f"Lines {numbers[0]}-{numbers[-1]}: malformed records")
+
+
+def _json_strings(column: np.ndarray) -> List[str]:
+    """JSON text for every value of a column."""
+    if column.dtype.kind == 'f' and np.isfinite(column).all():
+        return list(map(float.__repr__, column.tolist()))   # Same text as json.dumps
+    return list(map(json.dumps, column.tolist()))
+
+
+def write_chunk(stream: TextIO, columns: Dict[str, np.ndarray], fmt: str = 'ndjson',
+                header: bool = False) -> None:
+    """Write one chunk of result columns as NDJSON lines or CSV rows."""
+    names = list(columns)
+    if fmt == 'csv':
+        writer = csv.writer(stream)
+        if header:
+            writer.writerow(names)
+        writer.writerows(zip(*(columns[name].tolist() for name in names)))
+    else:
+        template = "{" + ", ".join(f"{json.dumps(name)}: %s" for name in names) + "}\n"
+        encoded = [_json_strings(columns[name]) for name in names]
+        stream.write("".join(template % row for row in zip(*encoded)))
+
+
+def run_batch(mode: str, source: TextIO, sink: TextIO, fmt: str = 'ndjson',
+              output_format: Optional[str] = None, chunk_size: int = 65536,
+              core: Optional[OBMIHarmonicCore] = None,
+              relay: Optional[RelayRecoverySystem] = None) -> Dict[str, float]:
+    """
+    Stream records from source through one evaluation mode into sink.
+
+    Args:
+        mode: One of MODES
+        source: Text stream of NDJSON or CSV records
+        sink: Text stream for results
+        fmt: Input format, 'ndjson' or 'csv'
+        output_format: Output format (defaults to the input format)
+        chunk_size: Records evaluated per vectorized chunk
+        core: OBMIHarmonicCore providing tuning parameters
+        relay: RelayRecoverySystem providing dual-core parameters
+
+    Returns:
+        dict: records, chunks, elapsed_seconds and records_per_sec
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown batch mode: {mode}")
+    fields, evaluate = MODES[mode]
+    core = core or OBMIHarmonicCore()
+    relay = relay or RelayRecoverySystem()
+    output_format = output_format or fmt
+
+    records = chunks = 0
+    started = time.perf_counter()
+    for columns in iter_record_chunks(source, fields, chunk_size, fmt):
+        columns.update(evaluate(columns, core, relay))
+        write_chunk(sink, columns, output_format, header=chunks == 0)
+        records += len(columns[fields[0]])
+        chunks += 1
+    sink.flush()
+    elapsed = time.perf_counter() - started
+
+    return {
+        'records': records,
+        'chunks': chunks,
+        'elapsed_seconds': elapsed,
+        'records_per_sec': records / elapsed if elapsed > 0 else 0.0
+    }
+
+
+def add_batch_arguments(parser: argparse.ArgumentParser, default_mode: str) -> None:
+    """Add the shared --batch options to a CLI parser."""
+    parser.add_argument("--batch", nargs='?', const=default_mode, choices=sorted(MODES),
+                        help=f"Run non-interactively in MODE (default {default_mode})")
+    parser.add_argument("--input", default='-',
+                        help="Record file (default '-' reads stdin)")
+    parser.add_argument("--format", choices=("ndjson", "csv"),
+                        help="Input format (inferred from the file extension, else ndjson)")
+    parser.add_argument("--output-format", choices=("ndjson", "csv"))
+    parser.add_argument("--chunk-size", type=int, default=65536)
+
+
+def run_from_args(args: argparse.Namespace, core: Optional[OBMIHarmonicCore] = None,
+                  relay: Optional[RelayRecoverySystem] = None) -> Dict[str, float]:
+    """Run batch mode from parsed add_batch_arguments options."""
+    fmt = args.format
+    if fmt is None:
+        fmt = 'csv' if os.path.splitext(args.input)[1].lower() == '.csv' else 'ndjson'
+
+    if args.input == '-':
+        stats = run_batch(args.batch, sys.stdin, sys.stdout, fmt, args.output_format,
+                          args.chunk_size, core, relay)
+    else:
+        with open(args.input, newline='') as source:
+            stats = run_batch(args.batch, source, sys.stdout, fmt, args.output_format,
+                              args.chunk_size, core, relay)
+
+    print(f"{args.batch}: {stats['records']:,} records in {stats['elapsed_seconds']:.2f}s "
+          f"({stats['records_per_sec']:,.0f} records/sec)", file=sys.stderr)
+    return stats
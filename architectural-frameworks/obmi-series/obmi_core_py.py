@@ -12,9 +12,45 @@ Author: ValorGrid Solutions
 Date: September 2025
 """
 
+import argparse
 import math
 import time
-from typing import Dict, List, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import obmi_jit
+import obmi_kernels
+from obmi_history import HarmonicHistory
+
+
+@dataclass(slots=True)
+class Phase1Result:
+    """
+    Compact Phase 1 detection result.
+    
+    alert_code indexes obmi_kernels.PHASE1_ALERT_LEVELS and risk_mask holds
+    obmi_kernels.RISK_* bits. Pass one instance back as `out` to
+    detect_phase1_drift_compact to reuse it between calls; strings are only
+    built when the properties below are read.
+    """
+    alert_code: int = 0
+    risk_mask: int = 0
+    harmonic_drift: float = 0.0
+    retention_rate: float = 0.0
+    
+    @property
+    def alert_level(self) -> str:
+        return obmi_kernels.PHASE1_ALERT_LEVELS[self.alert_code]
+    
+    @property
+    def recommendation(self) -> str:
+        return obmi_kernels.PHASE1_RECOMMENDATIONS[self.alert_code]
+    
+    @property
+    def risk_factors(self) -> List[str]:
+        return obmi_kernels.risk_factor_names(self.risk_mask)
 
 
 class OBMIHarmonicCore:
@@ -25,16 +61,21 @@ class OBMIHarmonicCore:
     for AI system stability and cascade prevention.
     """
     
-    def __init__(self):
+    def __init__(self, raw_capacity: int = 600, minute_capacity: int = 1440,
+                 hour_capacity: int = 336, backend: Optional[str] = None):
         # Harmonic tuning parameters (production values are adaptive)
         self.drift_threshold = 0.15      # Alert threshold for harmonic drift
         self.harmonic_factor = 0.85      # Biomimetic uplift factor
         self.relay_efficiency = 1.345    # 34.5% retention uplift
         self.metacog_baseline = 0.95     # 95% metacognitive accuracy
         
-        # Memory braid tracking
-        self.memory_braids = []
-        self.harmonic_history = []
+        # Memory braid tracking: bounded raw ring plus minute/hour rollups
+        # per braid (defaults: 600 samples, 24 hours, 14 days)
+        self.harmonic_history = HarmonicHistory(raw_capacity, minute_capacity, hour_capacity)
+        self.memory_braids = self.harmonic_history.braids
+        
+        # Array kernel backend: numba-compiled when available (see obmi_jit)
+        self.backend = obmi_jit.backend_name(obmi_jit.select_backend(backend))
         
     def calculate_harmonic_drift(self, r: float, F: float, theta: float) -> float:
         """
@@ -151,6 +192,81 @@ class OBMIHarmonicCore:
             'feedback_strength': feedback_strength
         }
     
+    @property
+    def kernels(self):
+        """Kernel module for the selected backend (kept out of pickled state)."""
+        return obmi_jit.select_backend(self.backend)
+    
+    def calculate_harmonic_drift_batch(self, r, F, theta) -> np.ndarray:
+        """Array form of calculate_harmonic_drift; broadcasts over inputs."""
+        return self.kernels.harmonic_drift(r, F, theta)
+    
+    def harmony_memory_batch(self, input_retention) -> np.ndarray:
+        """Array form of harmony_memory using this core's harmonic factor."""
+        return obmi_kernels.harmony_memory(input_retention, self.harmonic_factor)
+    
+    def relay_recovery_batch(self, pre_retention) -> np.ndarray:
+        """Array form of relay_recovery (obmi_kernels.RELAY_RECOVERY_DTYPE rows)."""
+        return obmi_kernels.relay_recovery(pre_retention, self.relay_efficiency)
+    
+    def wrinkle_regrowth_batch(self, tension_level, conflict_intensity) -> np.ndarray:
+        """Array form of wrinkle_regrowth; broadcasts over inputs."""
+        return self.kernels.wrinkle_regrowth(tension_level, conflict_intensity)
+    
+    def systems_thinking_batch(self, stock, flow_rate, feedback_strength) -> np.ndarray:
+        """
+        Array form of systems_thinking_loop.
+        
+        Returns:
+            np.ndarray: Structured array (obmi_kernels.STOCK_FLOW_DTYPE) with
+            one row per braid instead of one dict per call
+        """
+        return self.kernels.systems_thinking_step(stock, flow_rate, feedback_strength)
+    
+    def integrate_systems_loop(self, stock, flow_rate, feedback_strength, steps: int,
+                               trajectory: bool = False,
+                               method: str = "analytic") -> Dict[str, np.ndarray]:
+        """
+        Advance many memory braids through many systems-thinking steps.
+        
+        See obmi_kernels.integrate_stock_flow; with trajectory=False only the
+        final state and summary metrics are kept, so long runs use O(N) memory.
+        """
+        return obmi_kernels.integrate_stock_flow(stock, flow_rate, feedback_strength,
+                                                 steps, trajectory, method)
+    
+    def record_braid_sample(self, braid_id: str, harmonic_drift: float,
+                            retention_rate: float, timestamp: Optional[float] = None) -> None:
+        """
+        Add a drift/retention sample to a braid's tiered history.
+        
+        Args:
+            braid_id: Memory braid identifier
+            harmonic_drift: Current harmonic drift measurement
+            retention_rate: Memory retention rate [0,1]
+            timestamp: Sample time in seconds (defaults to time.time())
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        self.harmonic_history.record(braid_id, timestamp, harmonic_drift, retention_rate)
+    
+    def braid_trend(self, braid_id: str, metric: str = 'drift', resolution: str = 'hour',
+                    start: float = float('-inf'), end: float = float('inf')) -> float:
+        """
+        Slope of a braid's drift or retention, in units per hour.
+        
+        Args:
+            braid_id: Memory braid identifier
+            metric: 'drift' or 'retention'
+            resolution: 'raw', 'minute', 'hour' or 'auto' history tier
+            start: Earliest timestamp to include
+            end: Latest timestamp to include
+        
+        Raises:
+            KeyError: If no harmonic state was ever recorded for braid_id
+        """
+        return self.harmonic_history.trend(braid_id, metric, resolution, start, end)
+    
     def detect_phase1_drift(self, harmonic_drift: float, 
                            retention_rate: float) -> Dict[str, any]:
         """
@@ -166,34 +282,67 @@ class OBMIHarmonicCore:
         Returns:
             dict: Phase 1 detection results and recommendations
         """
-        # Phase 1 detection thresholds
-        drift_alert = harmonic_drift > self.drift_threshold
-        retention_alert = retention_rate < 0.70
-        
-        # Combined risk assessment
-        risk_factors = []
-        if drift_alert:
-            risk_factors.append("harmonic_drift_exceeded")
-        if retention_alert:
-            risk_factors.append("retention_degradation")
-        
-        # Determine alert level
-        if len(risk_factors) >= 2:
-            alert_level = "CRITICAL"
-            recommendation = "Initiate Phoenix Protocol recovery"
-        elif len(risk_factors) == 1:
-            alert_level = "WARNING" 
-            recommendation = "Apply relay recovery enhancement"
-        else:
-            alert_level = "STABLE"
-            recommendation = "Continue harmonic monitoring"
+        return self.decode_phase1(self.detect_phase1_drift_compact(harmonic_drift, retention_rate))
+    
+    def detect_phase1_drift_compact(self, harmonic_drift: float, retention_rate: float,
+                                    out: Optional[Phase1Result] = None) -> Phase1Result:
+        """
+        detect_phase1_drift without building lists, strings or a dict.
+        
+        Takes Python or NumPy scalars; use detect_phase1_drift_batch for
+        arrays.
         
+        Args:
+            harmonic_drift: Current harmonic drift measurement
+            retention_rate: Memory retention rate [0,1]
+            out: Phase1Result to overwrite (a new one is created if omitted)
+            
+        Returns:
+            Phase1Result: alert code and risk-factor bitmask
+        """
+        # Phase 1 detection thresholds (int: np.bool_ + np.bool_ is a logical OR)
+        drift_alert = int(harmonic_drift > self.drift_threshold)
+        retention_alert = int(retention_rate < obmi_kernels.RETENTION_FLOOR)
+        
+        if out is None:
+            out = Phase1Result()
+        out.alert_code = drift_alert + retention_alert
+        out.risk_mask = (drift_alert * obmi_kernels.RISK_DRIFT_EXCEEDED
+                         | retention_alert * obmi_kernels.RISK_RETENTION_DEGRADED)
+        out.harmonic_drift = harmonic_drift
+        out.retention_rate = retention_rate
+        return out
+    
+    def detect_phase1_drift_batch(self, harmonic_drift, retention_rate,
+                                  codes_out: Optional[np.ndarray] = None,
+                                  masks_out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compact Phase 1 detection over arrays of drift/retention values.
+        
+        Args:
+            harmonic_drift: Harmonic drift measurements
+            retention_rate: Memory retention rates [0,1]
+            codes_out: Optional preallocated int8 array for alert codes
+            masks_out: Optional preallocated uint8 array for risk bitmasks
+            
+        Returns:
+            tuple: (alert codes, risk bitmasks); decode a row with
+            decode_phase1 or index obmi_kernels.PHASE1_ALERT_LEVELS
+        """
+        codes = obmi_kernels.phase1_alert_code(harmonic_drift, retention_rate,
+                                               self.drift_threshold, out=codes_out)
+        masks = obmi_kernels.phase1_risk_mask(harmonic_drift, retention_rate,
+                                              self.drift_threshold, out=masks_out)
+        return codes, masks
+    
+    def decode_phase1(self, result: Phase1Result) -> Dict[str, any]:
+        """Expand a compact result into detect_phase1_drift's dict."""
         return {
-            'alert_level': alert_level,
-            'risk_factors': risk_factors,
-            'recommendation': recommendation,
-            'harmonic_drift': harmonic_drift,
-            'retention_rate': retention_rate,
+            'alert_level': result.alert_level,
+            'risk_factors': result.risk_factors,
+            'recommendation': result.recommendation,
+            'harmonic_drift': result.harmonic_drift,
+            'retention_rate': result.retention_rate,
             'drift_threshold': self.drift_threshold,
             'metacog_accuracy': self.metacog_baseline
         }
@@ -245,8 +394,17 @@ class OBMIHarmonicCore:
 
 
 def main():
-    """Main demonstration function."""
+    """Main demonstration function (or streaming batch mode with --batch)."""
+    import obmi_batch  # Imports this module; deferred to avoid a cycle
+    
+    parser = argparse.ArgumentParser(description="OBMI Harmonic Memory demo")
+    obmi_batch.add_batch_arguments(parser, default_mode='drift')
+    args = parser.parse_args()
+    
     obmi = OBMIHarmonicCore()
+    if args.batch:
+        obmi_batch.run_from_args(args, core=obmi)
+        return
     
     print("Synoetic OS OBMI Harmonic Memory - Public Teaser")
     print("=" * 50)
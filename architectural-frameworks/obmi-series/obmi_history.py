@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+OBMI Tiered Harmonic History
+============================
+
+Bounded, tiered history for OBMI memory braids. Each braid keeps:
+
+- the most recent raw (timestamp, drift, retention) samples in a ring buffer
+- per-minute rollups (count, min/mean/max of drift and retention)
+- per-hour rollups built from the minute rollups
+
+Every tier is a fixed-size ring, so memory per braid is constant no matter
+how long the monitor runs, while drift and retention trends stay queryable
+over days at hour resolution. Timestamps are seconds and are assumed to be
+non-decreasing per braid.
+
+Author: ValorGrid Solutions
+Date: October 2026
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+
+RAW_DTYPE = np.dtype([
+    ('timestamp', np.float64),
+    ('drift', np.float64),
+    ('retention', np.float64)
+])
+
+ROLLUP_DTYPE = np.dtype([
+    ('bucket_start', np.float64),
+    ('count', np.int64),
+    ('drift_min', np.float64),
+    ('drift_mean', np.float64),
+    ('drift_max', np.float64),
+    ('retention_min', np.float64),
+    ('retention_mean', np.float64),
+    ('retention_max', np.float64)
+])
+
+
+class _Ring:
+    """Fixed-capacity ring of structured rows."""
+
+    def __init__(self, dtype: np.dtype, capacity: int):
+        self._rows = np.zeros(capacity, dtype=dtype)
+        self._head = 0
+        self._size = 0
+
+    def append(self, row: tuple) -> None:
+        self._rows[self._head] = row
+        self._head = (self._head + 1) % len(self._rows)
+        self._size = min(self._size + 1, len(self._rows))
+
+    def ordered(self) -> np.ndarray:
+        """Rows oldest first (a copy only when the ring has wrapped)."""
+        if self._size < len(self._rows):
+            return self._rows[:self._size]
+        return np.concatenate((self._rows[self._head:], self._rows[:self._head]))
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class _OpenBucket:
+    """Running min/sum/max for the rollup bucket currently being filled."""
+
+    __slots__ = ('start', 'count', 'drift_min', 'drift_sum', 'drift_max',
+                 'retention_min', 'retention_sum', 'retention_max')
+
+    def __init__(self, start: float):
+        self.start = start
+        self.count = 0
+        self.drift_min = self.retention_min = float('inf')
+        self.drift_max = self.retention_max = float('-inf')
+        self.drift_sum = self.retention_sum = 0.0
+
+    def add(self, count: int, drift_min: float, drift_sum: float, drift_max: float,
+            retention_min: float, retention_sum: float, retention_max: float) -> None:
+        self.count += count
+        self.drift_sum += drift_sum
+        self.retention_sum += retention_sum
+        if drift_min < self.drift_min:
+            self.drift_min = drift_min
+        if drift_max > self.drift_max:
+            self.drift_max = drift_max
+        if retention_min < self.retention_min:
+            self.retention_min = retention_min
+        if retention_max > self.retention_max:
+            self.retention_max = retention_max
+
+    def row(self) -> tuple:
+        return (self.start, self.count,
+                self.drift_min, self.drift_sum / self.count, self.drift_max,
+                self.retention_min, self.retention_sum / self.count, self.retention_max)
+
+
+class BraidHistory:
+    """Tiered harmonic history for a single memory braid."""
+
+    def __init__(self, raw_capacity: int = 600, minute_capacity: int = 1440,
+                 hour_capacity: int = 336):
+        self.raw = _Ring(RAW_DTYPE, raw_capacity)
+        self.minutes = _Ring(ROLLUP_DTYPE, minute_capacity)
+        self.hours = _Ring(ROLLUP_DTYPE, hour_capacity)
+        self._minute = None     # Open minute bucket
+        self._hour = None       # Open hour bucket
+        self.samples = 0
+
+    def record(self, timestamp: float, drift: float, retention: float) -> None:
+        """Add one sample; closes minute/hour buckets as time moves on."""
+        self.raw.append((timestamp, drift, retention))
+        self.samples += 1
+
+        minute_start = timestamp - timestamp % 60.0
+        if self._minute is not None and self._minute.start != minute_start:
+            self._close_minute()
+        if self._minute is None:
+            self._minute = _OpenBucket(minute_start)
+            # A minute in a later hour finishes the open hour right away
+            self._close_hour_before(minute_start - minute_start % 3600.0)
+        self._minute.add(1, drift, drift, drift, retention, retention, retention)
+
+    def _close_hour_before(self, hour_start: float) -> None:
+        if self._hour is not None and self._hour.start != hour_start:
+            self.hours.append(self._hour.row())
+            self._hour = None
+
+    def _close_minute(self) -> None:
+        minute = self._minute
+        self.minutes.append(minute.row())
+        self._minute = None
+
+        hour_start = minute.start - minute.start % 3600.0
+        self._close_hour_before(hour_start)
+        if self._hour is None:
+            self._hour = _OpenBucket(hour_start)
+        self._hour.add(minute.count, minute.drift_min, minute.drift_sum, minute.drift_max,
+                       minute.retention_min, minute.retention_sum, minute.retention_max)
+
+    def rollups(self, resolution: str) -> np.ndarray:
+        """Closed rollups plus the still-open bucket, oldest first."""
+        if resolution == 'minute':
+            ring, open_buckets = self.minutes, [self._minute]
+        elif resolution == 'hour':
+            ring = self.hours
+            # The open hour has not absorbed the open minute yet; merge a copy
+            open_buckets = [self._hour_including_open_minute()]
+        else:
+            raise ValueError(f"Unknown rollup resolution: {resolution}")
+
+        rows = ring.ordered()
+        pending = [bucket.row() for bucket in open_buckets if bucket is not None]
+        if pending:
+            rows = np.concatenate((rows, np.array(pending, dtype=ROLLUP_DTYPE)))
+        return rows
+
+    def _hour_including_open_minute(self) -> Optional[_OpenBucket]:
+        minute = self._minute
+        if minute is None:
+            return self._hour
+        hour_start = minute.start - minute.start % 3600.0
+        merged = _OpenBucket(hour_start)
+        if self._hour is not None and self._hour.start == hour_start:
+            hour = self._hour
+            merged.add(hour.count, hour.drift_min, hour.drift_sum, hour.drift_max,
+                       hour.retention_min, hour.retention_sum, hour.retention_max)
+        merged.add(minute.count, minute.drift_min, minute.drift_sum, minute.drift_max,
+                   minute.retention_min, minute.retention_sum, minute.retention_max)
+        return merged
+
+    def query(self, start: float = float('-inf'), end: float = float('inf'),
+              resolution: str = 'auto') -> np.ndarray:
+        """
+        Samples or rollups with start <= time <= end.
+
+        resolution 'auto' picks the finest tier whose retained data still
+        reaches back to start.
+        """
+        resolution = self._resolve(resolution, start)
+        if resolution == 'raw':
+            rows, key = self.raw.ordered(), 'timestamp'
+        else:
+            rows, key = self.rollups(resolution), 'bucket_start'
+        times = rows[key]
+        lo = np.searchsorted(times, start, side='left')
+        hi = np.searchsorted(times, end, side='right')
+        return rows[lo:hi]
+
+    def _resolve(self, resolution: str, start: float) -> str:
+        """Concrete tier for a query; 'auto' becomes raw, minute or hour."""
+        if resolution != 'auto':
+            return resolution
+        if len(self.raw) and self.raw.ordered()['timestamp'][0] <= start:
+            return 'raw'
+        minutes = self.rollups('minute')
+        if len(minutes) and minutes['bucket_start'][0] <= start:
+            return 'minute'
+        return 'hour'
+
+    def trend(self, metric: str = 'drift', resolution: str = 'hour',
+              start: float = float('-inf'), end: float = float('inf')) -> float:
+        """Least-squares slope (units per hour) of a metric over a time range."""
+        resolution = self._resolve(resolution, start)
+        rows = self.query(start, end, resolution)
+        if len(rows) < 2:
+            return 0.0
+        if resolution == 'raw':
+            times, values = rows['timestamp'], rows[metric]
+        else:
+            times, values = rows['bucket_start'], rows[f'{metric}_mean']
+        hours = (times - times[0]) / 3600.0
+        hours_centered = hours - hours.mean()
+        denominator = np.dot(hours_centered, hours_centered)
+        if denominator == 0:
+            return 0.0
+        return float(np.dot(hours_centered, values - values.mean()) / denominator)
+
+    @property
+    def nbytes(self) -> int:
+        return self.raw._rows.nbytes + self.minutes._rows.nbytes + self.hours._rows.nbytes
+
+
+class HarmonicHistory:
+    """Per-braid tiered histories with shared tier capacities."""
+
+    def __init__(self, raw_capacity: int = 600, minute_capacity: int = 1440,
+                 hour_capacity: int = 336):
+        self.raw_capacity = raw_capacity
+        self.minute_capacity = minute_capacity
+        self.hour_capacity = hour_capacity
+        self.braids: Dict[str, BraidHistory] = {}
+
+    def braid(self, braid_id: str) -> BraidHistory:
+        """History for a braid, created on first use."""
+        history = self.braids.get(braid_id)
+        if history is None:
+            history = BraidHistory(self.raw_capacity, self.minute_capacity, self.hour_capacity)
+            self.braids[braid_id] = history
+        return history
+
+    def record(self, braid_id: str, timestamp: float, drift: float, retention: float) -> None:
+        self.braid(braid_id).record(timestamp, drift, retention)
+
+    def query(self, braid_id: str, start: float = float('-inf'),
+              end: float = float('inf'), resolution: str = 'auto') -> np.ndarray:
+        """BraidHistory.query for a recorded braid; KeyError if unknown."""
+        return self.braids[braid_id].query(start, end, resolution)
+
+    def trend(self, braid_id: str, metric: str = 'drift', resolution: str = 'hour',
+              start: float = float('-inf'), end: float = float('inf')) -> float:
+        """BraidHistory.trend for a recorded braid; KeyError if unknown."""
+        return self.braids[braid_id].trend(metric, resolution, start, end)
+
+    def __len__(self) -> int:
+        return len(self.braids)
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+OBMI Kernel Backend Selection
+=============================
+
+Chooses the implementation behind OBMIHarmonicCore's and
+RelayRecoverySystem's array methods:
+
+- "numba": compiled kernels from obmi_numba (needs numba installed)
+- "numpy": the obmi_kernels NumPy kernels (always available)
+- "auto":  numba when it imports, otherwise numpy
+
+The default comes from the OBMI_BACKEND environment variable ("auto" if
+unset). numba is imported lazily on first selection, and warmup() reports
+import and compile-cache load time so startup cost stays visible.
+parity_check() compares the compiled backend against the NumPy kernels
+and the scalar methods; run this module to execute it:
+
+    python obmi_jit.py            # backend, warmup, parity and speed report
+    OBMI_BACKEND=numpy python obmi_core_py.py --batch drift < params.ndjson
+
+Author: ValorGrid Solutions
+Date: October 2026
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+import obmi_kernels
+
+
+BACKENDS = ("auto", "numba", "numpy")
+PARITY_TOLERANCE = 1e-12
+
+_numba_backend = None
+_numba_error = None
+_numba_import_seconds = None
+
+
+def _load_numba():
+    """Import obmi_numba once; returns None if numba is unavailable."""
+    global _numba_backend, _numba_error, _numba_import_seconds
+    if _numba_backend is None and _numba_error is None:
+        start = time.perf_counter()
+        try:
+            import obmi_numba
+        except Exception as error:
+            # Not only ImportError: numba can fail in other ways at import,
+            # e.g. against a NumPy release it does not support yet
+            _numba_error = error
+        else:
+            _numba_backend = obmi_numba
+        _numba_import_seconds = time.perf_counter() - start
+    return _numba_backend
+
+
+def numba_available() -> bool:
+    return _load_numba() is not None
+
+
+def backend_name(backend) -> str:
+    return "numba" if backend is _numba_backend and backend is not None else "numpy"
+
+
+def select_backend(name: Optional[str] = None):
+    """
+    Kernel module for the requested backend.
+
+    Args:
+        name: "auto", "numba" or "numpy" (defaults to $OBMI_BACKEND or "auto")
+
+    Returns:
+        module: obmi_numba or obmi_kernels; both expose harmonic_drift,
+        wrinkle_regrowth, systems_thinking_step and relay_handoff
+    """
+    name = (name or os.environ.get("OBMI_BACKEND") or "auto").lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown kernel backend: {name} (choose from {', '.join(BACKENDS)})")
+    if name == "numpy":
+        return obmi_kernels
+    backend = _load_numba()
+    if backend is None:
+        if name == "numba":
+            raise ImportError(f"numba backend requested but unavailable: {_numba_error}")
+        return obmi_kernels
+    return backend
+
+
+def warmup() -> Dict[str, float]:
+    """
+    Compile (or load from the on-disk cache) every numba kernel.
+
+    Returns:
+        dict: Seconds for the numba import, each kernel's first call and
+        the total; empty if numba is unavailable
+    """
+    backend = _load_numba()
+    if backend is None:
+        return {}
+    timings = {'import': _numba_import_seconds}
+    one = np.ones(1)
+    arguments = {
+        'harmonic_drift': (one, one, one),
+        'wrinkle_regrowth': (one, one),
+        'systems_thinking_step': (one, one, one),
+        'relay_handoff': (one, one, one)
+    }
+    for name, function in backend.COMPILED.items():
+        start = time.perf_counter()
+        function(*arguments[name])
+        timings[name] = time.perf_counter() - start
+    timings['total'] = sum(timings.values())
+    return timings
+
+
+def _random_inputs(count: int, seed: int) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return {
+        'r': rng.uniform(0, 2, count), 'F': rng.uniform(0, 5, count),
+        'theta': rng.uniform(-math.pi, math.pi, count),
+        'tension': rng.uniform(0, 1, count), 'conflict': rng.uniform(0, 1, count),
+        # Wide ranges so both clamp bounds are exercised
+        'stock': rng.uniform(-0.5, 1.5, count), 'flow': rng.uniform(-1, 1, count),
+        'feedback': rng.uniform(0, 1, count),
+        'coherence': rng.uniform(0.3, 1.0, count),
+        'timestamp': rng.uniform(-1e3, 1e7, count)
+    }
+
+
+def parity_check(count: int = 100000, seed: int = 0, scalar_samples: int = 2000,
+                 tolerance: float = PARITY_TOLERANCE) -> Dict[str, Dict[str, float]]:
+    """
+    Compare the compiled kernels with the NumPy kernels and scalar methods.
+
+    Returns:
+        dict: Per kernel, max_abs_diff against NumPy (all rows) and against
+        the scalar method (first scalar_samples rows), and 'passed'
+    """
+    from obmi_core_py import OBMIHarmonicCore
+    from relay_sim_py import MemoryBraid, RelayRecoverySystem
+
+    compiled = select_backend("numba")
+    x = _random_inputs(count, seed)
+    core, relay = OBMIHarmonicCore(backend="numpy"), RelayRecoverySystem()
+    n = min(scalar_samples, count)
+
+    def scalar_handoff(i):
+        braid = MemoryBraid("parity", x['coherence'][i], 1.0, x['tension'][i], 0.0)
+        return relay.perform_relay_handoff(braid, x['timestamp'][i])['new_coherence']
+
+    cases = {
+        'harmonic_drift': (
+            lambda k: k.harmonic_drift(x['r'], x['F'], x['theta']),
+            lambda i: core.calculate_harmonic_drift(x['r'][i], x['F'][i], x['theta'][i])),
+        'wrinkle_regrowth': (
+            lambda k: k.wrinkle_regrowth(x['tension'], x['conflict']),
+            lambda i: core.wrinkle_regrowth(x['tension'][i], x['conflict'][i])),
+        'systems_thinking_step': (
+            lambda k: k.systems_thinking_step(x['stock'], x['flow'], x['feedback'])['stock'],
+            lambda i: core.systems_thinking_loop(x['stock'][i], x['flow'][i],
+                                                 x['feedback'][i])['stock']),
+        'relay_handoff': (
+            lambda k: k.relay_handoff(x['coherence'], x['tension'], x['timestamp'])['new_coherence'],
+            scalar_handoff)
+    }
+
+    results = {}
+    for name, (vectorized, scalar) in cases.items():
+        actual = vectorized(compiled)
+        versus_numpy = float(np.max(np.abs(actual - vectorized(obmi_kernels))))
+        expected = np.array([scalar(i) for i in range(n)])
+        versus_scalar = float(np.max(np.abs(actual[:n] - expected)))
+        results[name] = {
+            'max_abs_diff_numpy': versus_numpy,
+            'max_abs_diff_scalar': versus_scalar,
+            'passed': max(versus_numpy, versus_scalar) <= tolerance
+        }
+    return results
+
+
+def benchmark_backends(count: int = 1_000_000, seed: int = 0,
+                       repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """Best-of-repeat seconds per kernel for the NumPy and numba backends."""
+    x = _random_inputs(count, seed)
+    calls = {
+        'harmonic_drift': lambda k: k.harmonic_drift(x['r'], x['F'], x['theta']),
+        'wrinkle_regrowth': lambda k: k.wrinkle_regrowth(x['tension'], x['conflict']),
+        'systems_thinking_step': lambda k: k.systems_thinking_step(
+            x['stock'], x['flow'], x['feedback']),
+        'relay_handoff': lambda k: k.relay_handoff(x['coherence'], x['tension'], x['timestamp'])
+    }
+    backends = {'numpy': obmi_kernels}
+    if numba_available():
+        backends['numba'] = select_backend("numba")
+
+    results = {}
+    for name, call in calls.items():
+        results[name] = {}
+        for label, backend in backends.items():
+            call(backend)  # Warm caches (and compile for numba)
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                call(backend)
+                best = min(best, time.perf_counter() - start)
+            results[name][label] = best
+    return results
+
+
+def main():
+    """Report backend selection, warmup cost, parity and speed."""
+    parser = argparse.ArgumentParser(description="OBMI kernel backend check")
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    backend = select_backend()
+    print("OBMI Kernel Backends")
+    print("=" * 50)
+    print(f"Selected backend: {backend_name(backend)}")
+    if not numba_available():
+        print(f"numba unavailable ({_numba_error}); using NumPy kernels")
+        return
+
+    print("\nWarmup (import + compile/cache load):")
+    for name, seconds in warmup().items():
+        print(f"  {name:24s} {seconds * 1000:9.1f} ms")
+
+    print("\nParity vs NumPy kernels and scalar methods:")
+    parity = parity_check(min(args.count, 200000), args.seed)
+    for name, result in parity.items():
+        print(f"  {name:24s} numpy {result['max_abs_diff_numpy']:.1e}  "
+              f"scalar {result['max_abs_diff_scalar']:.1e}  "
+              f"{'ok' if result['passed'] else 'FAILED'}")
+
+    print(f"\nThroughput, {args.count:,} elements (best of 5):")
+    for name, timings in benchmark_backends(args.count, args.seed).items():
+        speedup = timings['numpy'] / timings['numba'] if timings['numba'] > 0 else 0.0
+        print(f"  {name:24s} numpy {timings['numpy'] * 1000:7.1f} ms  "
+              f"numba {timings['numba'] * 1000:7.1f} ms  ({speedup:.1f}x)")
+
+    if not all(result['passed'] for result in parity.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+OBMI Array Kernels - Vectorized Harmonic Computations
+=====================================================
+
+NumPy kernels for the OBMIHarmonicCore computations. Every kernel
+broadcasts over array inputs (scalars work too) and performs the same
+floating-point operations, in the same order, as the scalar methods in
+obmi_core_py.py, so results agree with the per-call path.
+
+Tuning parameters are passed explicitly; OBMIHarmonicCore's *_batch
+methods supply its own values. The relay kernels mirror
+RelayRecoverySystem in relay_sim_py.py.
+
+Author: ValorGrid Solutions
+Date: October 2026
+"""
+
+import argparse
+import math
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+OPTIMAL_TENSION = 0.3    # Wrinkle engine optimum (tension as fertilizer)
+DECAY_RATE = 0.02        # Natural memory decay per systems-thinking step
+RETENTION_FLOOR = 0.70   # Phase 1 retention alert threshold
+
+MOON_PERIOD = 8.0        # Moon phase cycle (seconds, demo timescale)
+NECTAR_PERIOD = 6.0      # Nectar flow cycle (seconds)
+NECTAR_SCALE = 0.7       # Nectar flow amplitude
+RELAY_UPLIFT = 0.345     # 34.5% coherence improvement factor
+
+# Phase 1 alert level by number of active risk factors
+PHASE1_ALERT_LEVELS = ("STABLE", "WARNING", "CRITICAL")
+PHASE1_RECOMMENDATIONS = (
+    "Continue harmonic monitoring",
+    "Apply relay recovery enhancement",
+    "Initiate Phoenix Protocol recovery"
+)
+
+# Phase 1 risk-factor bits, in detect_phase1_drift's reporting order
+RISK_DRIFT_EXCEEDED = 0x1
+RISK_RETENTION_DEGRADED = 0x2
+RISK_FACTOR_NAMES = (
+    (RISK_DRIFT_EXCEEDED, "harmonic_drift_exceeded"),
+    (RISK_RETENTION_DEGRADED, "retention_degradation")
+)
+
+# One row per braid for systems_thinking_step results
+STOCK_FLOW_DTYPE = np.dtype([
+    ('stock', np.float64),
+    ('flow_rate', np.float64),
+    ('resilience_factor', np.float64),
+    ('stability_index', np.float64),
+    ('feedback_strength', np.float64)
+])
+
+# One row per relay_recovery evaluation
+RELAY_RECOVERY_DTYPE = np.dtype([
+    ('pre_retention', np.float64),
+    ('post_retention', np.float64),
+    ('uplift_delta', np.float64),
+    ('uplift_percent', np.float64)
+])
+
+# One row per braid handoff, same fields as perform_relay_handoff's dict
+RELAY_HANDOFF_DTYPE = np.dtype([
+    ('old_coherence', np.float64),
+    ('new_coherence', np.float64),
+    ('improvement', np.float64),
+    ('moon_phase', np.float64),
+    ('nectar_flow', np.float64),
+    ('resonance_factor', np.float64),
+    ('tension_benefit', np.float64)
+])
+
+
+def harmonic_drift(r, F, theta) -> np.ndarray:
+    """Harmonic drift r * F * sin(theta), broadcast over inputs."""
+    return np.asarray(r, dtype=np.float64) * F * np.sin(theta)
+
+
+def harmony_memory(input_retention, harmonic_factor: float = 0.85) -> np.ndarray:
+    """Harmonic retention enhancement, capped at 1.0."""
+    return np.minimum(np.asarray(input_retention, dtype=np.float64) * harmonic_factor, 1.0)
+
+
+def phase1_alert_code(harmonic_drift, retention_rate, drift_threshold: float = 0.15,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Phase 1 alert code per sample: the number of active risk factors.
+
+    Args:
+        out: Optional preallocated int8 array to write into
+
+    Returns:
+        np.ndarray: int8 index into PHASE1_ALERT_LEVELS
+    """
+    if out is None:
+        out = np.empty(np.broadcast(harmonic_drift, retention_rate).shape, dtype=np.int8)
+    np.greater(harmonic_drift, drift_threshold, out=out, casting='unsafe')
+    out += np.less(retention_rate, RETENTION_FLOOR)
+    return out
+
+
+def phase1_risk_mask(harmonic_drift, retention_rate, drift_threshold: float = 0.15,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Phase 1 risk factors per sample as a RISK_* bitmask.
+
+    Args:
+        out: Optional preallocated uint8 array to write into
+
+    Returns:
+        np.ndarray: uint8 bitmask; decode with risk_factor_names()
+    """
+    if out is None:
+        out = np.empty(np.broadcast(harmonic_drift, retention_rate).shape, dtype=np.uint8)
+    np.less(retention_rate, RETENTION_FLOOR, out=out, casting='unsafe')
+    out <<= 1
+    out |= np.greater(harmonic_drift, drift_threshold)
+    return out
+
+
+def risk_factor_names(risk_mask: int) -> List[str]:
+    """Decode a RISK_* bitmask into detect_phase1_drift's risk_factors list."""
+    return [name for bit, name in RISK_FACTOR_NAMES if risk_mask & bit]
+
+
+def relay_recovery(pre_retention, relay_efficiency: float = 1.345) -> np.ndarray:
+    """Relay recovery uplift per retention value (RELAY_RECOVERY_DTYPE rows)."""
+    pre_retention = np.asarray(pre_retention, dtype=np.float64)
+    post_retention = pre_retention * relay_efficiency
+    uplift_delta = post_retention - pre_retention
+
+    result = np.empty(pre_retention.shape, dtype=RELAY_RECOVERY_DTYPE)
+    result['pre_retention'] = pre_retention
+    result['post_retention'] = np.minimum(post_retention, 1.0)
+    result['uplift_delta'] = uplift_delta
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result['uplift_percent'] = np.where(
+            pre_retention > 0, (uplift_delta / pre_retention) * 100, 0.0)
+    return result
+
+
+def moon_phase(timestamp) -> np.ndarray:
+    """Moon synchronization phase (mechanical core) at each timestamp."""
+    phase = np.remainder(timestamp, MOON_PERIOD) / MOON_PERIOD
+    return np.sin(phase * 2 * math.pi)
+
+
+def nectar_flow(timestamp) -> np.ndarray:
+    """Nectar flow rate (philosophical core) at each timestamp."""
+    phase = np.remainder(timestamp, NECTAR_PERIOD) / NECTAR_PERIOD
+    return np.cos(phase * 2 * math.pi) * NECTAR_SCALE
+
+
+def relay_phases(timestamp, mechanical_weight: float = 0.6, mechanical_stability: float = 0.85,
+                 philosophical_weight: float = 0.4, philosophical_creativity: float = 0.78):
+    """
+    Moon phase, Nectar flow and dual-core resonance factor per timestamp.
+
+    Returns:
+        tuple: (moon_phase, nectar_flow, resonance_factor) arrays
+    """
+    moon = moon_phase(timestamp)
+    nectar = nectar_flow(timestamp)
+    resonance = dual_core_resonance(moon, nectar, mechanical_weight, mechanical_stability,
+                                    philosophical_weight, philosophical_creativity)
+    return moon, nectar, resonance
+
+
+def dual_core_resonance(moon, nectar, mechanical_weight: float = 0.6,
+                        mechanical_stability: float = 0.85, philosophical_weight: float = 0.4,
+                        philosophical_creativity: float = 0.78):
+    """Dual-core resonance factor for given Moon phase and Nectar flow values."""
+    mechanical = mechanical_weight * mechanical_stability * np.abs(moon)
+    philosophical = philosophical_weight * philosophical_creativity * np.abs(nectar)
+    return (mechanical + philosophical) / 2
+
+
+def relay_handoff(coherence, tension_level, timestamp,
+                  mechanical_weight: float = 0.6, mechanical_stability: float = 0.85,
+                  philosophical_weight: float = 0.4,
+                  philosophical_creativity: float = 0.78) -> np.ndarray:
+    """
+    Moon/Nectar relay handoff for many braids.
+
+    Same arithmetic as RelayRecoverySystem.perform_relay_handoff; the
+    braids are not modified, new_coherence is returned instead.
+
+    Returns:
+        np.ndarray: RELAY_HANDOFF_DTYPE structured array
+    """
+    coherence, tension_level, timestamp = np.broadcast_arrays(
+        np.asarray(coherence, dtype=np.float64),
+        np.asarray(tension_level, dtype=np.float64),
+        np.asarray(timestamp, dtype=np.float64))
+
+    moon, nectar, resonance = relay_phases(
+        timestamp, mechanical_weight, mechanical_stability,
+        philosophical_weight, philosophical_creativity)
+    tension_benefit = 1.0 - np.abs(tension_level - OPTIMAL_TENSION)
+    new_coherence = np.minimum(coherence + resonance * tension_benefit * RELAY_UPLIFT, 1.0)
+
+    result = np.empty(coherence.shape, dtype=RELAY_HANDOFF_DTYPE)
+    result['old_coherence'] = coherence
+    result['new_coherence'] = new_coherence
+    result['improvement'] = new_coherence - coherence
+    result['moon_phase'] = moon
+    result['nectar_flow'] = nectar
+    result['resonance_factor'] = resonance
+    result['tension_benefit'] = tension_benefit
+    return result
+
+
+def wrinkle_regrowth(tension_level, conflict_intensity) -> np.ndarray:
+    """Wrinkle engine regrowth coefficient, capped at 1.0."""
+    tension_factor = 1.0 - np.abs(np.asarray(tension_level, dtype=np.float64) - OPTIMAL_TENSION)
+    conflict_factor = np.sqrt(conflict_intensity) * 0.6
+    return np.minimum((tension_factor + conflict_factor) / 2, 1.0)
+
+
+def systems_thinking_step(stock, flow_rate, feedback_strength) -> np.ndarray:
+    """
+    One stock/flow step for many braids.
+
+    Returns:
+        np.ndarray: STOCK_FLOW_DTYPE structured array with the same fields
+        as OBMIHarmonicCore.systems_thinking_loop's dict
+    """
+    stock, flow_rate, feedback_strength = np.broadcast_arrays(
+        np.asarray(stock, dtype=np.float64),
+        np.asarray(flow_rate, dtype=np.float64),
+        np.asarray(feedback_strength, dtype=np.float64))
+
+    adjusted_flow = flow_rate * (1 + feedback_strength * 0.5)
+    new_stock = np.clip(stock + adjusted_flow - (stock * DECAY_RATE), 0.0, 1.0)
+
+    result = np.empty(stock.shape, dtype=STOCK_FLOW_DTYPE)
+    result['stock'] = new_stock
+    result['flow_rate'] = adjusted_flow
+    result['resilience_factor'] = feedback_strength * new_stock
+    result['stability_index'] = 1.0 - np.abs(flow_rate)
+    result['feedback_strength'] = feedback_strength
+    return result
+
+
+def integrate_stock_flow(stock, flow_rate, feedback_strength, steps: int,
+                         trajectory: bool = False, method: str = "analytic") -> Dict[str, np.ndarray]:
+    """
+    Advance N braids through T systems-thinking steps.
+
+    Each step applies the same feedback modulation, 2% decay and [0,1]
+    clamp as systems_thinking_loop. Two methods:
+
+    - "scan": vectorized loop over steps, O(N) memory unless the trajectory
+      is requested; matches repeated systems_thinking_loop calls exactly.
+    - "analytic": after one explicit step, the stock follows the closed form
+      s_t = p + (s_1 - p) * q**(t-1) with q = 1 - decay and fixed point
+      p = adjusted_flow / decay. The trajectory is monotone toward p and,
+      once the clamp engages, stays pinned, so the final state is the
+      clipped closed form. Cost is O(N) regardless of T; results agree
+      with "scan" to rounding.
+
+    Args:
+        stock: Initial memory stock per braid [0,1]
+        flow_rate: Flow rate per braid (held constant over the run)
+        feedback_strength: Feedback strength per braid [0,1]
+        steps: Number of steps T
+        trajectory: Also return the (T, N) stock after every step
+            (forces the scan method)
+        method: "analytic" or "scan"
+
+    Returns:
+        dict: 'final' (STOCK_FLOW_DTYPE rows for the final step),
+        'mean_stock' over steps 1..T, 'clamped' (clamp engaged at any step)
+        and, if requested, 'trajectory'
+    """
+    stock, flow_rate, feedback_strength = (
+        np.array(a, dtype=np.float64) for a in np.broadcast_arrays(
+            np.asarray(stock, dtype=np.float64),
+            np.asarray(flow_rate, dtype=np.float64),
+            np.asarray(feedback_strength, dtype=np.float64)))
+    if steps < 1:
+        raise ValueError("steps must be at least 1")
+    if method not in ("analytic", "scan"):
+        raise ValueError(f"Unknown integration method: {method}")
+
+    adjusted_flow = flow_rate * (1 + feedback_strength * 0.5)
+    result = {}
+
+    if trajectory or method == "scan":
+        path = np.empty((steps,) + stock.shape) if trajectory else None
+        total = np.zeros(stock.shape)
+        clamped = np.zeros(stock.shape, dtype=bool)
+        current = stock
+        for step in range(steps):
+            unclamped = current + adjusted_flow - (current * DECAY_RATE)
+            current = np.clip(unclamped, 0.0, 1.0)
+            clamped |= current != unclamped
+            total += current
+            if trajectory:
+                path[step] = current
+        final_stock = current
+        mean_stock = total / steps
+        if trajectory:
+            result['trajectory'] = path
+    else:
+        # One explicit step brings any out-of-range initial stock into [0,1]
+        first_unclamped = stock + adjusted_flow - (stock * DECAY_RATE)
+        first = np.clip(first_unclamped, 0.0, 1.0)
+
+        q = 1.0 - DECAY_RATE
+        fixed_point = adjusted_flow / DECAY_RATE
+        offset = first - fixed_point
+        free_final = first if steps == 1 else fixed_point + offset * q ** (steps - 1)
+        final_stock = np.clip(free_final, 0.0, 1.0)
+        clamped = (first != first_unclamped) | (final_stock != free_final)
+
+        # Mean stock: closed-form geometric sum over the unclamped prefix,
+        # then the pinned bound for the remaining steps
+        free_steps = np.full(stock.shape, float(steps))
+        pinned = final_stock != free_final
+        if pinned.any():
+            bound = final_stock[pinned]
+            ratio = (bound - fixed_point[pinned]) / offset[pinned]
+            free_steps[pinned] = np.minimum(
+                np.floor(np.log(ratio) / np.log(q)) + 1, steps)
+        geometric = offset * (1 - q ** free_steps) / DECAY_RATE
+        total = free_steps * fixed_point + geometric + (steps - free_steps) * final_stock
+        mean_stock = total / steps
+
+    final = np.empty(stock.shape, dtype=STOCK_FLOW_DTYPE)
+    final['stock'] = final_stock
+    final['flow_rate'] = adjusted_flow
+    final['resilience_factor'] = feedback_strength * final_stock
+    final['stability_index'] = 1.0 - np.abs(flow_rate)
+    final['feedback_strength'] = feedback_strength
+
+    result.update(final=final, mean_stock=mean_stock, clamped=clamped)
+    return result
+
+
+def benchmark_kernels(count: int = 1_000_000, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """
+    Compare each kernel against a Python loop over the scalar methods.
+
+    Returns:
+        dict: Per kernel, loop and vectorized seconds, speedup and the
+        maximum absolute difference between the two paths
+    """
+    from obmi_core_py import OBMIHarmonicCore
+
+    rng = np.random.default_rng(seed)
+    core = OBMIHarmonicCore()
+    r, F, theta = rng.uniform(0, 2, count), rng.uniform(0, 5, count), rng.uniform(0, math.pi, count)
+    retention = rng.uniform(0, 1.2, count)
+    tension, conflict = rng.uniform(0, 1, count), rng.uniform(0, 1, count)
+    stock, flow, feedback = rng.uniform(0, 1, count), rng.uniform(-1, 1, count), rng.uniform(0, 1, count)
+
+    cases = {
+        'harmonic_drift': (
+            lambda: [core.calculate_harmonic_drift(*args)
+                     for args in zip(r.tolist(), F.tolist(), theta.tolist())],
+            lambda: core.calculate_harmonic_drift_batch(r, F, theta)),
+        'harmony_memory': (
+            lambda: [core.harmony_memory(x) for x in retention.tolist()],
+            lambda: core.harmony_memory_batch(retention)),
+        'wrinkle_regrowth': (
+            lambda: [core.wrinkle_regrowth(*args)
+                     for args in zip(tension.tolist(), conflict.tolist())],
+            lambda: core.wrinkle_regrowth_batch(tension, conflict)),
+        'systems_thinking_loop': (
+            lambda: [core.systems_thinking_loop(*args)['stock']
+                     for args in zip(stock.tolist(), flow.tolist(), feedback.tolist())],
+            lambda: core.systems_thinking_batch(stock, flow, feedback)['stock'])
+    }
+
+    results = {}
+    for name, (loop, vectorized) in cases.items():
+        start = time.perf_counter()
+        expected = np.array(loop())
+        loop_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = vectorized()
+        vector_seconds = time.perf_counter() - start
+
+        results[name] = {
+            'loop_seconds': loop_seconds,
+            'vectorized_seconds': vector_seconds,
+            'speedup': loop_seconds / vector_seconds if vector_seconds > 0 else 0.0,
+            'max_abs_diff': float(np.max(np.abs(expected - actual)))
+        }
+    return results
+
+
+def main():
+    """Print the kernel-vs-loop benchmark."""
+    parser = argparse.ArgumentParser(description="OBMI array kernel benchmark")
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("OBMI Array Kernels vs Python Loop")
+    print("=" * 60)
+    print(f"{'kernel':24s} {'loop s':>9s} {'array s':>9s} {'speedup':>9s} {'max diff':>10s}")
+    for name, result in benchmark_kernels(args.count, args.seed).items():
+        print(f"{name:24s} {result['loop_seconds']:9.3f} {result['vectorized_seconds']:9.4f} "
+              f"{result['speedup']:8.0f}x {result['max_abs_diff']:10.2e}")
+
+
+if __name__ == "__main__":
+    main()
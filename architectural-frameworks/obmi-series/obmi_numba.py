@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+OBMI Numba Kernels - Compiled Backend
+=====================================
+
+numba-compiled versions of the obmi_kernels inner loops for harmonic
+drift, wrinkle regrowth, the stock/flow step and the relay handoff. The
+public functions take and return the same shapes and dtypes as their
+obmi_kernels counterparts, so either module can serve as a backend.
+
+Requires numba (optional HPC dependency in requirements_file.txt); import
+through obmi_jit.select_backend(), which falls back to obmi_kernels when
+numba is missing. Compiled code is cached on disk next to this file, so
+only the first run in an environment pays full compilation.
+
+Author: ValorGrid Solutions
+Date: October 2026
+"""
+
+import math
+
+import numba
+import numpy as np
+
+from obmi_kernels import (DECAY_RATE, MOON_PERIOD, NECTAR_PERIOD, NECTAR_SCALE,
+                          OPTIMAL_TENSION, RELAY_HANDOFF_DTYPE, RELAY_UPLIFT,
+                          STOCK_FLOW_DTYPE)
+
+
+NAME = "numba"
+
+_jit = numba.njit(cache=True, nogil=True, error_model='numpy')
+
+
+@_jit
+def _harmonic_drift(r, F, theta, out):
+    for i in range(out.size):
+        out[i] = r[i] * F[i] * math.sin(theta[i])
+
+
+@_jit
+def _wrinkle_regrowth(tension_level, conflict_intensity, out):
+    for i in range(out.size):
+        tension_factor = 1.0 - abs(tension_level[i] - OPTIMAL_TENSION)
+        conflict_factor = math.sqrt(conflict_intensity[i]) * 0.6
+        out[i] = min((tension_factor + conflict_factor) / 2, 1.0)
+
+
+@_jit
+def _systems_thinking_step(stock, flow_rate, feedback_strength,
+                           new_stock, adjusted_flow, resilience, stability, feedback_out):
+    for i in range(stock.size):
+        flow = flow_rate[i] * (1 + feedback_strength[i] * 0.5)
+        value = stock[i] + flow - (stock[i] * DECAY_RATE)
+        value = max(0.0, min(value, 1.0))
+        new_stock[i] = value
+        adjusted_flow[i] = flow
+        resilience[i] = feedback_strength[i] * value
+        stability[i] = 1.0 - abs(flow_rate[i])
+        feedback_out[i] = feedback_strength[i]
+
+
+@_jit
+def _relay_handoff(coherence, tension_level, timestamp, mechanical_gain, philosophical_gain,
+                   old_coherence, new_coherence, improvement, moon_out, nectar_out,
+                   resonance_out, benefit_out):
+    for i in range(coherence.size):
+        moon = math.sin((timestamp[i] % MOON_PERIOD) / MOON_PERIOD * 2 * math.pi)
+        nectar = math.cos((timestamp[i] % NECTAR_PERIOD) / NECTAR_PERIOD * 2 * math.pi) * NECTAR_SCALE
+        resonance = (mechanical_gain * abs(moon) + philosophical_gain * abs(nectar)) / 2
+        benefit = 1.0 - abs(tension_level[i] - OPTIMAL_TENSION)
+        updated = min(coherence[i] + resonance * benefit * RELAY_UPLIFT, 1.0)
+
+        old_coherence[i] = coherence[i]
+        new_coherence[i] = updated
+        improvement[i] = updated - coherence[i]
+        moon_out[i] = moon
+        nectar_out[i] = nectar
+        resonance_out[i] = resonance
+        benefit_out[i] = benefit
+
+
+def _flat_inputs(*arrays):
+    """Broadcast inputs and flatten them to contiguous float64 vectors."""
+    arrays = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in arrays))
+    return arrays[0].shape, [np.ascontiguousarray(a).reshape(-1) for a in arrays]
+
+
+def harmonic_drift(r, F, theta) -> np.ndarray:
+    """Compiled obmi_kernels.harmonic_drift."""
+    shape, (r, F, theta) = _flat_inputs(r, F, theta)
+    out = np.empty(r.size)
+    _harmonic_drift(r, F, theta, out)
+    return out.reshape(shape)
+
+
+def wrinkle_regrowth(tension_level, conflict_intensity) -> np.ndarray:
+    """Compiled obmi_kernels.wrinkle_regrowth."""
+    shape, (tension_level, conflict_intensity) = _flat_inputs(tension_level, conflict_intensity)
+    out = np.empty(tension_level.size)
+    _wrinkle_regrowth(tension_level, conflict_intensity, out)
+    return out.reshape(shape)
+
+
+def systems_thinking_step(stock, flow_rate, feedback_strength) -> np.ndarray:
+    """Compiled obmi_kernels.systems_thinking_step (STOCK_FLOW_DTYPE rows)."""
+    shape, (stock, flow_rate, feedback_strength) = _flat_inputs(
+        stock, flow_rate, feedback_strength)
+    result = np.empty(stock.size, dtype=STOCK_FLOW_DTYPE)
+    _systems_thinking_step(stock, flow_rate, feedback_strength,
+                           *(result[name] for name in STOCK_FLOW_DTYPE.names))
+    return result.reshape(shape)
+
+
+def relay_handoff(coherence, tension_level, timestamp,
+                  mechanical_weight: float = 0.6, mechanical_stability: float = 0.85,
+                  philosophical_weight: float = 0.4,
+                  philosophical_creativity: float = 0.78) -> np.ndarray:
+    """Compiled obmi_kernels.relay_handoff (RELAY_HANDOFF_DTYPE rows)."""
+    shape, (coherence, tension_level, timestamp) = _flat_inputs(
+        coherence, tension_level, timestamp)
+    result = np.empty(coherence.size, dtype=RELAY_HANDOFF_DTYPE)
+    _relay_handoff(coherence, tension_level, timestamp,
+                   mechanical_weight * mechanical_stability,
+                   philosophical_weight * philosophical_creativity,
+                   *(result[name] for name in RELAY_HANDOFF_DTYPE.names))
+    return result.reshape(shape)
+
+
+# Compiled entry points, used by obmi_jit.warmup()
+COMPILED = {
+    'harmonic_drift': harmonic_drift,
+    'wrinkle_regrowth': wrinkle_regrowth,
+    'systems_thinking_step': systems_thinking_step,
+    'relay_handoff': relay_handoff
+}
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+OBMI Relay Recovery - Monte Carlo Ensemble
+==========================================
+
+Runs thousands of independently seeded relay recovery simulations across
+a process pool and merges them into distributions of improvement_percent
+and achievement_ratio with confidence intervals.
+
+Each simulation uses the virtual clock (no sleeping, no printing), and
+workers receive blocks of seeds and return only a compact summary array
+per block, so inter-process traffic stays small and throughput scales
+close to linearly with cores. Run seeds come from a SeedSequence, so an
+ensemble is reproducible from its base seed and independent of the
+worker count.
+
+Author: ValorGrid Solutions
+Date: October 2026
+"""
+
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+import numpy as np
+
+from relay_sim_py import RelayRecoverySystem
+
+
+# Columns of the per-run summary array
+SUMMARY_FIELDS = (
+    'initial_coherence',
+    'final_coherence',
+    'improvement_percent',
+    'achievement_ratio',
+    'cycles_completed'
+)
+
+
+def run_simulation(seed: int, duration: float = 30.0, cycle_interval: float = 2.0,
+                   braid_count: int = 5) -> np.ndarray:
+    """One seeded virtual-clock simulation; returns its SUMMARY_FIELDS row."""
+    system = RelayRecoverySystem(backend="numpy", seed=int(seed))
+    system.initialize_memory_braids(braid_count)
+    metrics = system.simulate_system_recovery(duration, virtual=True,
+                                              cycle_interval=cycle_interval, start_time=0.0)
+    return np.array([metrics[name] for name in SUMMARY_FIELDS], dtype=np.float64)
+
+
+def _run_block(args) -> np.ndarray:
+    seeds, duration, cycle_interval, braid_count = args
+    return np.stack([run_simulation(seed, duration, cycle_interval, braid_count)
+                     for seed in seeds])
+
+
+def summarize(values: np.ndarray, confidence: float = 0.95) -> Dict[str, float]:
+    """
+    Distribution summary with a normal-approximation CI for the mean and
+    an empirical percentile interval for single runs.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    mean = float(values.mean())
+    std = float(values.std(ddof=1)) if values.size > 1 else 0.0
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    half_width = z * std / np.sqrt(values.size)
+    tail = (1 - confidence) / 2 * 100
+    low, median, high = np.percentile(values, [tail, 50, 100 - tail])
+    return {
+        'mean': mean,
+        'std': std,
+        'mean_ci_low': mean - half_width,
+        'mean_ci_high': mean + half_width,
+        'median': float(median),
+        'interval_low': float(low),
+        'interval_high': float(high),
+        'min': float(values.min()),
+        'max': float(values.max())
+    }
+
+
+class EnsembleRunner:
+    """Process-parallel Monte Carlo ensemble of relay recovery simulations."""
+
+    def __init__(self, duration: float = 30.0, cycle_interval: float = 2.0,
+                 braid_count: int = 5, workers: Optional[int] = None,
+                 block_size: int = 256):
+        self.duration = duration
+        self.cycle_interval = cycle_interval
+        self.braid_count = braid_count
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        self.workers = workers
+        self.block_size = block_size
+
+    def run(self, runs: int, base_seed: int = 0,
+            confidence: float = 0.95) -> Dict[str, object]:
+        """
+        Simulate `runs` seeded systems.
+
+        Returns:
+            dict: 'summaries' ((runs, len(SUMMARY_FIELDS)) array), 'seeds',
+            improvement_percent and achievement_ratio distribution summaries,
+            elapsed_seconds and runs_per_sec
+        """
+        if runs < 1:
+            raise ValueError("runs must be at least 1")
+        seeds = np.random.SeedSequence(base_seed).generate_state(runs, dtype=np.uint64)
+        blocks = [(seeds[i:i + self.block_size].tolist(), self.duration,
+                   self.cycle_interval, self.braid_count)
+                  for i in range(0, runs, self.block_size)]
+
+        started = time.perf_counter()
+        if self.workers == 1:
+            results = [_run_block(block) for block in blocks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(_run_block, blocks))
+        elapsed = time.perf_counter() - started
+
+        summaries = np.concatenate(results)
+        columns = {name: summaries[:, i] for i, name in enumerate(SUMMARY_FIELDS)}
+        return {
+            'runs': runs,
+            'seeds': seeds,
+            'summaries': summaries,
+            'improvement_percent': summarize(columns['improvement_percent'], confidence),
+            'achievement_ratio': summarize(columns['achievement_ratio'], confidence),
+            'confidence': confidence,
+            'elapsed_seconds': elapsed,
+            'runs_per_sec': runs / elapsed if elapsed > 0 else 0.0
+        }
+
+
+def main():
+    """Run an ensemble and print the merged distributions."""
+    parser = argparse.ArgumentParser(description="Relay recovery Monte Carlo ensemble")
+    parser.add_argument("--runs", type=int, default=10000)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--cycle-interval", type=float, default=2.0)
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"Worker processes (default: all {os.cpu_count()} cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    args = parser.parse_args()
+
+    runner = EnsembleRunner(args.duration, args.cycle_interval, workers=args.workers)
+    result = runner.run(args.runs, args.seed, args.confidence)
+
+    print("Relay Recovery Monte Carlo Ensemble")
+    print("=" * 50)
+    print(f"Runs: {result['runs']:,} ({args.duration:.0f}s simulated each) "
+          f"in {result['elapsed_seconds']:.2f}s ({result['runs_per_sec']:,.0f} runs/sec)")
+    level = f"{result['confidence']:.0%}"
+    for name in ('improvement_percent', 'achievement_ratio'):
+        stats = result[name]
+        print(f"\n{name}:")
+        print(f"  mean {stats['mean']:.3f} (±{stats['std']:.3f}), "
+              f"{level} CI [{stats['mean_ci_low']:.3f}, {stats['mean_ci_high']:.3f}]")
+        print(f"  median {stats['median']:.3f}, "
+              f"{level} of runs in [{stats['interval_low']:.3f}, {stats['interval_high']:.3f}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+OBMI Relay Scheduler - Per-Braid Handoffs on a Timer Wheel
+==========================================================
+
+Instead of handing off every braid in lockstep each cycle, each braid
+syncs at its own cadence:
+
+    interval_i = 1 / (sync_frequency * harmonic_freq_i)
+
+so a braid with harmonic_freq 1.0 syncs at the system's sync_frequency,
+and faster harmonics sync more often.
+
+Pending braids live in a hashed timer wheel of `wheel_size` slots, each
+`tick` seconds wide. Slots hold NumPy index arrays, not per-braid
+objects: scheduling a batch is one argsort, and firing a tick hands the
+whole due batch to RelayRecoverySystem.relay_handoff_population in one
+vectorized call. Braids further out than one wheel revolution stay in
+their slot until their round comes up. Handoffs fire at tick times, so
+timestamps are quantized to `tick` and next due times advance from the
+scheduled time (no drift). A braid fires at most once per tick, so
+braids whose interval is shorter than `tick` are handed off every tick.
+
+The same scheduler runs on a virtual clock (advance) or on real time
+under asyncio (run_realtime). Either way it keeps its own clock (now);
+the relay system's virtual_time, used by simulate_system_recovery, is
+left untouched.
+
+Author: ValorGrid Solutions
+Date: October 2026
+"""
+
+import argparse
+import asyncio
+import math
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from relay_sim_py import BraidPopulation, RelayRecoverySystem
+from relay_sink import HANDOFF_RECORD_DTYPE, HandoffStats, as_sink
+
+
+def sync_intervals(population: BraidPopulation, sync_frequency: float) -> np.ndarray:
+    """Seconds between handoffs for each braid."""
+    if np.any(population.harmonic_freq <= 0):
+        raise ValueError("harmonic_freq must be positive to derive a sync interval")
+    return 1.0 / (sync_frequency * population.harmonic_freq)
+
+
+class HandoffScheduler:
+    """Timer-wheel scheduler firing relay handoffs per braid when due."""
+
+    def __init__(self, system: RelayRecoverySystem, population: BraidPopulation,
+                 start_time: float = 0.0, tick: float = 1 / 64, wheel_size: int = 1024,
+                 stagger: bool = True, seed: Optional[int] = None, sink=None):
+        """
+        Args:
+            system: Relay system performing the handoffs
+            population: Braids to schedule (updated in place)
+            start_time: Clock value at which scheduling starts; use
+                time.time() for run_realtime
+            tick: Wheel slot width in seconds (handoff timestamp resolution)
+            wheel_size: Number of slots; one revolution spans wheel_size * tick
+            stagger: Spread first handoffs uniformly over each braid's interval
+                (otherwise every braid is first due at start_time)
+            seed: Seed for the stagger offsets
+            sink: Optional relay_sink.HandoffSink, callable or consumer
+                generator receiving HANDOFF_RECORD_DTYPE batches
+        """
+        self.system = system
+        self.population = population
+        self.origin = start_time
+        self.tick = tick
+        self.wheel_size = wheel_size
+        self.sink = as_sink(sink)
+
+        self.intervals = sync_intervals(population, system.sync_frequency)
+        self.next_due = np.full(len(population), start_time)
+        if stagger:
+            self.next_due += np.random.default_rng(seed).random(len(population)) * self.intervals
+        self.due_tick = np.empty(len(population), dtype=np.int64)
+        self._slots: List[List[np.ndarray]] = [[] for _ in range(wheel_size)]
+
+        self.current_tick = -1                  # Last tick fired
+        self.stats = HandoffStats()
+        self.ticks_fired = 0
+        self.schedule(np.arange(len(population)), self.next_due)
+
+    @property
+    def now(self) -> float:
+        """Clock value of the last fired tick (start_time before any)."""
+        return max(self._tick_time(self.current_tick), self.origin)
+
+    @property
+    def pending(self) -> int:
+        return sum(part.size for slot in self._slots for part in slot)
+
+    def _tick_time(self, tick: int) -> float:
+        return self.origin + tick * self.tick
+
+    def schedule(self, indices: np.ndarray, due: np.ndarray) -> None:
+        """Insert braids into the wheel at the first tick at or after `due`."""
+        if not indices.size:
+            return
+        ticks = np.ceil((due - self.origin) / self.tick - 1e-9).astype(np.int64)
+        np.maximum(ticks, self.current_tick + 1, out=ticks)
+        self.due_tick[indices] = ticks
+        slots = ticks % self.wheel_size
+        if self.wheel_size <= 1 << 15:
+            slots = slots.astype(np.int16)      # Stable sort on int16 is a radix sort
+        order = np.argsort(slots, kind='stable')
+        slots, indices = slots[order], indices[order]
+        starts = np.flatnonzero(np.diff(slots, prepend=-1))
+        for slot, part in zip(slots[starts].tolist(), np.split(indices, starts[1:])):
+            self._slots[slot].append(part)
+
+    def _fire(self, tick: int) -> int:
+        """Hand off every braid due at `tick`; returns the batch size."""
+        slot = self._slots[tick % self.wheel_size]
+        if not slot:
+            return 0
+        waiting = np.concatenate(slot) if len(slot) > 1 else slot[0]
+        is_due = self.due_tick[waiting] <= tick
+        due = np.sort(waiting[is_due])     # Ascending indices gather faster
+        later = waiting[~is_due]
+        slot.clear()
+        if later.size:
+            slot.append(later)
+        if not due.size:
+            return 0
+
+        timestamp = self._tick_time(tick)
+        population = self.population
+        old = population.coherence[due]
+        result = self.system.relay_handoff_population(population, timestamp, indices=due)
+        new = population.coherence[due]
+        improvement = new - old
+        self.stats.update(due, improvement)
+        if self.sink is not None:
+            records = np.empty(due.size, dtype=HANDOFF_RECORD_DTYPE)
+            records['timestamp'] = timestamp
+            records['braid'] = due
+            records['old_coherence'] = old
+            records['new_coherence'] = new
+            records['improvement'] = improvement
+            records['resonance_factor'] = result['resonance_factor']
+            self.sink.emit(records)
+
+        # Braids faster than the tick fire once per tick instead of falling behind
+        self.next_due[due] = np.maximum(self.next_due[due] + self.intervals[due], timestamp)
+        self.schedule(due, self.next_due[due])
+        return due.size
+
+    def advance(self, until: float) -> int:
+        """
+        Fire every tick up to clock value `until` (virtual clock).
+
+        Returns:
+            int: Handoffs performed
+        """
+        last = math.floor((until - self.origin) / self.tick + 1e-9)
+        handoffs = 0
+        for tick in range(self.current_tick + 1, last + 1):
+            self.current_tick = tick    # Reschedules land after the tick being fired
+            fired = self._fire(tick)
+            if fired:
+                handoffs += fired
+                self.ticks_fired += 1
+        self.current_tick = max(self.current_tick, last)
+        return handoffs
+
+    async def run_realtime(self, duration: float, clock=time.time) -> int:
+        """
+        Fire handoffs on real time for `duration` seconds under asyncio.
+
+        The scheduler's clock must share `clock`'s time base (construct it
+        with start_time=time.time()). Late ticks are caught up in one
+        advance() rather than skipped.
+
+        Returns:
+            int: Handoffs performed
+        """
+        deadline = clock() + duration
+        handoffs = 0
+        while True:
+            now = clock()
+            if now >= deadline:
+                break
+            handoffs += self.advance(now)
+            wake = min(self._tick_time(self.current_tick + 1), deadline)
+            await asyncio.sleep(max(wake - clock(), 0.0))
+        return handoffs + self.advance(deadline)
+
+    def summary(self) -> Dict[str, float]:
+        summary = self.stats.summary()
+        summary.update({
+            'braids': len(self.population),
+            'clock': self.now,
+            'ticks_fired': self.ticks_fired,
+            'pending': self.pending,
+            'mean_coherence': float(self.population.coherence.mean())
+        })
+        return summary
+
+
+def main():
+    """Schedule a large population on the virtual clock, then briefly on asyncio."""
+    parser = argparse.ArgumentParser(description="OBMI per-braid handoff scheduler")
+    parser.add_argument("--braids", type=int, default=1_000_000)
+    parser.add_argument("--duration", type=float, default=10.0,
+                        help="Simulated seconds on the virtual clock")
+    parser.add_argument("--realtime", type=float, default=2.0,
+                        help="Wall-clock seconds under asyncio (0 to skip)")
+    parser.add_argument("--tick", type=float, default=1 / 64)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from braid_generator import BraidGenerator
+    population = BraidGenerator(seed=args.seed).generate(args.braids)
+    population.coherence *= 0.5     # Leave room for many handoffs before saturating
+    system = RelayRecoverySystem()
+
+    print("OBMI Per-Braid Handoff Scheduler")
+    print("=" * 50)
+    scheduler = HandoffScheduler(system, population, tick=args.tick, seed=args.seed)
+    start = time.perf_counter()
+    handoffs = scheduler.advance(args.duration)
+    elapsed = time.perf_counter() - start
+    summary = scheduler.summary()
+    print(f"Virtual: {handoffs:,} handoffs over {args.duration:.0f}s simulated "
+          f"in {elapsed:.2f}s ({handoffs / elapsed:,.0f} handoffs/sec)")
+    print(f"  ticks fired {summary['ticks_fired']}, mean coherence "
+          f"{summary['mean_coherence']:.4f}, pending {summary['pending']:,}")
+
+    if args.realtime > 0:
+        realtime = HandoffScheduler(system, population, start_time=time.time(),
+                                    tick=args.tick, seed=args.seed)
+        handoffs = asyncio.run(realtime.run_realtime(args.realtime))
+        print(f"Asyncio: {handoffs:,} handoffs in {args.realtime:.1f}s wall clock "
+              f"({realtime.ticks_fired} ticks)")
+
+
+if __name__ == "__main__":
+    main()
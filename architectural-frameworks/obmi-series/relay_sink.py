@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+OBMI Relay Handoff Sinks - Streaming Results and Online Statistics
+==================================================================
+
+Relay simulations emit handoff results in batches of HANDOFF_RECORD_DTYPE
+rows (one batch per cycle, or per block of cycles on the virtual clock)
+instead of collecting a dict per handoff. A sink decides what happens to
+each batch:
+
+- CallbackSink:   call a function with every batch
+- GeneratorSink:  send every batch into a consumer generator
+- BinaryFileSink: append packed records to a file (read_handoff_records)
+
+HandoffStats keeps the aggregates a run needs (handoff count, Welford /
+Chan mean and variance of improvement, per-braid totals) in constant
+memory, however long the simulation runs.
+
+Author: ValorGrid Solutions
+Date: October 2026
+"""
+
+import abc
+import inspect
+import os
+from typing import Callable, Dict, Generator, Optional, Union
+
+import numpy as np
+
+
+# Packed record per handoff (28 bytes)
+HANDOFF_RECORD_DTYPE = np.dtype([
+    ('timestamp', np.float64),
+    ('braid', np.uint32),
+    ('old_coherence', np.float32),
+    ('new_coherence', np.float32),
+    ('improvement', np.float32),
+    ('resonance_factor', np.float32)
+])
+
+
+class HandoffStats:
+    """Online handoff aggregates: count, mean/variance and per-braid totals."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0          # Sum of squared deviations from the mean
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.braid_totals = np.zeros(0)
+        self.braid_counts = np.zeros(0, dtype=np.int64)
+
+    def _merge(self, count: int, mean: float, m2: float) -> None:
+        """Chan et al. parallel merge of a batch's count/mean/M2."""
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def _grow(self, braids: int) -> None:
+        if braids > self.braid_totals.size:
+            self.braid_totals = np.concatenate(
+                (self.braid_totals, np.zeros(braids - self.braid_totals.size)))
+            self.braid_counts = np.concatenate(
+                (self.braid_counts, np.zeros(braids - self.braid_counts.size, dtype=np.int64)))
+
+    def add(self, braid: int, improvement: float) -> None:
+        """Record a single handoff (Welford update)."""
+        self._grow(braid + 1)
+        self.count += 1
+        delta = improvement - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (improvement - self.mean)
+        self.min = min(self.min, improvement)
+        self.max = max(self.max, improvement)
+        self.braid_totals[braid] += improvement
+        self.braid_counts[braid] += 1
+
+    def update(self, braids: np.ndarray, improvements: np.ndarray) -> None:
+        """Record a batch of handoffs for the given braid indices."""
+        improvements = np.asarray(improvements, dtype=np.float64).ravel()
+        if not improvements.size:
+            return
+        braids = np.asarray(braids).ravel()
+        batch_mean = float(improvements.mean())
+        self._merge(improvements.size, batch_mean,
+                    float(np.square(improvements - batch_mean).sum()))
+        self.min = min(self.min, float(improvements.min()))
+        self.max = max(self.max, float(improvements.max()))
+
+        size = int(braids.max()) + 1
+        self._grow(size)
+        if braids.size * 8 < size:
+            # Sparse batch: O(batch) scatter instead of O(braids) bincount
+            np.add.at(self.braid_totals, braids, improvements)
+            np.add.at(self.braid_counts, braids, 1)
+        else:
+            self.braid_totals[:size] += np.bincount(braids, weights=improvements, minlength=size)
+            self.braid_counts[:size] += np.bincount(braids, minlength=size)
+
+    def update_cycles(self, improvements: np.ndarray) -> None:
+        """Record a (cycles, braids) block where column i is braid i."""
+        if not improvements.size:
+            return
+        batch_mean = float(improvements.mean())
+        self._merge(improvements.size, batch_mean,
+                    float(np.square(improvements - batch_mean).sum()))
+        self.min = min(self.min, float(improvements.min()))
+        self.max = max(self.max, float(improvements.max()))
+        self._grow(improvements.shape[1])
+        self.braid_totals[:improvements.shape[1]] += improvements.sum(axis=0)
+        self.braid_counts[:improvements.shape[1]] += improvements.shape[0]
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'handoff_count': self.count,
+            'mean_improvement': self.mean,
+            'improvement_variance': self.variance,
+            'improvement_std': self.variance ** 0.5,
+            'min_improvement': self.min if self.count else 0.0,
+            'max_improvement': self.max if self.count else 0.0,
+            'total_improvement': float(self.braid_totals.sum())
+        }
+
+
+class HandoffSink(abc.ABC):
+    """Receives batches of HANDOFF_RECORD_DTYPE records."""
+
+    @abc.abstractmethod
+    def emit(self, records: np.ndarray) -> None:
+        """Handle one batch of records."""
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CallbackSink(HandoffSink):
+    """Calls function(records) for every batch."""
+
+    def __init__(self, function: Callable[[np.ndarray], None]):
+        self.function = function
+
+    def emit(self, records: np.ndarray) -> None:
+        self.function(records)
+
+
+class GeneratorSink(HandoffSink):
+    """Sends every batch into a consumer generator (primed on creation)."""
+
+    def __init__(self, consumer: Generator):
+        self.consumer = consumer
+        # as_sink wraps the same generator again on every run; prime it once
+        if inspect.getgeneratorstate(consumer) == inspect.GEN_CREATED:
+            next(self.consumer)
+
+    def emit(self, records: np.ndarray) -> None:
+        self.consumer.send(records)
+
+    def close(self) -> None:
+        self.consumer.close()
+
+
+class BinaryFileSink(HandoffSink):
+    """Appends packed records to a binary file."""
+
+    def __init__(self, path: str, append: bool = False):
+        self.path = path
+        self.records = 0
+        self._handle = open(path, 'ab' if append else 'wb')
+
+    def emit(self, records: np.ndarray) -> None:
+        self._handle.write(np.ascontiguousarray(records, dtype=HANDOFF_RECORD_DTYPE).tobytes())
+        self.records += len(records)
+
+    def close(self) -> None:
+        if not self._handle.closed:
+            self._handle.close()
+
+
+def as_sink(target: Union[None, HandoffSink, Callable, Generator]) -> Optional[HandoffSink]:
+    """Wrap a plain callable or generator as a sink; sinks pass through."""
+    if target is None or isinstance(target, HandoffSink):
+        return target
+    if isinstance(target, Generator):
+        return GeneratorSink(target)
+    if callable(target):
+        return CallbackSink(target)
+    raise TypeError(f"Cannot use {type(target).__name__} as a handoff sink")
+
+
+def read_handoff_records(path: str, mmap: bool = True) -> np.ndarray:
+    """Records written by BinaryFileSink (memory-mapped by default)."""
+    if mmap and os.path.getsize(path) > 0:
+        return np.memmap(path, dtype=HANDOFF_RECORD_DTYPE, mode='r')
+    return np.fromfile(path, dtype=HANDOFF_RECORD_DTYPE)
@@ -0,0 +1,6 @@
+"""Make the OBMI modules importable the way they import each other."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,44 @@
+"""Seeded, chunk-independent braid generation."""
+
+import numpy as np
+import pytest
+
+from braid_generator import RNG_BLOCK, BraidGenerator
+
+FIELDS = ('identity_index', 'coherence', 'harmonic_freq', 'tension_level')
+
+
+def _assert_same(first, second):
+    assert len(first) == len(second)
+    for name in FIELDS:
+        assert np.array_equal(getattr(first, name), getattr(second, name))
+
+
+@pytest.mark.parametrize("assignment", ["round_robin", "weighted"])
+def test_generate_reproducible_and_chunk_independent(assignment):
+    count = 2 * RNG_BLOCK + 123
+    reference = BraidGenerator(seed=7, assignment=assignment).generate(count)
+    assert len(reference) == count
+    _assert_same(BraidGenerator(seed=7, assignment=assignment).generate(count), reference)
+
+    for chunk_size in (1000, RNG_BLOCK, RNG_BLOCK + 1, 3 * RNG_BLOCK):
+        generator = BraidGenerator(seed=7, chunk_size=chunk_size, assignment=assignment)
+        _assert_same(generator.generate(count), reference)
+        chunks = list(generator.iter_chunks(count))
+        assert [len(chunk) for chunk in chunks[:-1]] == [chunk_size] * (len(chunks) - 1)
+        for name in FIELDS:
+            assert np.array_equal(np.concatenate([getattr(chunk, name) for chunk in chunks]),
+                                  getattr(reference, name))
+
+
+@pytest.mark.parametrize("count", [0, 1, 999, 1000, 1001])
+def test_length_matches_count(count):
+    generator = BraidGenerator(seed=1, chunk_size=1000)
+    assert len(generator.generate(count)) == count
+    assert sum(len(chunk) for chunk in generator.iter_chunks(count)) == count
+
+
+@pytest.mark.parametrize("chunk_size", [0, -5])
+def test_chunk_size_must_be_positive(chunk_size):
+    with pytest.raises(ValueError, match="chunk_size"):
+        BraidGenerator(chunk_size=chunk_size)
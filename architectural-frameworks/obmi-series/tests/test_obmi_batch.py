@@ -0,0 +1,46 @@
+"""NDJSON/CSV batch reader validation."""
+
+import io
+import json
+
+import numpy as np
+import pytest
+
+from obmi_batch import iter_record_chunks, run_batch
+
+FIELDS = ('coherence', 'tension_level', 'timestamp')
+
+
+def _lines(count):
+    return [json.dumps({'coherence': 0.5 + i / 100, 'tension_level': 0.1, 'timestamp': float(i)})
+            for i in range(count)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_reader_matches_records(chunk_size):
+    lines = _lines(10)
+    lines.insert(4, "")
+    chunks = list(iter_record_chunks(io.StringIO("\n".join(lines) + "\n"), FIELDS, chunk_size))
+    coherence = np.concatenate([chunk['coherence'] for chunk in chunks])
+    assert np.allclose(coherence, 0.5 + np.arange(10) / 100)
+
+
+@pytest.mark.parametrize("bad", ["1,2", "[0.5, 0.1, 3.0]", "\"text\"", "{\"coherence\": 0.5",
+                                 "{\"coherence\": 0.5, \"tension_level\": 0.1}",
+                                 "{\"coherence\": \"x\", \"tension_level\": 0.1, \"timestamp\": 1}"])
+@pytest.mark.parametrize("chunk_size", [1, 4, 100])
+def test_reader_rejects_bad_line_with_number(bad, chunk_size):
+    lines = _lines(6)
+    lines.insert(2, "")
+    lines.insert(5, bad)                # File line 6
+    stream = io.StringIO("\n".join(lines) + "\n")
+    with pytest.raises(ValueError, match=r"^Line 6: "):
+        list(iter_record_chunks(stream, FIELDS, chunk_size))
+
+
+def test_run_batch_round_trip():
+    sink = io.StringIO()
+    stats = run_batch('handoff', io.StringIO("\n".join(_lines(5))), sink, chunk_size=2)
+    assert stats['records'] == 5
+    assert [json.loads(line)['timestamp'] for line in sink.getvalue().splitlines()] == \
+        [0.0, 1.0, 2.0, 3.0, 4.0]
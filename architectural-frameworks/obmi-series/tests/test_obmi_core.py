@@ -0,0 +1,38 @@
+"""Compact Phase 1 detection across scalar and array inputs."""
+
+import numpy as np
+import pytest
+
+import obmi_kernels
+from obmi_core_py import OBMIHarmonicCore
+
+# (harmonic_drift, retention_rate, expected alert level)
+CASES = [
+    (0.05, 0.90, "STABLE"),
+    (0.30, 0.90, "WARNING"),
+    (0.05, 0.50, "WARNING"),
+    (0.30, 0.50, "CRITICAL")
+]
+
+
+@pytest.mark.parametrize("wrap", [float, np.float64, np.float32, lambda v: np.array(v)])
+@pytest.mark.parametrize("drift, retention, level", CASES)
+def test_compact_scalars(wrap, drift, retention, level):
+    result = OBMIHarmonicCore().detect_phase1_drift_compact(wrap(drift), wrap(retention))
+    assert type(result.alert_code) is int
+    assert result.alert_level == level
+    assert OBMIHarmonicCore().detect_phase1_drift(wrap(drift), wrap(retention))['alert_level'] == level
+
+
+def test_compact_matches_batch_arrays():
+    core = OBMIHarmonicCore()
+    rng = np.random.default_rng(0)
+    drift = rng.uniform(0.0, 0.3, 1000)
+    retention = rng.uniform(0.5, 1.0, 1000)
+    codes, masks = core.detect_phase1_drift_batch(drift, retention)
+    for i in range(drift.size):
+        result = core.detect_phase1_drift_compact(drift[i], retention[i])
+        assert result.alert_code == codes[i]
+        assert result.risk_mask == masks[i]
+    assert set(np.array(obmi_kernels.PHASE1_ALERT_LEVELS)[codes]) == \
+        set(obmi_kernels.PHASE1_ALERT_LEVELS)
@@ -0,0 +1,57 @@
+"""Tiered harmonic history lookups and trends."""
+
+import pytest
+
+from obmi_history import BraidHistory, HarmonicHistory
+
+
+def _history(samples=7200, step=1.0):
+    history = BraidHistory(raw_capacity=600)
+    for i in range(samples):
+        t = i * step
+        history.record(t, 0.01 + t / 3600.0, 0.9)
+    return history
+
+
+def test_unknown_braid_is_not_created():
+    history = HarmonicHistory()
+    with pytest.raises(KeyError):
+        history.query('missing')
+    with pytest.raises(KeyError):
+        history.trend('missing')
+    assert len(history) == 0
+
+
+def test_auto_trend_resolves_each_tier():
+    history = _history()
+    newest = 7199.0
+    # Raw tier covers the last 600 s, minutes the whole run, hours as fallback
+    assert history._resolve('auto', newest - 100) == 'raw'
+    assert history._resolve('auto', 60.0) == 'minute'
+    assert history._resolve('auto', -1.0) == 'hour'
+    for start in (newest - 100, 60.0):
+        assert history.trend('drift', 'auto', start) == pytest.approx(1.0)
+
+
+def test_recorded_braid_queries():
+    history = HarmonicHistory(raw_capacity=10)
+    for i in range(30):
+        history.record('braid', float(i), 0.1, 0.9)
+    rows = history.query('braid', 25.0, resolution='auto')
+    assert rows['timestamp'].tolist() == [25.0, 26.0, 27.0, 28.0, 29.0]
+
+
+def test_hour_boundary_keeps_previous_hour():
+    history = BraidHistory()
+    for i in range(120):
+        history.record(i * 30.0, 0.1, 0.9)
+    history.record(3600.0, 0.5, 0.8)
+    hours = history.rollups('hour')
+    assert hours['bucket_start'].tolist() == [0.0, 3600.0]
+    assert hours['count'].tolist() == [120, 1]
+    assert history.query(resolution='hour')['count'].sum() == 121
+    assert history.trend('drift', 'hour') == pytest.approx(0.4)
+
+    # Closing the first minute of the new hour must not duplicate the old one
+    history.record(3660.0, 0.5, 0.8)
+    assert history.rollups('hour')['count'].tolist() == [120, 2]
@@ -0,0 +1,53 @@
+"""Backend selection and numba parity with the NumPy kernels."""
+
+import builtins
+
+import pytest
+
+import obmi_jit
+import obmi_kernels
+
+
+@pytest.fixture
+def fresh_loader(monkeypatch):
+    """Forget any earlier numba import attempt for the duration of a test."""
+    monkeypatch.setattr(obmi_jit, '_numba_backend', None)
+    monkeypatch.setattr(obmi_jit, '_numba_error', None)
+    monkeypatch.setattr(obmi_jit, '_numba_import_seconds', None)
+
+
+@pytest.mark.parametrize("error", [ImportError, RuntimeError, AttributeError])
+def test_numba_failure_falls_back_to_numpy(fresh_loader, monkeypatch, error):
+    real_import = builtins.__import__
+
+    def failing_import(name, *args, **kwargs):
+        if name == 'obmi_numba':
+            raise error("numba unusable")
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, '__import__', failing_import)
+    assert obmi_jit.select_backend("auto") is obmi_kernels
+    assert not obmi_jit.numba_available()
+    with pytest.raises(ImportError, match="numba unusable"):
+        obmi_jit.select_backend("numba")
+
+
+def test_numpy_backend_never_loads_numba(fresh_loader):
+    assert obmi_jit.select_backend("numpy") is obmi_kernels
+    assert obmi_jit._numba_error is None and obmi_jit._numba_backend is None
+
+
+def test_numba_parity():
+    pytest.importorskip("numba")
+    results = obmi_jit.parity_check(count=20000, scalar_samples=500)
+    assert set(results) == {'harmonic_drift', 'wrinkle_regrowth',
+                            'systems_thinking_step', 'relay_handoff'}
+    for name, result in results.items():
+        assert result['passed'], (name, result)
+
+
+def test_numba_selected_when_available():
+    pytest.importorskip("numba")
+    backend = obmi_jit.select_backend("numba")
+    assert obmi_jit.backend_name(backend) == "numba"
+    assert set(obmi_jit.warmup()) >= set(backend.COMPILED)
@@ -0,0 +1,73 @@
+"""Binary relay checkpoints: round trip, resume and fork."""
+
+import os
+
+import numpy as np
+import pytest
+
+import relay_checkpoint
+from relay_checkpoint import load_checkpoint, save_checkpoint
+from relay_sim_py import BraidPopulation, RelayRecoverySystem
+
+
+def _population(identities, count=6, seed=0):
+    rng = np.random.default_rng(seed)
+    return BraidPopulation(identities, np.arange(count) % max(len(identities), 1),
+                           rng.uniform(0.3, 0.8, count), rng.uniform(0.8, 2.2, count),
+                           rng.uniform(0.0, 0.6, count), 0.0)
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+    system = RelayRecoverySystem(seed=7)
+    system.initialize_memory_braids(5)
+    system.simulate_system_recovery(10.0, virtual=True, cycle_interval=1.0)
+    save_checkpoint(system, path)
+
+    system.simulate_system_recovery(10.0, virtual=True, cycle_interval=1.0)
+    resumed = load_checkpoint(path).restore()
+    resumed.simulate_system_recovery(10.0, virtual=True, cycle_interval=1.0)
+
+    assert resumed.memory_braids == system.memory_braids
+    assert (resumed.cycles_completed, resumed.virtual_time) == \
+        (system.cycles_completed, system.virtual_time)
+    assert resumed.rng.random() == system.rng.random()
+
+
+@pytest.mark.parametrize("identities", [[""], ["", "a"], ["nul\0inside", "", "ü"], []])
+def test_identity_table_round_trip(tmp_path, identities):
+    path = str(tmp_path / "identities.ckpt")
+    population = _population(identities, count=6 if identities else 0)
+    save_checkpoint(RelayRecoverySystem(), path, population)
+    loaded = load_checkpoint(path).population
+    assert loaded.identities == identities
+    assert np.array_equal(loaded.identity_index, population.identity_index)
+    assert np.array_equal(loaded.coherence, population.coherence)
+
+
+def test_forks_are_isolated(tmp_path):
+    path = str(tmp_path / "fork.ckpt")
+    population = _population(["a", "b"])
+    save_checkpoint(RelayRecoverySystem(), path, population)
+    checkpoint = load_checkpoint(path)
+    fork = checkpoint.fork()
+    fork.restore().relay_handoff_population(fork.population, 1.0)
+    assert not np.array_equal(fork.population.coherence, population.coherence)
+    assert np.array_equal(checkpoint.population.coherence, population.coherence)
+    assert np.array_equal(load_checkpoint(path).population.coherence, population.coherence)
+
+
+def test_failed_save_keeps_previous_checkpoint(tmp_path, monkeypatch):
+    path = str(tmp_path / "keep.ckpt")
+    population = _population(["a"])
+    save_checkpoint(RelayRecoverySystem(), path, population)
+    before = open(path, 'rb').read()
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(relay_checkpoint.os, 'fsync', failing_fsync)
+    with pytest.raises(OSError, match="disk full"):
+        save_checkpoint(RelayRecoverySystem(), path, _population(["b"], seed=1))
+    assert not os.path.exists(path + ".tmp")
+    assert open(path, 'rb').read() == before
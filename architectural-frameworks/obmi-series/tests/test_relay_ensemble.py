@@ -0,0 +1,21 @@
+"""Monte Carlo ensemble runner."""
+
+import numpy as np
+import pytest
+
+from relay_ensemble import SUMMARY_FIELDS, EnsembleRunner, run_simulation
+
+
+def test_runs_must_be_positive():
+    with pytest.raises(ValueError):
+        EnsembleRunner(workers=1).run(0)
+    with pytest.raises(ValueError):
+        EnsembleRunner(block_size=0)
+
+
+def test_blocks_match_single_runs():
+    runner = EnsembleRunner(duration=6.0, workers=1, block_size=2)
+    result = runner.run(5, base_seed=3)
+    assert result['summaries'].shape == (5, len(SUMMARY_FIELDS))
+    for seed, row in zip(result['seeds'], result['summaries']):
+        assert np.array_equal(row, run_simulation(seed, duration=6.0))
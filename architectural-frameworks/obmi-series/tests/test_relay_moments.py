@@ -0,0 +1,68 @@
+"""Running harmonic moments kept current by handoffs."""
+
+import numpy as np
+import pytest
+
+from relay_sim_py import BraidPopulation, RelayRecoverySystem, RunningMoments
+
+
+def _population(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return BraidPopulation([f"braid_{i}" for i in range(count)], np.arange(count),
+                           rng.uniform(0.2, 0.6, count), rng.uniform(0.8, 2.2, count),
+                           rng.uniform(0.0, 0.6, count), 0.0)
+
+
+def _assert_current(moments, population):
+    for name in ('harmonic_freq', 'coherence', 'tension_level'):
+        values = getattr(population, name)
+        assert getattr(moments, name).mean == pytest.approx(values.mean(), rel=1e-12)
+        assert getattr(moments, name).variance == pytest.approx(values.var(), rel=1e-9, abs=1e-15)
+
+
+def test_duplicate_indices_counted_once():
+    population = _population(10)
+    moments = population.harmonic_moments()
+    RelayRecoverySystem().relay_handoff_population(population, 1.0, np.array([3, 1, 3, -7, 8]))
+    _assert_current(moments, population)
+
+
+def test_handoffs_and_view_writes_stay_exact():
+    population = _population(200)
+    moments = population.harmonic_moments()
+    system = RelayRecoverySystem()
+    rng = np.random.default_rng(1)
+    for step in range(300):
+        indices = rng.integers(0, 200, 50)
+        system.relay_handoff_population(population, step * 0.37, indices)
+        population[int(rng.integers(200))].tension_level = float(rng.random())
+        if step % 50 == 0:
+            population.coherence *= 0.5
+            moments = population.harmonic_moments(refresh=True)
+    _assert_current(moments, population)
+
+
+def test_resync_bounds_drift():
+    values = np.full(1000, 1e8)
+    moments = RunningMoments(values, lambda: values)
+    rng = np.random.default_rng(2)
+    for _ in range(50_500):
+        i = int(rng.integers(values.size))
+        new = 1e8 + float(rng.random())
+        moments.replace(values[i], new)
+        values[i] = new
+    # Without resync the cancellation error in M2 grows with every replacement
+    assert moments.variance == pytest.approx(values.var(), rel=1e-7)
+    assert moments._replaced < values.size
+
+
+def test_memory_braid_moments_resync():
+    system = RelayRecoverySystem(seed=0)
+    system.initialize_memory_braids(5)
+    moments = system.harmonic_moments()
+    system.simulate_system_recovery(40.0, virtual=True, cycle_interval=1.0)
+    for braid in system.memory_braids:
+        system.perform_relay_handoff(braid, 3.0)
+    coherence = np.array([braid.coherence for braid in system.memory_braids])
+    assert moments.coherence.mean == pytest.approx(coherence.mean(), rel=1e-12)
+    assert moments.coherence.variance == pytest.approx(coherence.var(), rel=1e-9, abs=1e-15)
@@ -0,0 +1,82 @@
+"""Mean-field oscillator bank against the pairwise Kuramoto model."""
+
+import math
+
+import numpy as np
+import pytest
+
+import obmi_kernels
+from relay_oscillators import OscillatorBank
+from relay_sim_py import BraidPopulation, RelayRecoverySystem
+
+
+def _pairwise_step(phase, omega, coupling, dt, substeps):
+    """O(N^2) reference: dphase_i/dt = omega_i + K/N sum_j sin(phase_j - phase_i)."""
+    sub_dt = dt / substeps
+    for _ in range(substeps):
+        pull = np.sin(phase[None, :] - phase[:, None]).mean(axis=1)
+        phase = phase + (omega + coupling * pull) * sub_dt
+    return np.remainder(phase, 2 * math.pi)
+
+
+@pytest.mark.parametrize("coupling", [0.0, 1.5, 6.0])
+def test_mean_field_matches_pairwise(coupling):
+    rng = np.random.default_rng(0)
+    freq = rng.uniform(0.8, 1.2, 64)
+    bank = OscillatorBank(freq, coupling, seed=1)
+    phase = bank.phase.copy()
+    for _ in range(20):
+        bank.step()
+        phase = _pairwise_step(phase, bank.omega, coupling, bank.dt, bank.substeps)
+        difference = np.angle(np.exp(1j * (bank.phase - phase)))
+        assert np.max(np.abs(difference)) < 1e-9
+
+
+def test_strong_coupling_synchronizes():
+    freq = np.random.default_rng(2).uniform(0.9, 1.1, 2000)
+    weak = OscillatorBank(freq, 0.0, seed=3).run(40)[-1]
+    strong = OscillatorBank(freq, 8.0, seed=3).run(40)[-1]
+    assert strong > 0.9 > weak
+
+
+def _population(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return BraidPopulation([f"braid_{i}" for i in range(count)], np.arange(count),
+                           rng.uniform(0.3, 0.8, count), rng.uniform(0.8, 1.2, count),
+                           rng.uniform(0.0, 0.6, count), 0.0)
+
+
+@pytest.mark.parametrize("indices", [None, np.array([1, 4, 7, 9])])
+def test_handoff_uses_per_braid_phases(indices):
+    population = _population(12)
+    before = population.coherence.copy()
+    system = RelayRecoverySystem()
+    bank = OscillatorBank.from_population(population, system, coupling=1.0, seed=4)
+    bank.step(3)
+    result = system.relay_handoff_population(population, 5.0, indices, bank)
+
+    rows = np.arange(12) if indices is None else indices
+    moon = np.sin(bank.phase[rows])
+    nectar = np.cos(bank.phase[rows]) * obmi_kernels.NECTAR_SCALE
+    resonance = (0.6 * 0.85 * np.abs(moon) + 0.4 * 0.78 * np.abs(nectar)) / 2
+    benefit = 1 - np.abs(population.tension_level[rows] - obmi_kernels.OPTIMAL_TENSION)
+    expected = np.minimum(before[rows] + resonance * benefit * obmi_kernels.RELAY_UPLIFT, 1.0)
+
+    assert np.allclose(result['resonance_factor'], resonance)
+    assert np.allclose(population.coherence[rows], expected)
+    untouched = np.setdiff1d(np.arange(12), rows)
+    assert np.array_equal(population.coherence[untouched], before[untouched])
+
+
+def test_handoff_rejects_mismatched_bank():
+    population = _population(5)
+    with pytest.raises(ValueError):
+        RelayRecoverySystem().relay_handoff_population(
+            population, 0.0, oscillators=OscillatorBank(np.ones(4)))
+
+
+def test_from_population_uses_system_sync_frequency():
+    system = RelayRecoverySystem()
+    system.sync_frequency = 5.0
+    bank = OscillatorBank.from_population(_population(3), system)
+    assert bank.dt == pytest.approx(0.2)
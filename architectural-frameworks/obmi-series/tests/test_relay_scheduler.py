@@ -0,0 +1,95 @@
+"""Timer-wheel handoff scheduler against a per-braid reference."""
+
+import asyncio
+import math
+
+import numpy as np
+import pytest
+
+from relay_scheduler import HandoffScheduler, sync_intervals
+from relay_sim_py import BraidPopulation, RelayRecoverySystem
+
+
+def _population(count=300, seed=0):
+    rng = np.random.default_rng(seed)
+    return BraidPopulation([f"braid_{i}" for i in range(count)], np.arange(count),
+                           rng.uniform(0.2, 0.5, count), rng.uniform(0.5, 3.0, count),
+                           rng.uniform(0.0, 0.6, count), 0.0)
+
+
+def _reference(population, system, tick, until, seed):
+    """Each braid fires at its own due ticks; same-tick braids share one call."""
+    intervals = sync_intervals(population, system.sync_frequency)
+    due = np.random.default_rng(seed).random(len(population)) * intervals
+    last = math.floor(until / tick + 1e-9)
+    handoffs = 0
+    for current in range(last + 1):
+        ticks = np.maximum(np.ceil(due / tick - 1e-9), current)
+        firing = np.flatnonzero(ticks == current)
+        if firing.size:
+            system.relay_handoff_population(population, current * tick, indices=firing)
+            due[firing] += intervals[firing]
+            handoffs += firing.size
+    return handoffs
+
+
+@pytest.mark.parametrize("wheel_size", [7, 64, 1024])
+def test_matches_reference(wheel_size):
+    expected_population = _population()
+    expected = _reference(expected_population, RelayRecoverySystem(), 1 / 64, 5.0, seed=3)
+
+    population = _population()
+    system = RelayRecoverySystem()
+    scheduler = HandoffScheduler(system, population, wheel_size=wheel_size, seed=3)
+    handoffs = scheduler.advance(2.0) + scheduler.advance(2.0) + scheduler.advance(5.0)
+
+    assert handoffs == expected == scheduler.stats.count
+    assert np.array_equal(population.coherence, expected_population.coherence)
+    assert np.array_equal(population.last_sync, expected_population.last_sync)
+    assert scheduler.now == pytest.approx(5.0)
+
+
+def test_system_clock_untouched():
+    system = RelayRecoverySystem(seed=0)
+    system.virtual_time = 42.0
+    scheduler = HandoffScheduler(system, _population(50), seed=0)
+    scheduler.advance(3.0)
+    assert system.virtual_time == 42.0
+    assert scheduler.now == pytest.approx(3.0)
+
+
+def test_realtime_catches_up_on_a_fake_clock(monkeypatch):
+    times = iter(np.arange(0.0, 10.0, 0.05).tolist())
+
+    async def no_sleep(delay):
+        return None
+
+    monkeypatch.setattr(asyncio, 'sleep', no_sleep)
+    population = _population(50)
+    scheduler = HandoffScheduler(RelayRecoverySystem(), population, seed=1)
+    handoffs = asyncio.run(scheduler.run_realtime(1.0, clock=lambda: next(times)))
+    reference = _population(50)
+    assert handoffs == _reference(reference, RelayRecoverySystem(), 1 / 64, 1.0, seed=1)
+    assert np.array_equal(population.coherence, reference.coherence)
+
+
+@pytest.mark.parametrize("stepwise", [False, True])
+@pytest.mark.parametrize("tick, wheel_size", [(1 / 64, 64), (1.0, 64), (0.1, 7)])
+def test_handoff_counts_follow_intervals(tick, wheel_size, stepwise):
+    # Sync intervals from 1/160 s to 2 s, shorter and longer than the tick
+    freq = np.geomspace(0.25, 80.0, 40)
+    population = BraidPopulation(["braid"], np.zeros(freq.size), 0.1, freq, 0.3, 0.0)
+    scheduler = HandoffScheduler(RelayRecoverySystem(), population, tick=tick,
+                                 wheel_size=wheel_size, seed=0)
+    duration = 30.0
+    if stepwise:
+        for step in range(1, int(round(duration / tick)) + 1):
+            scheduler.advance(step * tick)
+    else:
+        scheduler.advance(duration)
+
+    # At most one handoff per braid per tick
+    expected = duration / np.maximum(scheduler.intervals, tick)
+    counts = scheduler.stats.braid_counts
+    assert counts.size == freq.size
+    assert np.all(np.abs(counts - expected) <= 2)
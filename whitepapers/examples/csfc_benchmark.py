@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+CSFC Detector Benchmark Suite
+=============================
+
+Offline benchmarks for the CSFCDetector hot path: process_sample,
+calculate_cascade_risk, analyze_trend and _calculate_slope across several
+history and lookback sizes, plus the process_batch path for reference.
+
+Each case reports throughput (calls/sec), per-call latency percentiles and
+peak traced memory. Results can be saved as a JSON baseline and compared
+against a previous baseline to make regressions visible between versions.
+
+    python csfc_benchmark.py                          # run and print
+    python csfc_benchmark.py --save benchmarks/csfc_baseline.json
+    python csfc_benchmark.py --compare benchmarks/csfc_baseline.json
+
+Author: ValorGrid Solutions
+Date: October 2026
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from drift_test_stub import CSFCDetector, MetricHistoryStore, SystemMetrics
+
+
+def _random_metrics(rng: random.Random, count: int) -> List[SystemMetrics]:
+    return [SystemMetrics(rng.uniform(0.4, 1.0), rng.uniform(0.4, 1.0),
+                          rng.uniform(0.4, 1.0), rng.uniform(0.4, 1.0),
+                          rng.uniform(0.4, 1.0), float(i))
+            for i in range(count)]
+
+
+def _warm_detector(rng: random.Random, lookback: int, history_capacity: int,
+                   compact: bool = False) -> CSFCDetector:
+    """Detector whose history and trend window are already full."""
+    history = MetricHistoryStore(history_capacity) if compact else None
+    detector = CSFCDetector(lookback_samples=lookback,
+                            history_capacity=history_capacity, history=history)
+    for metrics in _random_metrics(rng, max(lookback, history_capacity)):
+        detector.process_sample(metrics)
+    return detector
+
+
+def measure(call: Callable, arguments: List, repeat: int = 1) -> Dict[str, float]:
+    """
+    Time call(argument) for every argument.
+
+    Latencies are per call (perf_counter_ns around each call, so timer
+    overhead of roughly 50-100 ns is included). Peak memory is measured in
+    a separate traced pass so tracing does not distort the timings.
+    """
+    latencies = np.empty(len(arguments) * repeat, dtype=np.int64)
+    clock = time.perf_counter_ns
+    index = 0
+    started = clock()
+    for _ in range(repeat):
+        for argument in arguments:
+            begin = clock()
+            call(argument)
+            latencies[index] = clock() - begin
+            index += 1
+    total = (clock() - started) / 1e9
+
+    tracemalloc.start()
+    for argument in arguments[:min(len(arguments), 1000)]:
+        call(argument)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        'calls': int(latencies.size),
+        'calls_per_sec': latencies.size / total if total > 0 else 0.0,
+        'p50_us': float(np.percentile(latencies, 50)) / 1000,
+        'p95_us': float(np.percentile(latencies, 95)) / 1000,
+        'p99_us': float(np.percentile(latencies, 99)) / 1000,
+        'peak_memory_kb': peak / 1024
+    }
+
+
+def run_suite(samples: int = 20000, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """Run every benchmark case; returns {case_name: measurements}."""
+    rng = random.Random(seed)
+    metrics = _random_metrics(rng, samples)
+    results = {}
+
+    detector = CSFCDetector()
+    results['calculate_cascade_risk'] = measure(detector.calculate_cascade_risk, metrics)
+
+    for lookback, capacity, compact in ((5, 100, False), (50, 1000, False),
+                                        (1000, 10000, False), (5, 100000, True)):
+        detector = _warm_detector(rng, lookback, capacity, compact)
+        name = f"process_sample[lookback={lookback},history={capacity}"
+        name += ",compact]" if compact else "]"
+        results[name] = measure(detector.process_sample, metrics)
+
+    for lookback in (5, 50, 1000):
+        detector = _warm_detector(rng, lookback, max(lookback, 100))
+        results[f"analyze_trend[streaming,lookback={lookback}]"] = measure(
+            lambda _: detector.analyze_trend(), range(samples))
+
+    detector = _warm_detector(rng, 5, 10000)
+    for lookback in (50, 1000):
+        results[f"analyze_trend[recompute,lookback={lookback}]"] = measure(
+            detector.analyze_trend, [lookback] * min(samples, 2000))
+
+    for size in (5, 50, 500, 5000):
+        values = [rng.random() for _ in range(size)]
+        results[f"_calculate_slope[n={size}]"] = measure(
+            detector._calculate_slope, [values] * max(10, min(samples, 200000 // size)))
+
+    columns = np.random.default_rng(seed).uniform(0.4, 1.0, size=(6, 100000))
+    batch = measure(lambda cols: detector.process_batch(*cols), [columns] * 20)
+    batch['samples_per_sec'] = batch['calls_per_sec'] * columns.shape[1]
+    results['process_batch[n=100000]'] = batch
+
+    return results
+
+
+def environment() -> Dict[str, str]:
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor() or 'unknown',
+        'system': platform.system(),
+        'recorded_at': time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    }
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float = 0.25) -> List[str]:
+    """
+    Compare throughput against a baseline.
+
+    Returns:
+        list: Case names whose calls_per_sec dropped by more than tolerance
+    """
+    regressions = []
+    print(f"{'case':58s} {'baseline':>12s} {'current':>12s} {'change':>8s}")
+    for name, result in current.items():
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"{name:58s} {'-':>12s} {result['calls_per_sec']:12,.0f} {'new':>8s}")
+            continue
+        change = result['calls_per_sec'] / reference['calls_per_sec'] - 1
+        flag = ""
+        if change < -tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:58s} {reference['calls_per_sec']:12,.0f} "
+              f"{result['calls_per_sec']:12,.0f} {change:+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    """Run the suite, optionally saving or comparing a JSON baseline."""
+    parser = argparse.ArgumentParser(description="CSFC detector benchmark suite")
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", metavar="PATH", help="Write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed throughput drop before flagging (default 0.25)")
+    args = parser.parse_args()
+
+    print("CSFC Detector Benchmark Suite")
+    print("=" * 50)
+    results = run_suite(args.samples, args.seed)
+
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+        print(f"Baseline: {args.compare} ({baseline['environment']['recorded_at']})\n")
+        regressions = compare(results, baseline['cases'], args.tolerance)
+    else:
+        regressions = []
+        print(f"{'case':58s} {'calls/sec':>12s} {'p50 us':>8s} {'p99 us':>8s} {'peak KB':>8s}")
+        for name, result in results.items():
+            print(f"{name:58s} {result['calls_per_sec']:12,.0f} {result['p50_us']:8.2f} "
+                  f"{result['p99_us']:8.2f} {result['peak_memory_kb']:8.1f}")
+
+    if args.save:
+        with open(args.save, 'w') as handle:
+            json.dump({'environment': environment(), 'samples': args.samples,
+                       'cases': results}, handle, indent=2)
+            handle.write("\n")
+        print(f"\nBaseline written to {args.save}")
+
+    if regressions:
+        print(f"\n{len(regressions)} case(s) regressed beyond {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
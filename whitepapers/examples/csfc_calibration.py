@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+CSFC Calibration Sweep - Thresholds and Weights
+===============================================
+
+Evaluates thousands of CSFC detector configurations (five indicator
+thresholds plus five cascade risk weights) against a labeled metrics
+dataset. Each block of configurations is scored in one vectorized pass
+over the data, and blocks are spread across a process pool.
+
+Reports precision, recall, F1 and alert volume per configuration, where a
+configuration "predicts" a cascade when its alert level reaches min_level
+(WARNING by default).
+
+Teaser implementation. Production adaptive thresholds available
+in Synoetic OS-professional.
+
+Author: ValorGrid Solutions
+Date: October 2026
+"""
+
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from csfc_replay import generate_degradation_telemetry
+from drift_test_stub import ALERT_LEVELS, METRIC_FIELDS, CSFCDetector, alert_codes
+
+
+# Config column order matches METRIC_FIELDS
+THRESHOLD_ATTRIBUTES = (
+    'identity_threshold',
+    'alignment_threshold',
+    'consistency_threshold',
+    'memory_threshold',
+    'confidence_threshold'
+)
+WEIGHT_KEYS = ('identity', 'alignment', 'consistency', 'memory', 'confidence')
+
+
+def detector_configuration(detector: CSFCDetector) -> Tuple[np.ndarray, np.ndarray]:
+    """Thresholds and weights of a detector as two length-5 arrays."""
+    thresholds = np.array([getattr(detector, name) for name in THRESHOLD_ATTRIBUTES])
+    weights = np.array([detector.weights[key] for key in WEIGHT_KEYS])
+    return thresholds, weights
+
+
+def random_configurations(count: int, seed: int = 0,
+                          threshold_spread: float = 0.1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sample configurations around the default detector.
+
+    Thresholds are jittered uniformly by +/-threshold_spread; weights are
+    drawn from a Dirichlet centered on the default weights, so they still
+    sum to 1. Row 0 is always the default configuration.
+    """
+    if count < 1:
+        raise ValueError("count must be at least 1")
+    rng = np.random.default_rng(seed)
+    base_thresholds, base_weights = detector_configuration(CSFCDetector())
+
+    thresholds = base_thresholds + rng.uniform(-threshold_spread, threshold_spread,
+                                               size=(count, 5))
+    weights = rng.dirichlet(base_weights * 20, size=count)
+    thresholds[0] = base_thresholds
+    weights[0] = base_weights
+    return np.clip(thresholds, 0.0, 1.0), weights
+
+
+def config_alert_codes(chunk: np.ndarray, thresholds: np.ndarray,
+                       weights: np.ndarray) -> np.ndarray:
+    """
+    (B, n) alert codes of B configurations on a (5, n) chunk of metrics.
+
+    Risk terms are accumulated one metric at a time in METRIC_FIELDS order,
+    as CSFCDetector.process_batch does, so each configuration's codes match
+    the detector's exactly, including at the ladder boundaries.
+    """
+    risk = weights[:, 0, None] * (1.0 - chunk[0])
+    for metric in range(1, len(METRIC_FIELDS)):
+        risk = risk + weights[:, metric, None] * (1.0 - chunk[metric])
+    np.minimum(risk, 1.0, out=risk)
+    active = np.zeros(risk.shape, dtype=np.int8)
+    for metric in range(len(METRIC_FIELDS)):
+        active += chunk[metric][None, :] < thresholds[:, metric, None]
+    return alert_codes(risk, active)
+
+
+def score_block(metrics: np.ndarray, labels: np.ndarray, thresholds: np.ndarray,
+                weights: np.ndarray, min_level: int = 2,
+                sample_chunk: int = 65536) -> Dict[str, np.ndarray]:
+    """
+    Score a block of configurations against the whole dataset.
+
+    Args:
+        metrics: (5, N) metric columns in METRIC_FIELDS order
+        labels: (N,) boolean ground truth (True = cascade)
+        thresholds: (B, 5) indicator thresholds per configuration
+        weights: (B, 5) cascade risk weights per configuration
+        min_level: Alert code counted as a positive prediction
+
+    Returns:
+        dict: (B,) arrays of true_positives, false_positives,
+        false_negatives and alert_volume (non-STABLE samples)
+    """
+    block = thresholds.shape[0]
+    counts = {name: np.zeros(block, dtype=np.int64) for name in (
+        'true_positives', 'false_positives', 'false_negatives', 'alert_volume')}
+
+    for start in range(0, metrics.shape[1], sample_chunk):
+        chunk = metrics[:, start:start + sample_chunk]
+        truth = labels[start:start + sample_chunk]
+
+        code = config_alert_codes(chunk, thresholds, weights)
+
+        predicted = code >= min_level
+        counts['true_positives'] += (predicted & truth).sum(axis=1)
+        counts['false_positives'] += (predicted & ~truth).sum(axis=1)
+        counts['false_negatives'] += (~predicted & truth).sum(axis=1)
+        counts['alert_volume'] += (code > 0).sum(axis=1)
+
+    return counts
+
+
+# Dataset shared with pool workers once, via the initializer
+_worker_dataset = None
+
+
+def _init_worker(metrics: np.ndarray, labels: np.ndarray) -> None:
+    global _worker_dataset
+    _worker_dataset = (metrics, labels)
+
+
+def _score_block_worker(args) -> Dict[str, np.ndarray]:
+    thresholds, weights, min_level = args
+    metrics, labels = _worker_dataset
+    return score_block(metrics, labels, thresholds, weights, min_level)
+
+
+class CalibrationSweep:
+    """Vectorized, process-parallel threshold/weight calibration."""
+
+    def __init__(self, metrics, labels, min_level: str = "WARNING",
+                 block_size: int = 64, workers: Optional[int] = None):
+        self.metrics = np.ascontiguousarray(metrics, dtype=np.float64)
+        self.labels = np.asarray(labels, dtype=bool)
+        if self.metrics.shape[0] != len(METRIC_FIELDS) or self.metrics.shape[1] != self.labels.size:
+            raise ValueError("metrics must be (5, N) and labels (N,)")
+        self.min_level = ALERT_LEVELS.index(min_level)
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        self.block_size = block_size
+        self.workers = workers
+
+    def run(self, thresholds: np.ndarray, weights: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Evaluate every configuration.
+
+        Returns:
+            dict: Per-configuration thresholds, weights, precision, recall,
+            f1, alert_volume and raw confusion counts, plus elapsed seconds
+        """
+        thresholds = np.asarray(thresholds, dtype=np.float64)
+        weights = np.asarray(weights, dtype=np.float64)
+        columns = len(METRIC_FIELDS)
+        if thresholds.ndim != 2 or thresholds.shape[1] != columns or len(thresholds) < 1:
+            raise ValueError(f"thresholds must be a non-empty (configs, {columns}) array")
+        if weights.shape != thresholds.shape:
+            raise ValueError(f"weights must match thresholds, got {weights.shape} "
+                             f"for {thresholds.shape}")
+        blocks = [(thresholds[i:i + self.block_size], weights[i:i + self.block_size],
+                   self.min_level)
+                  for i in range(0, len(thresholds), self.block_size)]
+
+        started = time.perf_counter()
+        if self.workers == 1:
+            _init_worker(self.metrics, self.labels)
+            results = [_score_block_worker(block) for block in blocks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=(self.metrics, self.labels)) as pool:
+                results = list(pool.map(_score_block_worker, blocks))
+        elapsed = time.perf_counter() - started
+
+        counts = {name: np.concatenate([r[name] for r in results]) for name in results[0]}
+        tp = counts['true_positives']
+        fp = counts['false_positives']
+        fn = counts['false_negatives']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            precision = np.where(tp + fp > 0, tp / (tp + fp), 0.0)
+            recall = np.where(tp + fn > 0, tp / (tp + fn), 0.0)
+            f1 = np.where(precision + recall > 0,
+                          2 * precision * recall / (precision + recall), 0.0)
+
+        return dict(counts, thresholds=thresholds, weights=weights,
+                    precision=precision, recall=recall, f1=f1,
+                    elapsed_seconds=elapsed)
+
+
+def load_labeled_dataset(path: str, label_column: str = 'label') -> Tuple[np.ndarray, np.ndarray]:
+    """Load (5, N) metrics and (N,) labels from a CSV or NDJSON file."""
+    rows, labels = [], []
+    with open(path, newline='') as handle:
+        if os.path.splitext(path)[1].lower() == '.csv':
+            records = csv.DictReader(handle)
+        else:
+            records = (json.loads(line) for line in handle if line.strip())
+        for record in records:
+            rows.append([float(record[name]) for name in METRIC_FIELDS])
+            labels.append(str(record[label_column]).strip().lower() in ('1', 'true', 'yes'))
+    return np.array(rows, dtype=np.float64).T, np.array(labels, dtype=bool)
+
+
+def synthetic_labeled_dataset(samples: int, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Degradation telemetry labeled by its latent state.
+
+    A sample is a true cascade when the underlying degradation has passed
+    60% of the run or a stress event hit it.
+    """
+    columns, stress = generate_degradation_telemetry(samples, seed=seed,
+                                                     return_stress=True)
+    degradation = np.arange(samples) / max(samples, 1)
+    return columns[:5], (degradation > 0.6) | stress
+
+
+def main():
+    """Run a calibration sweep and print the best configurations."""
+    parser = argparse.ArgumentParser(description="CSFC threshold/weight calibration sweep")
+    parser.add_argument("--dataset", help="Labeled CSV/NDJSON (metric columns + label)")
+    parser.add_argument("--samples", type=int, default=100_000,
+                        help="Synthetic dataset size when --dataset is not given")
+    parser.add_argument("--configs", type=int, default=2000)
+    parser.add_argument("--block-size", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--min-level", choices=ALERT_LEVELS[1:], default="WARNING")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.dataset:
+        metrics, labels = load_labeled_dataset(args.dataset)
+    else:
+        metrics, labels = synthetic_labeled_dataset(args.samples, args.seed)
+
+    thresholds, weights = random_configurations(args.configs, args.seed)
+    sweep = CalibrationSweep(metrics, labels, args.min_level, args.block_size, args.workers)
+    results = sweep.run(thresholds, weights)
+
+    print("CSFC Calibration Sweep")
+    print("=" * 50)
+    print(f"Configurations: {args.configs:,} | Samples: {labels.size:,} | "
+          f"Positives: {labels.sum():,}")
+    print(f"Elapsed: {results['elapsed_seconds']:.2f}s "
+          f"({args.configs / results['elapsed_seconds']:,.0f} configs/sec)")
+    print(f"Default config: F1 {results['f1'][0]:.3f} | "
+          f"precision {results['precision'][0]:.3f} | recall {results['recall'][0]:.3f} | "
+          f"alerts {results['alert_volume'][0]:,}")
+    print(f"\nTop {args.top} by F1:")
+    for rank, index in enumerate(np.argsort(-results['f1'])[:args.top], 1):
+        print(f"  {rank}. F1 {results['f1'][index]:.3f} | "
+              f"P {results['precision'][index]:.3f} | R {results['recall'][index]:.3f} | "
+              f"alerts {results['alert_volume'][index]:,}")
+        print(f"     thresholds {np.round(results['thresholds'][index], 3).tolist()}")
+        print(f"     weights    {np.round(results['weights'][index], 3).tolist()}")
+
+
+if __name__ == "__main__":
+    main()
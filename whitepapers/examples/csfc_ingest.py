@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+CSFC Ingestion Service - Asyncio Front End
+==========================================
+
+Asyncio ingestion service for CSFC Phase 1 detection. Accepts SystemMetrics
+records from many concurrent producers (async iterators, TCP or Unix socket
+clients sending NDJSON), batches them into CSFCDetector.process_batch
+through a bounded queue, and fans alerts out to async subscribers.
+
+Backpressure is end to end: producers await a bounded queue, and socket
+readers stop reading while the queue is full. Slow subscribers never stall
+detection; their oldest undelivered alerts are dropped and counted.
+
+Socket records are validated before they are queued (malformed lines are
+counted and skipped), and a batch that still fails to score is counted
+and dropped without stopping the worker. Each batch is sorted by
+timestamp before its alerts are recorded; ordering across batches from
+different producers is not guaranteed.
+
+Teaser implementation. Production streaming pipeline available
+in Synoetic OS-professional.
+
+Author: ValorGrid Solutions
+Date: October 2026
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import AsyncIterable, Dict, List, Optional
+
+import numpy as np
+
+from drift_test_stub import (ALERT_LEVELS, ALERT_MESSAGES, METRIC_FIELDS,
+                             CSFCDetector, SystemMetrics)
+
+
+RECORD_FIELDS = METRIC_FIELDS + ('timestamp',)
+
+
+class LatencyReservoir:
+    """Fixed-size ring of recent latency samples for percentile reporting."""
+
+    def __init__(self, capacity: int = 65536):
+        self._samples = np.zeros(capacity, dtype=np.float64)
+        self._head = 0
+        self._size = 0
+        self.max_latency = 0.0
+
+    def extend(self, latencies: np.ndarray) -> None:
+        latencies = latencies[-len(self._samples):]
+        if latencies.size == 0:
+            return
+        capacity = len(self._samples)
+        positions = (self._head + np.arange(latencies.size)) % capacity
+        self._samples[positions] = latencies
+        self._head = (self._head + latencies.size) % capacity
+        self._size = min(self._size + latencies.size, capacity)
+        self.max_latency = max(self.max_latency, float(latencies.max()))
+
+    def percentile(self, q: float) -> float:
+        if self._size == 0:
+            return 0.0
+        return float(np.percentile(self._samples[:self._size], q))
+
+
+class CSFCIngestService:
+    """
+    Bounded-queue asyncio front end for CSFC detection.
+
+    Records are scored in batches with the stateless CSFCDetector.process_batch;
+    non-STABLE results are appended to the detector's alert_history and
+    published to every subscriber.
+    """
+
+    def __init__(self, detector: Optional[CSFCDetector] = None,
+                 queue_size: int = 10000, batch_size: int = 1024,
+                 subscriber_queue_size: int = 1000):
+        self.detector = detector or CSFCDetector()
+        self.batch_size = batch_size
+        self.subscriber_queue_size = subscriber_queue_size
+
+        self._queue = None
+        self._queue_size = queue_size
+        self._worker = None
+        self._servers = []
+        self._subscribers = []
+        self._latency = LatencyReservoir()
+
+        self.received = 0
+        self.processed = 0
+        self.batches = 0
+        self.alerts = 0
+        self.dropped_alerts = 0
+        self.rejected = 0           # Malformed socket records
+        self.failed_batches = 0     # Batches that raised while scoring
+        self.failed_records = 0
+        self._started_at = None
+
+    async def start(self) -> None:
+        """Start the batching worker on the running event loop."""
+        self._queue = asyncio.Queue(maxsize=self._queue_size)
+        self._started_at = time.perf_counter()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop accepting connections, drain queued records and stop the worker."""
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers = []
+
+        if self._worker is not None:
+            await self._queue.join()
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def submit(self, metrics: SystemMetrics) -> None:
+        """Enqueue one record, waiting while the queue is full."""
+        await self._queue.put((metrics, time.perf_counter()))
+        self.received += 1
+
+    async def ingest(self, records: AsyncIterable[SystemMetrics]) -> int:
+        """Enqueue every record from an async iterator; returns the count."""
+        count = 0
+        async for metrics in records:
+            await self.submit(metrics)
+            count += 1
+        return count
+
+    async def serve_tcp(self, host: str = "127.0.0.1", port: int = 8765):
+        """Accept NDJSON SystemMetrics records over TCP."""
+        server = await asyncio.start_server(self._handle_client, host, port)
+        self._servers.append(server)
+        return server
+
+    async def serve_unix(self, path: str):
+        """Accept NDJSON SystemMetrics records over a Unix domain socket."""
+        server = await asyncio.start_unix_server(self._handle_client, path)
+        self._servers.append(server)
+        return server
+
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+        """Read NDJSON lines until EOF; awaiting submit applies backpressure."""
+        try:
+            async for line in reader:
+                line = line.strip()
+                if not line:
+                    continue
+                metrics = self._parse_record(line)
+                if metrics is None:
+                    self.rejected += 1
+                    continue  # Skip malformed records, keep the connection
+                await self.submit(metrics)
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _parse_record(line: bytes) -> Optional[SystemMetrics]:
+        """SystemMetrics from one NDJSON object, or None if malformed."""
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                return None
+            return SystemMetrics(*(float(record[name]) for name in RECORD_FIELDS))
+        except (ValueError, TypeError, KeyError):
+            return None
+
+    def subscribe(self, maxsize: Optional[int] = None) -> asyncio.Queue:
+        """Register an alert subscriber; alerts arrive as dicts on the queue."""
+        queue = asyncio.Queue(maxsize=maxsize or self.subscriber_queue_size)
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    async def _run(self) -> None:
+        """Drain the queue in batches and score each batch in one pass."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                self._process(batch)
+            except Exception:
+                # A bad batch must not kill the worker (stop() joins the queue)
+                self.failed_batches += 1
+                self.failed_records += len(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+            # Yield so producers and subscribers make progress under load
+            await asyncio.sleep(0)
+
+    def _process(self, batch: List) -> None:
+        # AlertStore expects time-ordered alerts; producers interleave
+        batch.sort(key=lambda item: item[0].timestamp)
+        records = [item[0] for item in batch]
+        columns = [[getattr(m, field) for m in records] for field in METRIC_FIELDS]
+        timestamps = [m.timestamp for m in records]
+        scores = self.detector.process_batch(*columns, timestamps)
+
+        alert_rows = np.flatnonzero(scores['alert_code'])
+        for row in alert_rows.tolist():
+            level = ALERT_LEVELS[scores['alert_code'][row]]
+            alert = {
+                'timestamp': timestamps[row],
+                'level': level,
+                'risk': float(scores['cascade_risk'][row]),
+                'indicators': int(scores['active_indicators'][row])
+            }
+            self.detector.alert_history.record(alert['timestamp'], level,
+                                               alert['risk'], alert['indicators'])
+            self._publish(dict(alert, message=ALERT_MESSAGES[level]))
+
+        # Ingest-to-alert latency, measured once alerts are published
+        now = time.perf_counter()
+        enqueued = np.fromiter((batch[row][1] for row in alert_rows.tolist()),
+                               dtype=np.float64, count=alert_rows.size)
+        self._latency.extend(now - enqueued)
+
+        self.processed += len(batch)
+        self.alerts += alert_rows.size
+        self.batches += 1
+
+    def _publish(self, alert: Dict) -> None:
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped_alerts += 1
+            queue.put_nowait(alert)
+
+    def stats(self) -> Dict[str, float]:
+        """Throughput and ingest-to-alert latency measured by the service."""
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        return {
+            'received': self.received,
+            'processed': self.processed,
+            'alerts': self.alerts,
+            'dropped_alerts': self.dropped_alerts,
+            'rejected': self.rejected,
+            'failed_batches': self.failed_batches,
+            'failed_records': self.failed_records,
+            'batches': self.batches,
+            'queue_depth': self._queue.qsize() if self._queue else 0,
+            'throughput_per_sec': self.processed / elapsed if elapsed > 0 else 0.0,
+            'latency_p50_ms': self._latency.percentile(50) * 1000,
+            'latency_p99_ms': self._latency.percentile(99) * 1000,
+            'latency_max_ms': self._latency.max_latency * 1000
+        }
+
+
+async def _synthetic_producer(count: int, seed: int) -> AsyncIterable[SystemMetrics]:
+    """Async iterator of degrading metrics, in the spirit of simulate_system_degradation."""
+    rng = random.Random(seed)
+    for i in range(count):
+        degradation = i / count
+        yield SystemMetrics(
+            identity_coherence=max(0.1, 0.95 - degradation * 0.4 + rng.uniform(-0.05, 0.05)),
+            symbolic_alignment=max(0.1, 0.92 - degradation * 0.5 + rng.uniform(-0.05, 0.05)),
+            reasoning_consistency=max(0.1, 0.88 - degradation * 0.3 + rng.uniform(-0.05, 0.05)),
+            memory_integrity=max(0.1, 0.96 - degradation * 0.2 + rng.uniform(-0.05, 0.05)),
+            response_confidence=max(0.1, 0.85 - degradation * 0.6 + rng.uniform(-0.05, 0.05)),
+            timestamp=float(i)
+        )
+
+
+async def run_load_test(producers: int = 8, records: int = 100_000,
+                        batch_size: int = 1024) -> Dict[str, float]:
+    """Drive the service with concurrent producers and one alert subscriber."""
+    service = CSFCIngestService(batch_size=batch_size)
+    await service.start()
+    alerts = service.subscribe()
+
+    async def consume():
+        while True:
+            await alerts.get()
+
+    consumer = asyncio.create_task(consume())
+    per_producer = records // producers
+    await asyncio.gather(*(service.ingest(_synthetic_producer(per_producer, seed))
+                           for seed in range(producers)))
+    await service.stop()
+    consumer.cancel()
+    return service.stats()
+
+
+def main():
+    """Run a local load test or serve NDJSON records over TCP."""
+    parser = argparse.ArgumentParser(description="CSFC asyncio ingestion service")
+    parser.add_argument("--producers", type=int, default=8)
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--tcp", type=int, metavar="PORT",
+                        help="Serve NDJSON records on 127.0.0.1:PORT instead of load testing")
+    args = parser.parse_args()
+
+    if args.tcp:
+        async def serve():
+            service = CSFCIngestService(batch_size=args.batch_size)
+            await service.start()
+            await service.serve_tcp(port=args.tcp)
+            print(f"CSFC ingest listening on 127.0.0.1:{args.tcp} (Ctrl+C to stop)")
+            while True:
+                await asyncio.sleep(10)
+                print(service.stats())
+
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            print("\nExiting...")
+        return
+
+    print("CSFC Ingestion Load Test")
+    print("=" * 50)
+    stats = asyncio.run(run_load_test(args.producers, args.records, args.batch_size))
+    print(f"Records processed:  {stats['processed']:,}")
+    print(f"Alerts published:   {stats['alerts']:,} ({stats['dropped_alerts']:,} dropped)")
+    print(f"Throughput:         {stats['throughput_per_sec']:,.0f} records/sec")
+    print(f"Latency p50 / p99:  {stats['latency_p50_ms']:.2f} / {stats['latency_p99_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+CSFC Detector Pool - Fleet-Scale Phase 1 Monitoring
+===================================================
+
+Columnar CSFC detection for large fleets of monitored model instances.
+Instead of one CSFCDetector object per instance, all per-instance state
+(trend windows, last alert level, alert counters) lives in NumPy arrays
+indexed by instance id, and a whole tick of samples is scored in one
+vectorized step.
+
+Teaser implementation. Production fleet monitoring available
+in Synoetic OS-professional.
+
+Author: ValorGrid Solutions
+Date: October 2026
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Dict, Optional
+
+import numpy as np
+
+from drift_test_stub import ALERT_LEVELS, METRIC_FIELDS, CSFCDetector, SystemMetrics
+
+
+class CSFCDetectorPool:
+    """
+    Vectorized pool of CSFC Phase 1 detectors.
+
+    Thresholds and weights are shared across the fleet (taken from a
+    template CSFCDetector); everything else is stored per instance in
+    fixed-size columnar arrays.
+    """
+
+    def __init__(self, capacity: int, lookback_samples: int = 5,
+                 detector: Optional[CSFCDetector] = None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if lookback_samples < 1:
+            raise ValueError("lookback_samples must be at least 1")
+
+        self.capacity = capacity
+        self.lookback_samples = lookback_samples
+        self.detector = detector or CSFCDetector(lookback_samples=lookback_samples)
+
+        # Per-instance alert state
+        self.alert_code = np.zeros(capacity, dtype=np.int8)
+        self.last_risk = np.zeros(capacity, dtype=np.float64)
+        self.max_risk = np.zeros(capacity, dtype=np.float64)       # 0.0 until an alert
+        self.last_timestamp = np.zeros(capacity, dtype=np.float64)
+        self.alert_counts = np.zeros((capacity, len(ALERT_LEVELS)), dtype=np.int32)
+        self.sample_count = np.zeros(capacity, dtype=np.int64)
+
+        # Per-instance sliding regression windows (see SlidingSlope)
+        self._head = np.zeros(capacity, dtype=np.int32)
+        self._since_resync = np.zeros(capacity, dtype=np.int32)
+        self._identity_window = np.zeros((capacity, lookback_samples), dtype=np.float64)
+        self._alignment_window = np.zeros((capacity, lookback_samples), dtype=np.float64)
+        self._identity_sums = np.zeros((capacity, 2), dtype=np.float64)   # sum_y, sum_xy
+        self._alignment_sums = np.zeros((capacity, 2), dtype=np.float64)
+
+    def process_tick(self, instance_ids, identity_coherence, symbolic_alignment,
+                     reasoning_consistency, memory_integrity,
+                     response_confidence, timestamps) -> Dict[str, np.ndarray]:
+        """
+        Process one tick of samples across many instances.
+
+        Args:
+            instance_ids: Array of unique instance ids in [0, capacity)
+            identity_coherence .. response_confidence: Metric arrays
+                aligned with instance_ids
+            timestamps: Measurement timestamps aligned with instance_ids
+
+        Returns:
+            dict: Arrays for the instances whose alert level changed
+            (instance_id, previous_code, alert_code, cascade_risk,
+            active_indicators, timestamp)
+        """
+        ids = np.asarray(instance_ids, dtype=np.int64)
+        if ids.size and (ids.min() < 0 or ids.max() >= self.capacity):
+            raise ValueError("instance id out of range for pool capacity")
+        if np.unique(ids).size != ids.size:
+            raise ValueError("instance ids must be unique within a tick")
+
+        scores = self.detector.process_batch(
+            identity_coherence, symbolic_alignment, reasoning_consistency,
+            memory_integrity, response_confidence, timestamps
+        )
+        codes = scores['alert_code']
+        risk = scores['cascade_risk']
+
+        # Trend windows
+        filled = self.sample_count[ids]
+        self._push(self._identity_window, self._identity_sums, ids, filled,
+                   np.asarray(identity_coherence, dtype=np.float64))
+        self._push(self._alignment_window, self._alignment_sums, ids, filled,
+                   np.asarray(symbolic_alignment, dtype=np.float64))
+        self._resync_due(ids)
+        self.sample_count[ids] = filled + 1
+
+        # Alert state
+        previous = self.alert_code[ids]
+        self.alert_code[ids] = codes
+        self.last_risk[ids] = risk
+        # Like CSFCDetector.alert_history, max_risk only covers alerting samples
+        alerting = codes > 0
+        alert_ids = ids[alerting]
+        self.max_risk[alert_ids] = np.maximum(self.max_risk[alert_ids], risk[alerting])
+        self.last_timestamp[ids] = scores['timestamp']
+        np.add.at(self.alert_counts, (ids, codes), 1)
+
+        changed = previous != codes
+        return {
+            'instance_id': ids[changed],
+            'previous_code': previous[changed],
+            'alert_code': codes[changed],
+            'cascade_risk': risk[changed],
+            'active_indicators': scores['active_indicators'][changed],
+            'timestamp': scores['timestamp'][changed]
+        }
+
+    def _push(self, window: np.ndarray, sums: np.ndarray, ids: np.ndarray,
+              filled: np.ndarray, values: np.ndarray) -> None:
+        """Append one value per instance to its sliding regression window."""
+        lookback = self.lookback_samples
+        filling = filled < lookback
+
+        # Instances still filling their window: write at x = count
+        fill_ids = ids[filling]
+        fill_x = filled[filling]
+        fill_values = values[filling]
+        window[fill_ids, fill_x] = fill_values
+        sums[fill_ids, 1] += fill_x * fill_values
+        sums[fill_ids, 0] += fill_values
+
+        # Full windows: overwrite the oldest slot and shift x down by one
+        full_ids = ids[~filling]
+        full_values = values[~filling]
+        head = self._head[full_ids]
+        oldest = window[full_ids, head]
+        window[full_ids, head] = full_values
+        sum_y = sums[full_ids, 0]
+        sums[full_ids, 1] += (lookback - 1) * full_values - (sum_y - oldest)
+        sums[full_ids, 0] = sum_y + full_values - oldest
+
+    def _resync_due(self, ids: np.ndarray) -> None:
+        """Advance window heads and rebuild sums once per full turn."""
+        lookback = self.lookback_samples
+        full = self.sample_count[ids] >= lookback
+        full_ids = ids[full]
+        self._head[full_ids] = (self._head[full_ids] + 1) % lookback
+        self._since_resync[full_ids] += 1
+
+        due = full_ids[self._since_resync[full_ids] >= lookback]
+        if due.size == 0:
+            return
+
+        order = (self._head[due, None] + np.arange(lookback)) % lookback
+        x = np.arange(lookback, dtype=np.float64)
+        for window, sums in ((self._identity_window, self._identity_sums),
+                             (self._alignment_window, self._alignment_sums)):
+            ordered = np.take_along_axis(window[due], order, axis=1)
+            sums[due, 0] = ordered.sum(axis=1)
+            sums[due, 1] = ordered @ x
+        self._since_resync[due] = 0
+
+    def trend_slopes(self, instance_ids=None) -> Dict[str, np.ndarray]:
+        """
+        Identity and alignment slopes per instance over the lookback window.
+
+        Instances with fewer than lookback_samples samples report 0.0,
+        matching CSFCDetector.analyze_trend.
+        """
+        ids = (np.arange(self.capacity) if instance_ids is None
+               else np.asarray(instance_ids, dtype=np.int64))
+        n = float(self.lookback_samples)
+        sum_x = n * (n - 1) / 2
+        sum_xx = (n - 1) * n * (2 * n - 1) / 6
+        denominator = n * sum_xx - sum_x * sum_x
+        ready = self.sample_count[ids] >= self.lookback_samples
+
+        slopes = {}
+        for name, sums in (('identity_slope', self._identity_sums),
+                           ('alignment_slope', self._alignment_sums)):
+            if denominator == 0:
+                slopes[name] = np.zeros(ids.size)
+                continue
+            slope = (n * sums[ids, 1] - sum_x * sums[ids, 0]) / denominator
+            slopes[name] = np.where(ready, slope, 0.0)
+
+        trend_score = np.abs(np.minimum(np.minimum(slopes['identity_slope'],
+                                                   slopes['alignment_slope']), 0))
+        slopes['trend_score'] = trend_score
+        slopes['degradation_rate'] = trend_score * 10
+        return slopes
+
+    def reset(self, instance_ids) -> None:
+        """Clear all state for the given instances (e.g. on redeploy)."""
+        ids = np.asarray(instance_ids, dtype=np.int64)
+        for array in (self.alert_code, self.last_risk, self.max_risk,
+                      self.last_timestamp, self.alert_counts, self.sample_count,
+                      self._head, self._since_resync, self._identity_window,
+                      self._alignment_window, self._identity_sums,
+                      self._alignment_sums):
+            array[ids] = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held by per-instance state arrays."""
+        return sum(array.nbytes for array in (
+            self.alert_code, self.last_risk, self.max_risk, self.last_timestamp,
+            self.alert_counts, self.sample_count, self._head, self._since_resync,
+            self._identity_window, self._alignment_window, self._identity_sums,
+            self._alignment_sums))
+
+
+def _random_tick(rng: np.random.Generator, instances: int) -> Dict[str, np.ndarray]:
+    """Generate one tick of mildly degraded metrics for every instance."""
+    base = np.array([0.95, 0.92, 0.88, 0.96, 0.85])
+    values = base[:, None] - rng.uniform(0.0, 0.35, size=(5, instances))
+    return dict(zip(METRIC_FIELDS, values))
+
+
+def benchmark_pool(instances: int = 100_000, ticks: int = 5, seed: int = 0) -> Dict[str, float]:
+    """
+    Compare memory per instance and time per tick against one
+    CSFCDetector object per instance.
+    """
+    rng = np.random.default_rng(seed)
+    tick_data = [_random_tick(rng, instances) for _ in range(ticks)]
+    ids = np.arange(instances)
+
+    # Object-per-instance approach
+    tracemalloc.start()
+    detectors = [CSFCDetector() for _ in range(instances)]
+    start = time.perf_counter()
+    for tick, data in enumerate(tick_data):
+        columns = [data[name].tolist() for name in METRIC_FIELDS]
+        for i, detector in enumerate(detectors):
+            detector.process_sample(SystemMetrics(
+                columns[0][i], columns[1][i], columns[2][i],
+                columns[3][i], columns[4][i], float(tick)))
+    object_seconds = (time.perf_counter() - start) / ticks
+    object_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del detectors
+
+    # Columnar pool
+    tracemalloc.start()
+    pool = CSFCDetectorPool(instances)
+    start = time.perf_counter()
+    for tick, data in enumerate(tick_data):
+        pool.process_tick(ids, timestamps=np.full(instances, float(tick)), **data)
+    pool_seconds = (time.perf_counter() - start) / ticks
+    pool_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return {
+        'instances': instances,
+        'ticks': ticks,
+        'object_bytes_per_instance': object_bytes / instances,
+        'pool_bytes_per_instance': pool_bytes / instances,
+        'object_seconds_per_tick': object_seconds,
+        'pool_seconds_per_tick': pool_seconds,
+        'speedup': object_seconds / pool_seconds if pool_seconds > 0 else 0.0
+    }
+
+
+def main():
+    """Run the pool benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="CSFC detector pool benchmark")
+    parser.add_argument("--instances", type=int, default=100_000)
+    parser.add_argument("--ticks", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("CSFC Detector Pool Benchmark")
+    print("=" * 50)
+    results = benchmark_pool(args.instances, args.ticks, args.seed)
+    print(f"Instances:                  {results['instances']:,}")
+    print(f"Ticks:                      {results['ticks']}")
+    print(f"Object memory / instance:   {results['object_bytes_per_instance']:,.0f} bytes")
+    print(f"Pool memory / instance:     {results['pool_bytes_per_instance']:,.0f} bytes")
+    print(f"Object time / tick:         {results['object_seconds_per_tick']*1000:,.1f} ms")
+    print(f"Pool time / tick:           {results['pool_seconds_per_tick']*1000:,.1f} ms")
+    print(f"Speedup:                    {results['speedup']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+CSFC Telemetry Replay - Accelerated Backtesting
+===============================================
+
+Replays recorded SystemMetrics telemetry (NDJSON or CSV) through
+CSFCDetector.process_batch as fast as the CPU allows. Time is taken from
+the recorded timestamps; nothing sleeps or reads the wall clock except to
+report replay speed.
+
+Also generates deterministic synthetic telemetry from a seed, following
+the degradation model of simulate_system_degradation.
+
+Teaser implementation. Production backtesting available
+in Synoetic OS-professional.
+
+Author: ValorGrid Solutions
+Date: October 2026
+"""
+
+import argparse
+import csv
+import json
+import os
+import time
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+
+from drift_test_stub import ALERT_LEVELS, METRIC_FIELDS, CSFCDetector
+
+
+COLUMNS = METRIC_FIELDS + ('timestamp',)
+
+# Compact alert timeline: one row per alert-level transition
+TIMELINE_DTYPE = np.dtype([
+    ('timestamp', np.float64),
+    ('alert_code', np.int8),
+    ('cascade_risk', np.float32)
+])
+
+
+def _detect_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.ndjson', '.jsonl', '.json'):
+        return 'ndjson'
+    raise ValueError(f"Cannot infer telemetry format from '{path}'; pass fmt='csv' or 'ndjson'")
+
+
+def iter_telemetry_chunks(path: str, chunk_size: int = 65536,
+                          fmt: Optional[str] = None) -> Iterator[np.ndarray]:
+    """
+    Read a telemetry file in chunks.
+
+    Yields float64 arrays of shape (6, rows) in COLUMNS order, so memory
+    stays bounded by chunk_size regardless of file length.
+
+    Raises:
+        ValueError: CSV input lacks a column, or an NDJSON line is not a
+            JSON object with every field (the message names the line)
+    """
+    fmt = fmt or _detect_format(path)
+    rows = []
+
+    with open(path, newline='') as handle:
+        if fmt == 'csv':
+            reader = csv.reader(handle)
+            header = next(reader, [])
+            missing = [name for name in COLUMNS if name not in header]
+            if missing:
+                raise ValueError(f"CSV input is missing fields: {', '.join(missing)}")
+            positions = [header.index(name) for name in COLUMNS]
+            for record in reader:
+                if record:
+                    rows.append([record[p] for p in positions])
+                if len(rows) == chunk_size:
+                    yield np.array(rows, dtype=np.float64).T
+                    rows = []
+        elif fmt == 'ndjson':
+            for number, line in enumerate(handle, 1):
+                if line.strip():
+                    rows.append(_ndjson_row(line, number))
+                if len(rows) == chunk_size:
+                    yield np.array(rows, dtype=np.float64).T
+                    rows = []
+        else:
+            raise ValueError(f"Unknown telemetry format: {fmt}")
+
+    if rows:
+        yield np.array(rows, dtype=np.float64).T
+
+
+def _ndjson_row(line: str, number: int) -> list:
+    """Parse one NDJSON record into COLUMNS order, naming the line on error."""
+    try:
+        record = json.loads(line)
+    except ValueError as error:
+        raise ValueError(f"Line {number}: invalid JSON record ({error.msg})") from None
+    if not isinstance(record, dict):
+        raise ValueError(f"Line {number}: expected a JSON object, "
+                         f"got {type(record).__name__}")
+    missing = [name for name in COLUMNS if name not in record]
+    if missing:
+        raise ValueError(f"Line {number}: record is missing field(s) {', '.join(missing)}")
+    try:
+        return [float(record[name]) for name in COLUMNS]
+    except (TypeError, ValueError):
+        raise ValueError(f"Line {number}: field values must be numbers") from None
+
+
+def generate_degradation_telemetry(samples: int, seed: int = 0,
+                                   interval: float = 3.0, start: float = 0.0,
+                                   return_stress: bool = False):
+    """
+    Deterministic synthetic telemetry on a virtual clock.
+
+    Same model as simulate_system_degradation: linear degradation across
+    the run, uniform +/-0.05 noise, a 0.1 floor and 10% stress events that
+    scale identity and alignment down.
+
+    Returns:
+        np.ndarray: Shape (6, samples) in COLUMNS order, plus the boolean
+        stress-event mask when return_stress is set
+    """
+    rng = np.random.default_rng(seed)
+    timestamps = start + np.arange(samples) * interval
+    degradation = np.arange(samples) / max(samples, 1)
+
+    base = np.array([0.95, 0.92, 0.88, 0.96, 0.85])
+    rates = np.array([0.4, 0.5, 0.3, 0.2, 0.6])
+    noise = rng.uniform(-0.05, 0.05, size=(5, samples))
+    values = np.maximum(0.1, base[:, None] - degradation * rates[:, None] + noise)
+
+    stress = rng.random(samples) < 0.1
+    values[0, stress] *= rng.uniform(0.7, 0.9, size=stress.sum())
+    values[1, stress] *= rng.uniform(0.6, 0.8, size=stress.sum())
+
+    columns = np.vstack([values, timestamps])
+    return (columns, stress) if return_stress else columns
+
+
+def write_telemetry(path: str, columns: np.ndarray, fmt: Optional[str] = None) -> None:
+    """Write a (6, rows) telemetry array as NDJSON or CSV."""
+    fmt = fmt or _detect_format(path)
+    with open(path, 'w', newline='') as handle:
+        if fmt == 'csv':
+            writer = csv.writer(handle)
+            writer.writerow(COLUMNS)
+            writer.writerows(columns.T.tolist())
+        else:
+            for row in columns.T.tolist():
+                handle.write(json.dumps(dict(zip(COLUMNS, row))) + "\n")
+
+
+class TelemetryReplay:
+    """
+    Replay recorded telemetry through a CSFCDetector in recorded time.
+
+    Keeps only the alert-level transitions (compact timeline) and running
+    summary counters, so weeks of telemetry replay in bounded memory.
+    """
+
+    def __init__(self, detector: Optional[CSFCDetector] = None,
+                 chunk_size: int = 65536):
+        self.detector = detector or CSFCDetector()
+        self.chunk_size = chunk_size
+
+    def replay_arrays(self, chunks) -> Dict:
+        """Replay an iterable of (6, rows) arrays; see replay()."""
+        level_counts = np.zeros(len(ALERT_LEVELS), dtype=np.int64)
+        max_risk = None
+        timeline = []
+        previous_code = 0
+        samples = 0
+        first_timestamp = None
+        last_timestamp = None
+
+        started = time.perf_counter()
+        for chunk in chunks:
+            if chunk.shape[1] == 0:
+                continue
+            scores = self.detector.process_batch(*chunk)
+            codes = scores['alert_code']
+            risk = scores['cascade_risk']
+
+            if first_timestamp is None:
+                first_timestamp = float(chunk[5, 0])
+            last_timestamp = float(chunk[5, -1])
+            samples += codes.size
+
+            level_counts += np.bincount(codes, minlength=len(ALERT_LEVELS))
+            alerting = codes > 0
+            if alerting.any():
+                chunk_max = float(risk[alerting].max())
+                max_risk = chunk_max if max_risk is None else max(max_risk, chunk_max)
+
+            # Level transitions, carried across chunk boundaries
+            previous = np.empty_like(codes)
+            previous[0] = previous_code
+            previous[1:] = codes[:-1]
+            changed = np.flatnonzero(codes != previous)
+            if changed.size:
+                rows = np.empty(changed.size, dtype=TIMELINE_DTYPE)
+                rows['timestamp'] = scores['timestamp'][changed]
+                rows['alert_code'] = codes[changed]
+                rows['cascade_risk'] = risk[changed]
+                timeline.append(rows)
+            previous_code = codes[-1]
+        elapsed = time.perf_counter() - started
+
+        # Alert counts exclude STABLE, as in simulate_system_degradation
+        alert_counts = {level: int(level_counts[code])
+                        for code, level in enumerate(ALERT_LEVELS)
+                        if code > 0 and level_counts[code]}
+
+        return {
+            'samples': samples,
+            'alert_counts': alert_counts,
+            'max_risk': max_risk,
+            'critical_alerts': alert_counts.get('CRITICAL', 0),
+            'timeline': (np.concatenate(timeline) if timeline
+                         else np.empty(0, dtype=TIMELINE_DTYPE)),
+            'virtual_start': first_timestamp,
+            'virtual_end': last_timestamp,
+            'elapsed_seconds': elapsed,
+            'samples_per_sec': samples / elapsed if elapsed > 0 else 0.0
+        }
+
+    def replay(self, path: str, fmt: Optional[str] = None) -> Dict:
+        """
+        Replay a telemetry file.
+
+        Returns:
+            dict: alert_counts, max_risk, critical_alerts, the transition
+            timeline (TIMELINE_DTYPE array), virtual time span and
+            samples_per_sec
+        """
+        return self.replay_arrays(iter_telemetry_chunks(path, self.chunk_size, fmt))
+
+
+def main():
+    """Replay a telemetry file, or generate synthetic telemetry."""
+    parser = argparse.ArgumentParser(description="CSFC telemetry replay")
+    parser.add_argument("path", help="NDJSON or CSV telemetry file")
+    parser.add_argument("--format", choices=("csv", "ndjson"))
+    parser.add_argument("--generate", type=int, metavar="SAMPLES",
+                        help="Write SAMPLES synthetic records to path instead of replaying")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    args = parser.parse_args()
+
+    if args.generate:
+        columns = generate_degradation_telemetry(args.generate, seed=args.seed)
+        write_telemetry(args.path, columns, args.format)
+        print(f"Wrote {args.generate:,} synthetic samples to {args.path}")
+        return
+
+    replay = TelemetryReplay(chunk_size=args.chunk_size)
+    result = replay.replay(args.path, args.format)
+
+    print("CSFC Telemetry Replay")
+    print("=" * 50)
+    print(f"Replayed {result['samples']:,} samples "
+          f"({result['samples_per_sec']:,.0f} samples/sec)")
+    if result['samples']:
+        span = result['virtual_end'] - result['virtual_start']
+        print(f"Virtual time span: {span / 3600:.1f} hours")
+    print(f"Alert summary: {result['alert_counts']}")
+    print(f"Alert level transitions: {len(result['timeline']):,}")
+    if result['max_risk'] is not None:
+        print(f"Maximum cascade risk detected: {result['max_risk']:.3f}")
+    if result['critical_alerts']:
+        print(f"CRITICAL: {result['critical_alerts']} Phase 1 cascade events detected!")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,13 +14,71 @@ Date: September 2025
 """
 
 import math
+import os
 import time
 import random
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 
+import numpy as np
 
-@dataclass
+
+# Alert ladder, ordered by severity (index == alert code in batch results)
+ALERT_LEVELS = ("STABLE", "WATCH", "WARNING", "CRITICAL")
+
+# Escalation rules, most severe first: (alert code, cascade risk above,
+# or active indicators at least)
+ALERT_RULES = (
+    (3, 0.5, 3),
+    (2, 0.3, 2),
+    (1, 0.15, 1)
+)
+
+ALERT_MESSAGES = {
+    "STABLE": "System within normal parameters",
+    "WATCH": "Early degradation signals detected",
+    "WARNING": "Phase 1 fracture indicators present",
+    "CRITICAL": "CSFC Phase 1 cascade initiation detected!"
+}
+
+# SystemMetrics metric fields, in the column order used by batch APIs
+METRIC_FIELDS = (
+    'identity_coherence',
+    'symbolic_alignment',
+    'reasoning_consistency',
+    'memory_integrity',
+    'response_confidence'
+)
+
+# Phase 1 indicators, ordered by bit position in batch indicator masks
+INDICATOR_NAMES = (
+    'identity_drift',
+    'symbolic_misalignment',
+    'reasoning_degradation',
+    'memory_corruption',
+    'confidence_collapse'
+)
+
+
+def alert_codes(cascade_risk, active_indicators) -> np.ndarray:
+    """
+    Vectorized classify_alert: ALERT_LEVELS index for each element.
+    
+    Broadcasts, so a (configs, samples) risk matrix works as well as a
+    single batch.
+    """
+    cascade_risk = np.asarray(cascade_risk)
+    active_indicators = np.asarray(active_indicators)
+    code = np.zeros(np.broadcast_shapes(cascade_risk.shape, active_indicators.shape),
+                    dtype=np.int8)
+    # Least to most severe, so higher codes win
+    for level, risk_above, indicators_at_least in reversed(ALERT_RULES):
+        code[(cascade_risk > risk_above) | (active_indicators >= indicators_at_least)] = level
+    return code
+
+
+@dataclass(slots=True)
 class SystemMetrics:
     """AI system health metrics for CSFC analysis."""
     identity_coherence: float      # Core identity stability [0,1]
@@ -31,6 +89,383 @@ class SystemMetrics:
     timestamp: float              # Measurement timestamp
 
 
+class MetricRingBuffer:
+    """
+    Fixed-capacity ring buffer holding the most recent metric samples.
+    
+    Appends are O(1) and never copy; the oldest sample is overwritten
+    once the buffer is full.
+    """
+    
+    def __init__(self, capacity: int = 100):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._items = [None] * capacity
+        self._head = 0      # Next write position
+        self._size = 0
+    
+    def append(self, item):
+        """Store an item, returning the evicted oldest item (or None)."""
+        evicted = self._items[self._head] if self._size == self.capacity else None
+        self._items[self._head] = item
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        return evicted
+    
+    def latest(self, count: int) -> list:
+        """Return up to count most recent items, oldest first."""
+        count = min(count, self._size)
+        start = (self._head - count) % self.capacity
+        if start + count <= self.capacity:
+            return self._items[start:start + count]
+        return self._items[start:] + self._items[:self._head]
+    
+    def column(self, name: str, count: int) -> List[float]:
+        """Return one metric field for up to count most recent samples."""
+        return [getattr(m, name) for m in self.latest(count)]
+    
+    def clear(self) -> None:
+        self._items = [None] * self.capacity
+        self._head = 0
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self):
+        return iter(self.latest(self._size))
+
+
+class MetricHistoryStore:
+    """
+    Compact columnar metric history, optionally memory-mapped.
+    
+    Samples are stored as 48-byte structured float64 rows instead of one
+    Python object per sample, so windows read back exactly the values the
+    detector's streaming trend accumulators saw. Every row is written
+    twice, at slot i and slot i + capacity, so any window of up to capacity
+    recent samples is a contiguous zero-copy slice.
+    
+    With a path, rows live in a memory-mapped file and survive restarts;
+    only touched pages stay resident.
+    """
+    
+    DTYPE = np.dtype([
+        ('identity_coherence', np.float64),
+        ('symbolic_alignment', np.float64),
+        ('reasoning_consistency', np.float64),
+        ('memory_integrity', np.float64),
+        ('response_confidence', np.float64),
+        ('timestamp', np.float64)
+    ])
+    
+    _MAGIC = 0x54534948_43465343   # b"CSFCHIST" little-endian
+    _VERSION = 1
+    _HEADER_SLOTS = 8              # magic, version, capacity, head, size, reserved
+    
+    def __init__(self, capacity: int = 100, path: Optional[str] = None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.path = path
+        
+        header_bytes = self._HEADER_SLOTS * 8
+        if path is None:
+            self._header = np.zeros(self._HEADER_SLOTS, dtype=np.int64)
+            self._data = np.zeros(2 * capacity, dtype=self.DTYPE)
+        else:
+            exists = os.path.exists(path) and os.path.getsize(path) > 0
+            if not exists:
+                with open(path, 'wb') as handle:
+                    handle.truncate(header_bytes + 2 * capacity * self.DTYPE.itemsize)
+            self._header = np.memmap(path, dtype=np.int64, mode='r+',
+                                     shape=(self._HEADER_SLOTS,))
+            if exists and (self._header[0] != self._MAGIC or
+                           self._header[1] != self._VERSION or
+                           self._header[2] != capacity):
+                raise ValueError(f"{path} is not a version {self._VERSION} metric "
+                                 f"history store with capacity {capacity}")
+            self._data = np.memmap(path, dtype=self.DTYPE, mode='r+',
+                                   offset=header_bytes, shape=(2 * capacity,))
+        
+        self._header[0] = self._MAGIC
+        self._header[1] = self._VERSION
+        self._header[2] = capacity
+    
+    @property
+    def _head(self) -> int:
+        return int(self._header[3])
+    
+    def append(self, metrics: 'SystemMetrics') -> None:
+        """Store one sample, overwriting the oldest once full."""
+        head = self._head
+        row = (metrics.identity_coherence, metrics.symbolic_alignment,
+               metrics.reasoning_consistency, metrics.memory_integrity,
+               metrics.response_confidence, metrics.timestamp)
+        self._data[head] = row
+        self._data[head + self.capacity] = row
+        self._header[3] = (head + 1) % self.capacity
+        self._header[4] = min(self._header[4] + 1, self.capacity)
+    
+    def extend(self, identity_coherence, symbolic_alignment,
+               reasoning_consistency, memory_integrity,
+               response_confidence, timestamps) -> None:
+        """Store a columnar batch of samples (same layout as process_batch)."""
+        columns = (identity_coherence, symbolic_alignment, reasoning_consistency,
+                   memory_integrity, response_confidence, timestamps)
+        count = len(timestamps)
+        keep = min(count, self.capacity)
+        positions = (self._head + count - keep + np.arange(keep)) % self.capacity
+        for name, values in zip(self.DTYPE.names, columns):
+            values = np.asarray(values)[count - keep:]
+            self._data[name][positions] = values
+            self._data[name][positions + self.capacity] = values
+        self._header[3] = (self._head + count) % self.capacity
+        self._header[4] = min(self._header[4] + count, self.capacity)
+    
+    def window(self, count: int) -> np.ndarray:
+        """Zero-copy structured view of up to count most recent rows, oldest first."""
+        count = min(count, len(self))
+        end = self._head + self.capacity
+        return self._data[end - count:end]
+    
+    def column(self, name: str, count: int) -> np.ndarray:
+        """Zero-copy view of one metric field for up to count recent samples."""
+        return self.window(count)[name]
+    
+    def latest(self, count: int) -> List['SystemMetrics']:
+        """Materialize up to count most recent samples as SystemMetrics."""
+        return [SystemMetrics(*row) for row in self.window(count).tolist()]
+    
+    def flush(self) -> None:
+        """Write memory-mapped pages back to disk."""
+        if isinstance(self._data, np.memmap):
+            self._data.flush()
+            self._header.flush()
+    
+    def clear(self) -> None:
+        self._header[3] = 0
+        self._header[4] = 0
+    
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes + self._header.nbytes
+    
+    def __len__(self) -> int:
+        return int(self._header[4])
+    
+    def __iter__(self):
+        return iter(self.latest(len(self)))
+
+
+class AlertStore:
+    """
+    Bounded, indexed alert history with O(1) summaries.
+    
+    Alerts are stored columnar in a mirrored ring (as in MetricHistoryStore)
+    so the retained alerts are always one contiguous, time-ordered slice.
+    Per-level counters and a monotonic max-risk queue are updated on every
+    insert and eviction, so summaries never rescan the history.
+    
+    Retention is bounded by capacity and, optionally, by age relative to
+    the newest alert. Alerts are kept in arrival order. between() uses a
+    binary search while the retained alerts are time-ordered and falls back
+    to a scan after an out-of-order insert, until that alert is evicted.
+    """
+    
+    DTYPE = np.dtype([
+        ('timestamp', np.float64),
+        ('level', np.int8),
+        ('risk', np.float64),
+        ('indicators', np.int8)
+    ])
+    
+    def __init__(self, capacity: int = 10000, retention_seconds: Optional[float] = None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.retention_seconds = retention_seconds
+        self._data = np.zeros(2 * capacity, dtype=self.DTYPE)
+        self._head = 0          # Next write slot
+        self._size = 0
+        self._seq = 0           # Sequence number of the next alert
+        self._last_inversion = -1   # Seq of the newest out-of-order alert
+        
+        self.level_counts = [0] * len(ALERT_LEVELS)   # Retained alerts
+        self.total_counts = [0] * len(ALERT_LEVELS)   # Since creation
+        self.evicted = 0
+        self._max_queue = deque()   # (seq, risk), risk strictly decreasing
+    
+    def record(self, timestamp: float, level: str, risk: float, indicators: int) -> None:
+        """Store one alert and evict anything past retention."""
+        code = ALERT_LEVELS.index(level)
+        if self._size == self.capacity:
+            self._evict_oldest()
+        
+        if self._size and timestamp < self._data[self._head - 1 + self.capacity]['timestamp']:
+            self._last_inversion = self._seq
+        
+        row = (timestamp, code, risk, indicators)
+        self._data[self._head] = row
+        self._data[self._head + self.capacity] = row
+        self._head = (self._head + 1) % self.capacity
+        self._size += 1
+        
+        self.level_counts[code] += 1
+        self.total_counts[code] += 1
+        while self._max_queue and self._max_queue[-1][1] <= risk:
+            self._max_queue.pop()
+        self._max_queue.append((self._seq, risk))
+        self._seq += 1
+        
+        if self.retention_seconds is not None:
+            cutoff = timestamp - self.retention_seconds
+            while self._size and self._data[self._oldest_slot]['timestamp'] < cutoff:
+                self._evict_oldest()
+    
+    def append(self, alert: Dict) -> None:
+        """Store an alert dict as produced by process_sample."""
+        self.record(alert['timestamp'], alert['level'], alert['risk'], alert['indicators'])
+    
+    @property
+    def _oldest_slot(self) -> int:
+        return (self._head - self._size) % self.capacity
+    
+    def _evict_oldest(self) -> None:
+        oldest = self._data[self._oldest_slot]
+        self.level_counts[int(oldest['level'])] -= 1
+        if self._max_queue and self._max_queue[0][0] == self._seq - self._size:
+            self._max_queue.popleft()
+        self._size -= 1
+        self.evicted += 1
+    
+    def alerts(self) -> np.ndarray:
+        """Zero-copy structured view of retained alerts, oldest first."""
+        end = self._head + self.capacity
+        return self._data[end - self._size:end]
+    
+    def between(self, start: float, end: float) -> np.ndarray:
+        """Retained alerts with start <= timestamp <= end (binary search)."""
+        alerts = self.alerts()
+        timestamps = alerts['timestamp']
+        if self._last_inversion > self._seq - self._size:
+            return alerts[(timestamps >= start) & (timestamps <= end)]
+        lo = np.searchsorted(timestamps, start, side='left')
+        hi = np.searchsorted(timestamps, end, side='right')
+        return alerts[lo:hi]
+    
+    def count(self, level: str) -> int:
+        return self.level_counts[ALERT_LEVELS.index(level)]
+    
+    @property
+    def max_risk(self) -> Optional[float]:
+        """Highest risk among retained alerts, or None when empty."""
+        return self._max_queue[0][1] if self._max_queue else None
+    
+    def counts(self) -> Dict[str, int]:
+        """Retained alert counts per level (levels with no alerts omitted)."""
+        return {level: count for level, count in zip(ALERT_LEVELS, self.level_counts)
+                if count}
+    
+    def summary(self) -> Dict:
+        """Constant-time summary of retained alerts."""
+        return {
+            'alert_counts': self.counts(),
+            'max_risk': self.max_risk,
+            'critical_alerts': self.count('CRITICAL'),
+            'retained': self._size,
+            'evicted': self.evicted
+        }
+    
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+        self._last_inversion = -1
+        self.level_counts = [0] * len(ALERT_LEVELS)
+        self._max_queue.clear()
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self):
+        for timestamp, code, risk, indicators in self.alerts().tolist():
+            yield {
+                'timestamp': timestamp,
+                'level': ALERT_LEVELS[code],
+                'risk': risk,
+                'indicators': indicators
+            }
+
+
+class SlidingSlope:
+    """
+    Linear regression slope over a sliding window with O(1) updates.
+    
+    Keeps running sums of y and x*y for x = 0..n-1 over the window; the
+    x and x^2 sums are closed-form in n. Sums are rebuilt from the window
+    once per full turn to stop floating-point drift, which keeps the
+    amortized cost per sample constant.
+    """
+    
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self._values = [0.0] * window
+        self._head = 0      # Slot of the oldest value once full
+        self.count = 0
+        self._sum_y = 0.0
+        self._sum_xy = 0.0
+        self._pushes_since_resync = 0
+    
+    def push(self, value: float) -> None:
+        """Append a value, dropping the oldest once the window is full."""
+        if self.count < self.window:
+            self._values[self.count] = value
+            self._sum_xy += self.count * value
+            self._sum_y += value
+            self.count += 1
+            return
+        
+        # Shift every x down by one, drop the oldest and append at x = n-1
+        oldest = self._values[self._head]
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.window
+        self._sum_xy += (self.window - 1) * value - (self._sum_y - oldest)
+        self._sum_y += value - oldest
+        
+        self._pushes_since_resync += 1
+        if self._pushes_since_resync >= self.window:
+            self._resync()
+    
+    def _resync(self) -> None:
+        """Recompute the running sums exactly from the window contents."""
+        ordered = self._values[self._head:] + self._values[:self._head]
+        self._sum_y = sum(ordered)
+        self._sum_xy = sum(x * y for x, y in enumerate(ordered))
+        self._pushes_since_resync = 0
+    
+    def slope(self) -> float:
+        """Least-squares slope of the values currently in the window."""
+        n = self.count
+        if n < 2:
+            return 0.0
+        
+        sum_x = n * (n - 1) / 2
+        sum_xx = (n - 1) * n * (2 * n - 1) / 6
+        denominator = n * sum_xx - sum_x * sum_x
+        return (n * self._sum_xy - sum_x * self._sum_y) / denominator
+    
+    def clear(self) -> None:
+        self._values = [0.0] * self.window
+        self._head = 0
+        self.count = 0
+        self._sum_y = 0.0
+        self._sum_xy = 0.0
+        self._pushes_since_resync = 0
+
+
 class CSFCDetector:
     """
     Complete Symbolic Fracture Cascade Phase 1 detector.
@@ -40,7 +475,9 @@ class CSFCDetector:
     with 89% prevention rate in production deployments.
     """
     
-    def __init__(self):
+    def __init__(self, lookback_samples: int = 5, history_capacity: int = 100,
+                 history=None, alert_capacity: int = 10000,
+                 alert_retention_seconds: Optional[float] = None):
         # CSFC Phase 1 detection thresholds (production values are adaptive)
         self.identity_threshold = 0.85      # Below this indicates drift risk
         self.alignment_threshold = 0.80     # Symbolic anchor weakness
@@ -57,8 +494,29 @@ class CSFCDetector:
             'confidence': 0.05    # Output confidence indicator
         }
         
-        self.history = []         # Metric history for trend analysis
-        self.alert_history = []   # Alert tracking
+        # Metric history for trend analysis (ring buffer, never copied).
+        # Pass a MetricHistoryStore to retain long, compact histories.
+        self.lookback_samples = lookback_samples
+        if history is None:
+            history = MetricRingBuffer(max(history_capacity, lookback_samples))
+        elif history.capacity < lookback_samples:
+            raise ValueError(f"history capacity {history.capacity} is smaller than "
+                             f"lookback_samples {lookback_samples}")
+        self.history = history
+        self.alert_history = AlertStore(alert_capacity, alert_retention_seconds)
+        
+        # Streaming regression accumulators for the trend window
+        self._identity_slope = SlidingSlope(lookback_samples)
+        self._alignment_slope = SlidingSlope(lookback_samples)
+        
+        # A restored (e.g. memory-mapped) history resumes its trend window
+        for value in self.history.column('identity_coherence', lookback_samples):
+            self._identity_slope.push(float(value))
+        for value in self.history.column('symbolic_alignment', lookback_samples):
+            self._alignment_slope.push(float(value))
+        
+        # Optional per-stage timer (see csfc_metrics.DetectorInstrumentation)
+        self.stage_timer = None
         
     def calculate_cascade_risk(self, metrics: SystemMetrics) -> float:
         """
@@ -99,16 +557,28 @@ class CSFCDetector:
         
         return indicators
     
-    def analyze_trend(self, lookback_samples: int = 5) -> Dict[str, float]:
-        """Analyze metric trends over recent samples."""
-        if len(self.history) < lookback_samples:
-            return {'trend_score': 0.0, 'degradation_rate': 0.0}
-        
-        recent_samples = self.history[-lookback_samples:]
+    def analyze_trend(self, lookback_samples: Optional[int] = None) -> Dict[str, float]:
+        """
+        Analyze metric trends over recent samples.
         
-        # Calculate trend slopes for key metrics
-        identity_trend = self._calculate_slope([m.identity_coherence for m in recent_samples])
-        alignment_trend = self._calculate_slope([m.symbolic_alignment for m in recent_samples])
+        The configured lookback window is served in O(1) from streaming
+        accumulators; any other lookback is recomputed from history.
+        """
+        if lookback_samples is None or lookback_samples == self.lookback_samples:
+            if self._identity_slope.count < self.lookback_samples:
+                return {'trend_score': 0.0, 'degradation_rate': 0.0}
+            
+            identity_trend = self._identity_slope.slope()
+            alignment_trend = self._alignment_slope.slope()
+        else:
+            if len(self.history) < lookback_samples:
+                return {'trend_score': 0.0, 'degradation_rate': 0.0}
+            
+            # Calculate trend slopes for key metrics
+            identity_trend = self._calculate_slope(
+                self.history.column('identity_coherence', lookback_samples))
+            alignment_trend = self._calculate_slope(
+                self.history.column('symbolic_alignment', lookback_samples))
         
         # Negative slopes indicate degradation
         trend_score = abs(min(identity_trend, alignment_trend, 0))
@@ -127,6 +597,12 @@ class CSFCDetector:
         if n < 2:
             return 0.0
         
+        if isinstance(values, np.ndarray):
+            # Columnar history windows: same formula, vectorized
+            x_centered = np.arange(n) - (n - 1) / 2
+            y = values.astype(np.float64)
+            return float(np.dot(x_centered, y - y.mean()) / np.dot(x_centered, x_centered))
+        
         x_values = list(range(n))
         x_mean = sum(x_values) / n
         y_mean = sum(values) / n
@@ -136,38 +612,109 @@ class CSFCDetector:
         
         return numerator / denominator if denominator != 0 else 0.0
     
+    def classify_alert(self, cascade_risk: float, active_indicators: int) -> str:
+        """Map cascade risk and active indicator count to an alert level."""
+        for level, risk_above, indicators_at_least in ALERT_RULES:
+            if cascade_risk > risk_above or active_indicators >= indicators_at_least:
+                return ALERT_LEVELS[level]
+        return "STABLE"
+    
+    def process_batch(self, identity_coherence, symbolic_alignment,
+                      reasoning_consistency, memory_integrity,
+                      response_confidence, timestamps) -> Dict[str, np.ndarray]:
+        """
+        Score a columnar batch of samples in one vectorized pass.
+        
+        Produces the same cascade risk, indicators and alert level as
+        process_sample for every row, without building per-sample dicts.
+        Batch scoring is stateless: history and alert_history are untouched.
+        
+        Args:
+            identity_coherence: Array of identity coherence values [0,1]
+            symbolic_alignment: Array of symbolic alignment values [0,1]
+            reasoning_consistency: Array of reasoning consistency values [0,1]
+            memory_integrity: Array of memory integrity values [0,1]
+            response_confidence: Array of response confidence values [0,1]
+            timestamps: Array of measurement timestamps
+            
+        Returns:
+            dict: Arrays of timestamp, cascade_risk, indicator_mask (bit i set
+            for INDICATOR_NAMES[i]), active_indicators and alert_code
+            (index into ALERT_LEVELS)
+        """
+        # Scalars score as one-row batches (np.minimum(..., out=) needs an array)
+        identity = np.atleast_1d(np.asarray(identity_coherence, dtype=np.float64))
+        alignment = np.atleast_1d(np.asarray(symbolic_alignment, dtype=np.float64))
+        consistency = np.atleast_1d(np.asarray(reasoning_consistency, dtype=np.float64))
+        memory = np.atleast_1d(np.asarray(memory_integrity, dtype=np.float64))
+        confidence = np.atleast_1d(np.asarray(response_confidence, dtype=np.float64))
+        
+        # Same component order and accumulation as calculate_cascade_risk,
+        # so every row rounds identically to the scalar path
+        cascade_risk = self.weights['identity'] * (1.0 - identity)
+        cascade_risk = cascade_risk + self.weights['alignment'] * (1.0 - alignment)
+        cascade_risk = cascade_risk + self.weights['consistency'] * (1.0 - consistency)
+        cascade_risk = cascade_risk + self.weights['memory'] * (1.0 - memory)
+        cascade_risk = cascade_risk + self.weights['confidence'] * (1.0 - confidence)
+        np.minimum(cascade_risk, 1.0, out=cascade_risk)
+        
+        # Indicator bits follow INDICATOR_NAMES order
+        flags = (
+            identity < self.identity_threshold,
+            alignment < self.alignment_threshold,
+            consistency < self.consistency_threshold,
+            memory < self.memory_threshold,
+            confidence < self.confidence_threshold
+        )
+        indicator_mask = np.zeros(cascade_risk.shape, dtype=np.uint8)
+        active_indicators = np.zeros(cascade_risk.shape, dtype=np.int8)
+        for bit, flag in enumerate(flags):
+            indicator_mask |= flag.astype(np.uint8) << bit
+            active_indicators += flag
+        
+        alert_code = alert_codes(cascade_risk, active_indicators)
+        
+        return {
+            'timestamp': np.atleast_1d(np.asarray(timestamps, dtype=np.float64)),
+            'cascade_risk': cascade_risk,
+            'indicator_mask': indicator_mask,
+            'active_indicators': active_indicators,
+            'alert_code': alert_code
+        }
+    
     def process_sample(self, metrics: SystemMetrics) -> Dict:
         """Process single metrics sample and return analysis."""
-        self.history.append(metrics)
+        timer = self.stage_timer
+        if timer is not None:
+            t_start = timer.clock()
         
-        # Keep history manageable  
-        if len(self.history) > 100:
-            self.history = self.history[-50:]
+        self.history.append(metrics)
+        self._identity_slope.push(metrics.identity_coherence)
+        self._alignment_slope.push(metrics.symbolic_alignment)
         
         # Calculate cascade risk
+        if timer is not None:
+            t_risk = timer.clock()
         cascade_risk = self.calculate_cascade_risk(metrics)
         
         # Detect Phase 1 indicators
+        if timer is not None:
+            t_indicators = timer.clock()
         indicators = self.detect_phase1_indicators(metrics)
         
         # Analyze trends
+        if timer is not None:
+            t_trend = timer.clock()
         trends = self.analyze_trend()
         
         # Determine alert level
+        if timer is not None:
+            t_classify = timer.clock()
         active_indicators = sum(indicators.values())
-        
-        if cascade_risk > 0.5 or active_indicators >= 3:
-            alert_level = "CRITICAL"
-            message = "CSFC Phase 1 cascade initiation detected!"
-        elif cascade_risk > 0.3 or active_indicators >= 2:
-            alert_level = "WARNING"  
-            message = "Phase 1 fracture indicators present"
-        elif cascade_risk > 0.15 or active_indicators >= 1:
-            alert_level = "WATCH"
-            message = "Early degradation signals detected"
-        else:
-            alert_level = "STABLE"
-            message = "System within normal parameters"
+        alert_level = self.classify_alert(cascade_risk, active_indicators)
+        message = ALERT_MESSAGES[alert_level]
+        if timer is not None:
+            t_done = timer.clock()
         
         result = {
             'timestamp': metrics.timestamp,
@@ -182,12 +729,12 @@ class CSFCDetector:
         
         # Track alerts
         if alert_level != "STABLE":
-            self.alert_history.append({
-                'timestamp': metrics.timestamp,
-                'level': alert_level,
-                'risk': cascade_risk,
-                'indicators': active_indicators
-            })
+            self.alert_history.record(metrics.timestamp, alert_level,
+                                      cascade_risk, active_indicators)
+        
+        if timer is not None:
+            timer.record_sample(t_start, t_risk, t_indicators, t_trend,
+                                t_classify, t_done, timer.clock(), alert_level)
         
         return result
 
@@ -261,20 +808,14 @@ def simulate_system_degradation(detector: CSFCDetector, duration: int = 60):
     print(f"\n" + "=" * 50)
     print(f"Monitoring complete. Processed {sample_count} samples.")
     
-    alert_counts = {}
-    for alert in detector.alert_history:
-        level = alert['level']
-        alert_counts[level] = alert_counts.get(level, 0) + 1
-    
-    print(f"Alert summary: {alert_counts}")
+    summary = detector.alert_history.summary()
+    print(f"Alert summary: {summary['alert_counts']}")
     
-    if detector.alert_history:
-        max_risk = max(alert['risk'] for alert in detector.alert_history)
-        print(f"Maximum cascade risk detected: {max_risk:.3f}")
+    if summary['max_risk'] is not None:
+        print(f"Maximum cascade risk detected: {summary['max_risk']:.3f}")
         
-        critical_alerts = [a for a in detector.alert_history if a['level'] == 'CRITICAL']
-        if critical_alerts:
-            print(f"CRITICAL: {len(critical_alerts)} Phase 1 cascade events detected!")
+        if summary['critical_alerts']:
+            print(f"CRITICAL: {summary['critical_alerts']} Phase 1 cascade events detected!")
             print("In production: Phoenix Protocol would initiate automated recovery")
 
 
@@ -0,0 +1,61 @@
+"""Calibration sweep scoring against the detector's own batch path."""
+
+import numpy as np
+import pytest
+
+from csfc_calibration import (THRESHOLD_ATTRIBUTES, WEIGHT_KEYS, CalibrationSweep,
+                              config_alert_codes, detector_configuration, random_configurations)
+from drift_test_stub import ALERT_LEVELS, METRIC_FIELDS, CSFCDetector, alert_codes
+
+
+def _dataset(count=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    metrics = rng.uniform(0.3, 1.0, size=(len(METRIC_FIELDS), count))
+    labels = rng.random(count) < 0.3
+    return metrics, labels
+
+
+def test_alert_codes_match_classify_alert():
+    detector = CSFCDetector()
+    risk = np.linspace(0.0, 1.0, 41)
+    for indicators in range(len(METRIC_FIELDS) + 1):
+        codes = alert_codes(risk, indicators)
+        expected = [detector.classify_alert(float(r), indicators) for r in risk]
+        assert [ALERT_LEVELS[c] for c in codes] == expected
+
+
+def test_sweep_matches_process_batch():
+    metrics, labels = _dataset()
+    thresholds, weights = random_configurations(5, seed=1)
+    results = CalibrationSweep(metrics, labels, block_size=2, workers=1).run(thresholds, weights)
+
+    for row in range(len(thresholds)):
+        detector = CSFCDetector()
+        for name, value in zip(THRESHOLD_ATTRIBUTES, thresholds[row]):
+            setattr(detector, name, value)
+        detector.weights = dict(zip(WEIGHT_KEYS, weights[row]))
+        assert np.allclose(detector_configuration(detector), (thresholds[row], weights[row]))
+        predicted = detector.process_batch(*metrics, np.zeros(labels.size))['alert_code'] >= 2
+        assert results['true_positives'][row] == np.sum(predicted & labels)
+        assert results['false_positives'][row] == np.sum(predicted & ~labels)
+        assert results['false_negatives'][row] == np.sum(~predicted & labels)
+
+
+def test_empty_grid_rejected():
+    metrics, labels = _dataset(10)
+    sweep = CalibrationSweep(metrics, labels, workers=1)
+    with pytest.raises(ValueError):
+        sweep.run(np.empty((0, 5)), np.empty((0, 5)))
+    with pytest.raises(ValueError):
+        random_configurations(0)
+
+
+def test_default_config_codes_match_process_batch_exactly():
+    # Two-decimal metrics put many risks on the 0.15/0.3/0.5 boundaries,
+    # where a different summation order flips codes by one ULP
+    rng = np.random.default_rng(4)
+    metrics = np.round(rng.uniform(0.3, 1.0, size=(len(METRIC_FIELDS), 200_000)), 2)
+    thresholds, weights = random_configurations(8, seed=5)
+    codes = config_alert_codes(metrics, thresholds, weights)
+    expected = CSFCDetector().process_batch(*metrics, np.zeros(metrics.shape[1]))['alert_code']
+    assert np.array_equal(codes[0], expected)
@@ -0,0 +1,97 @@
+"""CSFCIngestService validation, worker resilience and alert ordering."""
+
+import asyncio
+import json
+
+import numpy as np
+
+from csfc_ingest import RECORD_FIELDS, CSFCIngestService
+from drift_test_stub import AlertStore, SystemMetrics
+
+
+def _record(timestamp, value=0.5):
+    return dict(zip(RECORD_FIELDS, (value, value, value, value, value, timestamp)))
+
+
+async def _send_lines(port, lines):
+    _, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write("".join(line + "\n" for line in lines).encode())
+    await writer.drain()
+    writer.close()
+    await writer.wait_closed()
+
+
+def test_malformed_socket_records_are_skipped():
+    async def scenario():
+        service = CSFCIngestService(batch_size=4)
+        await service.start()
+        server = await service.serve_tcp(port=0)
+        port = server.sockets[0].getsockname()[1]
+        bad_type = dict(_record(2.0), identity_coherence="x")
+        await _send_lines(port, [
+            json.dumps(_record(1.0)),
+            json.dumps(bad_type),
+            "1,2",
+            json.dumps([1, 2, 3]),
+            "{not json",
+            json.dumps({"identity_coherence": 0.5}),
+            json.dumps(_record(3.0)),
+        ])
+        for _ in range(100):
+            if service.received + service.rejected == 7:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.wait_for(service.stop(), timeout=5)
+        return service.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats['received'] == 2
+    assert stats['rejected'] == 5
+    assert stats['processed'] == 2
+    assert stats['failed_batches'] == 0
+
+
+def test_failing_batch_does_not_kill_worker():
+    async def scenario():
+        service = CSFCIngestService(batch_size=1)
+        await service.start()
+        await service.submit(SystemMetrics("x", 0.5, 0.5, 0.5, 0.5, 0.0))
+        await service.submit(SystemMetrics(0.5, 0.5, 0.5, 0.5, 0.5, 1.0))
+        await asyncio.wait_for(service.stop(), timeout=5)
+        return service.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats['failed_batches'] == 1
+    assert stats['processed'] == 1
+
+
+def test_interleaved_producers_keep_between_correct():
+    async def producer(service, timestamps):
+        for timestamp in timestamps:
+            await service.submit(SystemMetrics(0.5, 0.5, 0.5, 0.5, 0.5, float(timestamp)))
+            await asyncio.sleep(0)
+
+    async def scenario():
+        service = CSFCIngestService(batch_size=16)
+        await service.start()
+        rng = np.random.default_rng(0)
+        await asyncio.gather(*(producer(service, rng.permutation(200)) for _ in range(4)))
+        await asyncio.wait_for(service.stop(), timeout=5)
+        return service.detector.alert_history
+
+    store = asyncio.run(scenario())
+    timestamps = store.alerts()['timestamp']
+    assert len(store) == 800
+    selected = store.between(50.0, 120.0)['timestamp']
+    assert sorted(selected.tolist()) == sorted(t for t in timestamps.tolist() if 50 <= t <= 120)
+
+
+def test_alert_store_between_recovers_order_after_eviction():
+    store = AlertStore(capacity=4)
+    for timestamp in (1.0, 5.0, 3.0):
+        store.record(timestamp, "WATCH", 0.2, 1)
+    assert sorted(store.between(2.0, 6.0)['timestamp'].tolist()) == [3.0, 5.0]
+    for timestamp in (6.0, 7.0, 8.0, 9.0):
+        store.record(timestamp, "WATCH", 0.2, 1)
+    assert store.between(7.0, 8.0)['timestamp'].tolist() == [7.0, 8.0]
+    assert store._last_inversion <= store._seq - len(store)
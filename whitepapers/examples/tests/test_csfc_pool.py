@@ -0,0 +1,30 @@
+"""CSFCDetectorPool against one CSFCDetector per instance."""
+
+import numpy as np
+
+from csfc_pool import CSFCDetectorPool
+from drift_test_stub import ALERT_LEVELS, CSFCDetector, SystemMetrics
+
+
+def test_pool_matches_single_detectors():
+    instances, ticks = 20, 12
+    rng = np.random.default_rng(3)
+    pool = CSFCDetectorPool(instances)
+    detectors = [CSFCDetector() for _ in range(instances)]
+    ids = np.arange(instances)
+
+    for tick in range(ticks):
+        # Mix of healthy (STABLE) and degraded samples
+        values = rng.uniform(0.55, 1.0, size=(5, instances))
+        values[:, ::3] = 0.99
+        pool.process_tick(ids, *values, timestamps=np.full(instances, float(tick)))
+        for i, detector in enumerate(detectors):
+            result = detector.process_sample(SystemMetrics(*values[:, i], float(tick)))
+            assert ALERT_LEVELS[pool.alert_code[i]] == result['alert_level']
+
+    slopes = pool.trend_slopes()
+    for i, detector in enumerate(detectors):
+        summary = detector.alert_history.summary()
+        assert pool.max_risk[i] == (summary['max_risk'] or 0.0)
+        trend = detector.analyze_trend()
+        assert np.isclose(slopes['identity_slope'][i], trend['identity_slope'])
@@ -0,0 +1,39 @@
+"""Telemetry file parsing and replay."""
+
+import json
+
+import numpy as np
+import pytest
+
+from csfc_replay import (COLUMNS, TelemetryReplay, generate_degradation_telemetry,
+                         iter_telemetry_chunks, write_telemetry)
+
+
+def test_csv_missing_fields_reported_up_front(tmp_path):
+    path = tmp_path / "telemetry.csv"
+    path.write_text("identity_coherence,timestamp\n0.9,0.0\n")
+    with pytest.raises(ValueError, match="missing fields: symbolic_alignment"):
+        next(iter_telemetry_chunks(str(path)))
+
+
+@pytest.mark.parametrize("bad, kind", [("[1, 2]", "list"), ("3", "int")])
+def test_ndjson_non_object_names_line(tmp_path, bad, kind):
+    record = json.dumps(dict(zip(COLUMNS, [0.9] * len(COLUMNS))))
+    path = tmp_path / "telemetry.ndjson"
+    path.write_text(f"{record}\n\n{bad}\n{record}\n")
+    with pytest.raises(ValueError, match=f"Line 3: expected a JSON object, got {kind}"):
+        list(iter_telemetry_chunks(str(path)))
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".ndjson"])
+def test_replay_round_trip(tmp_path, suffix):
+    columns = generate_degradation_telemetry(500, seed=2)
+    path = str(tmp_path / f"telemetry{suffix}")
+    write_telemetry(path, columns)
+    chunks = list(iter_telemetry_chunks(path, chunk_size=64))
+    assert np.array_equal(np.hstack(chunks), columns)
+
+    result = TelemetryReplay(chunk_size=64).replay(path)
+    assert result['samples'] == 500
+    assert result['virtual_start'] == columns[5, 0]
+    assert result['virtual_end'] == columns[5, -1]
@@ -0,0 +1,33 @@
+"""CSFCDetector batch scoring against the per-sample path."""
+
+import numpy as np
+import pytest
+
+from drift_test_stub import ALERT_LEVELS, CSFCDetector, SystemMetrics
+
+
+def _columns(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [rng.uniform(0.3, 1.0, count) for _ in range(5)] + [np.arange(count, dtype=float)]
+
+
+def test_process_batch_matches_process_sample():
+    columns = _columns(500)
+    scores = CSFCDetector().process_batch(*columns)
+    detector = CSFCDetector()
+    for row in range(500):
+        result = detector.process_sample(SystemMetrics(*(float(c[row]) for c in columns)))
+        assert scores['cascade_risk'][row] == result['cascade_risk']
+        assert ALERT_LEVELS[scores['alert_code'][row]] == result['alert_level']
+        assert scores['active_indicators'][row] == result['active_indicators']
+
+
+@pytest.mark.parametrize("wrap", [float, np.float64, lambda v: np.array(v)])
+def test_process_batch_accepts_scalars(wrap):
+    values = (0.6, 0.7, 0.8, 0.95, 0.9, 12.0)
+    scores = CSFCDetector().process_batch(*(wrap(v) for v in values))
+    expected = CSFCDetector().process_sample(SystemMetrics(*values))
+    assert scores['cascade_risk'].shape == (1,)
+    assert scores['timestamp'].tolist() == [12.0]
+    assert scores['cascade_risk'][0] == expected['cascade_risk']
+    assert ALERT_LEVELS[scores['alert_code'][0]] == expected['alert_level']
@@ -0,0 +1,56 @@
+"""MetricHistoryStore persistence and trend resume."""
+
+import numpy as np
+import pytest
+
+from drift_test_stub import CSFCDetector, MetricHistoryStore, SystemMetrics
+
+
+def _samples(count, seed=0):
+    rng = np.random.default_rng(seed)
+    for i in range(count):
+        yield SystemMetrics(*rng.uniform(0.4, 1.0, 5), float(i))
+
+
+def test_restored_history_resumes_trend(tmp_path):
+    path = str(tmp_path / "history.bin")
+    samples = list(_samples(40))
+
+    live = CSFCDetector(history=MetricHistoryStore(64, path))
+    for metrics in samples[:30]:
+        live.process_sample(metrics)
+    live.history.flush()
+
+    restored = CSFCDetector(history=MetricHistoryStore(64, path))
+    assert len(restored.history) == 30
+    assert restored.analyze_trend() == live.analyze_trend()
+
+    for metrics in samples[30:]:
+        assert restored.process_sample(metrics)['trends'] == live.process_sample(metrics)['trends']
+
+
+def test_store_values_round_trip_exactly():
+    store = MetricHistoryStore(8)
+    samples = list(_samples(5))
+    for metrics in samples:
+        store.append(metrics)
+    assert store.latest(5) == samples
+    detector = CSFCDetector(history=store)
+    recomputed = detector.analyze_trend(lookback_samples=4)
+    streaming = CSFCDetector(lookback_samples=4)
+    for metrics in samples:
+        streaming.process_sample(metrics)
+    assert recomputed['identity_slope'] == pytest.approx(
+        streaming.analyze_trend()['identity_slope'], abs=1e-12)
+
+
+def test_rejects_mismatched_store(tmp_path):
+    path = str(tmp_path / "history.bin")
+    MetricHistoryStore(16, path)
+    with pytest.raises(ValueError):
+        MetricHistoryStore(32, path)
+
+
+def test_detector_rejects_history_shorter_than_lookback():
+    with pytest.raises(ValueError, match="lookback_samples"):
+        CSFCDetector(lookback_samples=8, history=MetricHistoryStore(4))